@@ -1,7 +1,19 @@
 # langgraph_agents/admin.py
+import json
+
 from django.contrib import admin
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.html import format_html
+
 from .models import TravelPlanningSession, AgentExecutionLog
 
+
+def _json_block(value):
+    """Pretty-printed JSON payload for a read-only admin field"""
+    if value is None:
+        return '-'
+    return format_html('<pre>{}</pre>', json.dumps(value, cls=DjangoJSONEncoder, indent=2))
+
 @admin.register(TravelPlanningSession)
 class TravelPlanningSessionAdmin(admin.ModelAdmin):
     list_display = [
@@ -20,5 +32,15 @@ class AgentExecutionLogAdmin(admin.ModelAdmin):
     ]
     list_filter = ['agent_type', 'status', 'started_at']
     search_fields = ['session__session_id', 'agent_type']
-    readonly_fields = ['started_at', 'completed_at']
-    ordering = ['-started_at']
\ No newline at end of file
+    # input_data/output_data are compressed BinaryFields, which the admin
+    # won't render as form fields - show the decoded JSON instead
+    readonly_fields = ['input_payload', 'output_payload', 'started_at', 'completed_at']
+    ordering = ['-started_at']
+
+    @admin.display(description='Input data')
+    def input_payload(self, obj):
+        return _json_block(obj.input_data)
+
+    @admin.display(description='Output data')
+    def output_payload(self, obj):
+        return _json_block(obj.output_data)
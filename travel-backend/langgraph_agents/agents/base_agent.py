@@ -1,9 +1,10 @@
 # langgraph_agents/agents/base_agent.py
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Dict, Any, Optional
 import time
 
-from ..utils import AgentLoggerMixin
+from ..utils import AgentLoggerMixin, Bulkhead
 from ..exceptions import AgentExecutionError
 
 
@@ -12,6 +13,10 @@ class BaseAgent(AgentLoggerMixin, ABC):
     Base class for all LangGraph agents with integrated logging and error handling
     """
     
+    # Process-wide cap on concurrent executions of this agent type, so a
+    # burst against one upstream API can't starve the others (None: no cap)
+    bulkhead: Optional[Bulkhead] = None
+    
     def __init__(self, session_id: str = None, agent_type: str = None):
         super().__init__()
         self.session_id = session_id
@@ -41,7 +46,8 @@ class BaseAgent(AgentLoggerMixin, ABC):
             validated_input = self._validate_input(input_data)
             
             # Execute agent logic
-            result = await self._execute_logic(validated_input)
+            async with self.bulkhead or nullcontext():
+                result = await self._execute_logic(validated_input)
             
             # Calculate execution time
             execution_time_ms = int((time.time() - start_time) * 1000)
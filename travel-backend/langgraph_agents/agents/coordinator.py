@@ -878,9 +878,9 @@ class CoordinatorAgent(BaseAgent):
             # Step 1: Fetch comprehensive activity pool
             step_start = time.time()
             logger.info("📍 Step 1: Fetching activity pool...")
-            from ..services.activity_fetcher import ActivityPoolFetcher
+            from ..services.activity_fetcher import get_activity_fetcher
             
-            activity_fetcher = ActivityPoolFetcher()
+            activity_fetcher = get_activity_fetcher()
             activities = await activity_fetcher.fetch_activity_pool(
                 destination=trip_params['destination'],
                 user_preferences=trip_params.get('user_profile', {}),
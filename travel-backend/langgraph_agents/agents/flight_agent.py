@@ -5,6 +5,7 @@ import asyncio
 from datetime import datetime
 import pytz
 from .base_agent import BaseAgent
+from ..utils import Bulkhead
 from flights.views import FlightSearchView
 from rest_framework.test import APIRequestFactory
 import logging
@@ -569,6 +570,8 @@ PHILIPPINES_TZ = pytz.timezone('Asia/Manila')
 class FlightAgent(BaseAgent):
     """LangGraph Flight Search Agent"""
     
+    bulkhead = Bulkhead("FlightAgent", 8)
+    
     def __init__(self, session_id: str):
         super().__init__(session_id, 'flight')
     
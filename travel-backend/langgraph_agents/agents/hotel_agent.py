@@ -4,6 +4,7 @@ import asyncio
 import requests
 from django.conf import settings
 from .base_agent import BaseAgent
+from ..utils import Bulkhead
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,6 +12,8 @@ logger = logging.getLogger(__name__)
 class HotelAgent(BaseAgent):
     """LangGraph Hotel Search Agent"""
     
+    bulkhead = Bulkhead("HotelAgent", 8)
+    
     def __init__(self, session_id: str):
         super().__init__(session_id, 'hotel')
     
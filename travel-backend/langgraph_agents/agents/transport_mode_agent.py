@@ -12,7 +12,8 @@ from ..utils.transport_convenience import classify_transport_convenience, should
 from ..data.regional_transport_context import (
     is_regional_transport_practical,
     check_geographic_boundaries,
-    find_regional_context
+    find_regional_context,
+    plain_copy
 )
 from ..utils.geocoding_service import calculate_route_estimates
 
@@ -233,7 +234,7 @@ class TransportModeAgent(BaseAgent):
                 "calculated": is_calculated,
                 "confidence": "medium" if is_calculated else "high",
             },
-            "regional_context": regional_context if regional_context.get("same_region") else None,
+            "regional_context": plain_copy(regional_context) if regional_context.get("same_region") else None,
             "success": True,
         }
     
@@ -291,7 +292,7 @@ class TransportModeAgent(BaseAgent):
             },
             "regional_context": {
                 "region": regional_context.get("region"),
-                "characteristics": regional_context.get("characteristics"),
+                "characteristics": plain_copy(regional_context.get("characteristics")),
                 "hub": regional_context.get("hub"),
             } if regional_context.get("same_region") else None,
             "alternative_mode": None,
@@ -352,7 +353,7 @@ class TransportModeAgent(BaseAgent):
                 "calculated": is_calculated,
                 "confidence": "medium" if is_calculated else "high",
             },
-            "regional_context": regional_context if regional_context.get("same_region") else None,
+            "regional_context": plain_copy(regional_context) if regional_context.get("same_region") else None,
             "warning": convenience.get("warning"),
             "alternative_mode": "flight",
             "success": True,
@@ -365,7 +366,7 @@ class TransportModeAgent(BaseAgent):
             "search_flights": True,
             "has_airport": True,
             "recommendation": f"{boundary_check['recommendation']}. Flight is the most practical option.",
-            "boundary_info": boundary_check,
+            "boundary_info": plain_copy(boundary_check),
             "success": True,
         }
     
@@ -380,7 +381,7 @@ class TransportModeAgent(BaseAgent):
             "search_flights": include_flights,
             "has_airport": include_flights,
             "recommendation": f"{regional_context['recommendation']}. Check with local operators for schedules.",
-            "regional_context": regional_context,
+            "regional_context": plain_copy(regional_context),
             "alternative_note": "Ground transport may be available - check locally for schedules",
             "success": True,
         }
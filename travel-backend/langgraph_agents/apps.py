@@ -1,4 +1,6 @@
 # langgraph_agents/apps.py
+from functools import cached_property
+
 from django.apps import AppConfig
 
 
@@ -12,4 +14,16 @@ class LanggraphAgentsConfig(AppConfig):
         Import checks when Django starts
         This registers system checks for API key validation
         """
-        from . import checks  # noqa: F401
\ No newline at end of file
+        from . import checks  # noqa: F401
+    
+    @cached_property
+    def activity_fetcher(self):
+        """
+        Shared ActivityPoolFetcher for the whole process
+        
+        Created on first use rather than in ready(), so a missing
+        GOOGLE_PLACES_API_KEY only fails the GA-first workflow instead
+        of app startup.
+        """
+        from .services.activity_fetcher import ActivityPoolFetcher
+        return ActivityPoolFetcher()
@@ -146,3 +146,49 @@ def check_frontend_backend_sync(app_configs, **kwargs):
         )
     
     return warnings
+
+
+@register(Tags.database)
+def check_model_indexes(app_configs, databases=None, **kwargs):
+    """
+    Check that every index in the LangGraph models' Meta.indexes exists in the database
+    Database checks run with `python manage.py check --database default` and on migrate
+    """
+    from django.apps import apps
+    from django.db import connections
+    
+    warnings = []
+    app_config = apps.get_app_config('langgraph_agents')
+    if app_configs is not None and app_config not in app_configs:
+        return warnings
+    
+    for alias in databases or ():
+        connection = connections[alias]
+        with connection.cursor() as cursor:
+            tables = set(connection.introspection.table_names(cursor))
+            
+            for model in app_config.get_models():
+                declared = {index.name for index in model._meta.indexes}
+                table = model._meta.db_table
+                if not declared or table not in tables:
+                    # Nothing to compare until the table is migrated
+                    continue
+                
+                constraints = connection.introspection.get_constraints(cursor, table)
+                existing = {name for name, info in constraints.items() if info['index']}
+                missing = declared - existing
+                
+                if missing:
+                    warnings.append(
+                        Warning(
+                            f'{model.__name__} indexes missing from database "{alias}"',
+                            hint=(
+                                f'Missing: {sorted(missing)}\n'
+                                f'Run: python manage.py makemigrations langgraph_agents && python manage.py migrate'
+                            ),
+                            obj=model,
+                            id='travelrover.W004',
+                        )
+                    )
+    
+    return warnings
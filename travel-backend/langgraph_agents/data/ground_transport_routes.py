@@ -4,7 +4,9 @@ Python port of the JavaScript groundTransportRoutes.js
 Comprehensive data for bus, van, and ferry routes across the Philippines
 """
 
-from typing import Dict, List, Optional, Any
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
 
 # Ground transport route data
 # Key format: "DepartureCity-DestinationCity" (bidirectional)
@@ -1596,6 +1598,110 @@ GROUND_TRANSPORT_ROUTES = {
 }
 
 
+@dataclass(slots=True, frozen=True)
+class Route:
+    """
+    Fixed-schema ground transport route record
+    
+    Built once at import from GROUND_TRANSPORT_ROUTES so lookups read
+    slot attributes instead of hashing into per-route dicts.
+    """
+    distance: int
+    travel_time: float
+    modes: Tuple[str, ...]
+    operators: Tuple[str, ...]
+    cost_min: int
+    cost_max: int
+    frequency: str
+    has_ferry: bool = False
+    has_overnight_option: bool = False
+    scenic: bool = False
+    notes: str = ""
+    impractical: bool = False
+    practical: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict view matching the original GROUND_TRANSPORT_ROUTES entry shape"""
+        return {
+            "distance": self.distance,
+            "travel_time": self.travel_time,
+            "modes": list(self.modes),
+            "operators": list(self.operators),
+            "cost": {"min": self.cost_min, "max": self.cost_max},
+            "frequency": self.frequency,
+            "has_ferry": self.has_ferry,
+            "has_overnight_option": self.has_overnight_option,
+            "scenic": self.scenic,
+            "notes": self.notes,
+            "impractical": self.impractical,
+            "practical": self.practical,
+        }
+
+
+# Many routes share the same modes/operators (e.g. ("ferry",)); identical
+# tuples are canonicalized so the whole table shares one object per value
+_tuple_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _canon(values: List[str]) -> Tuple[str, ...]:
+    """Return the shared interned tuple for a list of strings"""
+    key = tuple(sys.intern(v) for v in values)
+    return _tuple_cache.setdefault(key, key)
+
+
+def _mk(cost: Dict[str, int], modes: List[str], operators: List[str], **fields) -> Route:
+    """Convert a raw route dict literal into a Route (splits the cost range)"""
+    return Route(
+        modes=_canon(modes),
+        operators=_canon(operators),
+        cost_min=cost["min"],
+        cost_max=cost["max"],
+        **fields,
+    )
+
+
+ROUTES: Dict[str, Route] = {
+    route_key: _mk(**route_data) for route_key, route_data in GROUND_TRANSPORT_ROUTES.items()
+}
+
+
+def _normalize_city(city: str) -> str:
+    """Normalize a city name for route matching"""
+    # ✅ FIX: Extract city name before comma (handles "Pagadian City, Zamboanga del Sur")
+    city_part = city.split(',')[0].strip() if ',' in city else city.strip()
+    normalized = city_part.lower().replace("  ", " ")
+    # Handle common city name variations
+    normalized = normalized.replace(" city", "").replace(" municipality", "")
+    return normalized
+
+
+def _build_route_index() -> Dict[frozenset, Tuple[str, Route]]:
+    """
+    Index routes by unordered pair of normalized endpoints
+    
+    A frozenset key makes "A-B" and "B-A" the same entry, so lookups need a
+    single probe. The first route listed for a pair wins, matching the old
+    linear scan order.
+    """
+    index: Dict[frozenset, Tuple[str, Route]] = {}
+    for route_key, route in ROUTES.items():
+        start, end = route_key.split("-")
+        index.setdefault(
+            frozenset((_normalize_city(start), _normalize_city(end))),
+            (route_key, route),
+        )
+    return index
+
+
+_ROUTE_INDEX = _build_route_index()
+
+# Fast-negative filter for has_ground_route: truncated hashes of every
+# indexed pair. For ~100 routes a frozenset of ints is already compact;
+# swap in a real Bloom bitset if the table grows into the thousands.
+_PAIR_HASH_MASK = 0xFFFFF
+_PAIR_HASHES = frozenset(hash(pair) & _PAIR_HASH_MASK for pair in _ROUTE_INDEX)
+
+
 def find_ground_route(city1: str, city2: str) -> Optional[Dict[str, Any]]:
     """
     Find ground transport route between two cities
@@ -1610,33 +1716,23 @@ def find_ground_route(city1: str, city2: str) -> Optional[Dict[str, Any]]:
     if not city1 or not city2:
         return None
     
-    # Normalize city names
-    def normalize_city(city):
-        # ✅ FIX: Extract city name before comma (handles "Pagadian City, Zamboanga del Sur")
-        city_part = city.split(',')[0].strip() if ',' in city else city.strip()
-        normalized = city_part.lower().replace("  ", " ")
-        # Handle common city name variations
-        normalized = normalized.replace(" city", "").replace(" municipality", "")
-        return normalized
+    norm_city1 = _normalize_city(city1)
+    norm_city2 = _normalize_city(city2)
     
-    norm_city1 = normalize_city(city1)
-    norm_city2 = normalize_city(city2)
+    # frozenset collapses a self-loop to one element, never a route
+    if norm_city1 == norm_city2:
+        return None
     
-    # Try both directions
-    for route_key, route_data in GROUND_TRANSPORT_ROUTES.items():
-        start, end = route_key.split("-")
-        start = normalize_city(start)
-        end = normalize_city(end)
-        
-        if (norm_city1 == start and norm_city2 == end) or \
-           (norm_city1 == end and norm_city2 == start):
-            return {
-                **route_data,
-                "route_key": route_key,
-                "bidirectional": True,
-            }
-    
-    return None
+    entry = _ROUTE_INDEX.get(frozenset((norm_city1, norm_city2)))
+    if entry is None:
+        return None
+    
+    route_key, route = entry
+    return {
+        **route.to_dict(),
+        "route_key": route_key,
+        "bidirectional": True,
+    }
 
 
 def has_ground_route(city1: str, city2: str) -> bool:
@@ -1650,7 +1746,13 @@ def has_ground_route(city1: str, city2: str) -> bool:
     Returns:
         True if route exists
     """
-    return find_ground_route(city1, city2) is not None
+    if not city1 or not city2:
+        return False
+    
+    pair = frozenset((_normalize_city(city1), _normalize_city(city2)))
+    if hash(pair) & _PAIR_HASH_MASK not in _PAIR_HASHES:
+        return False
+    return pair in _ROUTE_INDEX
 
 
 def get_routes_from_city(city: str) -> List[Dict[str, Any]]:
@@ -1666,25 +1768,17 @@ def get_routes_from_city(city: str) -> List[Dict[str, Any]]:
     if not city:
         return []
     
-    def normalize_city(c):
-        # ✅ FIX: Extract city name before comma
-        city_part = c.split(',')[0].strip() if ',' in c else c.strip()
-        normalized = city_part.lower().replace("  ", " ")
-        # Handle common city name variations
-        normalized = normalized.replace(" city", "").replace(" municipality", "")
-        return normalized
-    
-    norm_city = normalize_city(city)
+    norm_city = _normalize_city(city)
     routes = []
     
-    for route_key, route_data in GROUND_TRANSPORT_ROUTES.items():
+    for route_key, route in ROUTES.items():
         start, end = route_key.split("-")
-        start_norm = normalize_city(start)
-        end_norm = normalize_city(end)
+        start_norm = _normalize_city(start)
+        end_norm = _normalize_city(end)
         
         if norm_city == start_norm:
-            routes.append({"destination": end, **route_data, "route_key": route_key})
+            routes.append({"destination": end, **route.to_dict(), "route_key": route_key})
         elif norm_city == end_norm:
-            routes.append({"destination": start, **route_data, "route_key": route_key})
+            routes.append({"destination": start, **route.to_dict(), "route_key": route_key})
     
     return routes
@@ -4,7 +4,11 @@ Python port of regionalTransportContext.js
 Provides intelligence about regional transport corridors and connectivity
 """
 
-from typing import Dict, List, Optional, Any
+import re
+import unicodedata
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Mapping
 
 
 # Regional transport corridor definitions
@@ -236,60 +240,285 @@ REGIONAL_TRANSPORT_CONTEXT = {
 }
 
 
-def find_regional_context(city_name: str) -> Optional[Dict[str, Any]]:
+_TUPLE_FIELDS = ("cities", "recommended_routes", "avoid_routes")
+
+
+def _freeze_region(region_key: str, region_data: Dict[str, Any]) -> Mapping[str, Any]:
+    """Read-only region view with "region_key" merged in and lists as tuples"""
+    frozen = {"region_key": region_key, **region_data}
+    for field in _TUPLE_FIELDS:
+        if field in frozen:
+            frozen[field] = tuple(frozen[field])
+    frozen["characteristics"] = MappingProxyType(dict(frozen["characteristics"]))
+    return MappingProxyType(frozen)
+
+
+def plain_copy(value: Any) -> Any:
+    """
+    Plain dict/list copy of a lookup result
+    
+    The lookups return shared read-only views; convert one before putting
+    it in a JSON or DRF response, or before modifying it.
+    """
+    if isinstance(value, Mapping):
+        return {key: plain_copy(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [plain_copy(item) for item in value]
+    return value
+
+
+# Read-only snapshot of the table, so the lookups below can cache region
+# views and pair results and hand them out without copying.
+# REGIONAL_TRANSPORT_CONTEXT itself stays a plain dict.
+_REGIONS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    region_key: _freeze_region(region_key, region_data)
+    for region_key, region_data in REGIONAL_TRANSPORT_CONTEXT.items()
+})
+
+
+# Major island groups by region key
+_LUZON = frozenset({"METRO_MANILA", "LUZON_SOUTH", "LUZON_NORTH", "LUZON_CENTRAL"})
+_VISAYAS = frozenset({"VISAYAS_CENTRAL", "VISAYAS_WESTERN", "VISAYAS_EASTERN"})
+_MINDANAO = frozenset({"MINDANAO_WEST", "MINDANAO_SOUTH", "MINDANAO_NORTH"})
+
+_ISLAND_OF: Dict[str, str] = {
+    **{region_key: "LUZON" for region_key in _LUZON},
+    **{region_key: "VISAYAS" for region_key in _VISAYAS},
+    **{region_key: "MINDANAO" for region_key in _MINDANAO},
+}
+
+# Boundary-crossing results keyed by the unordered pair of island groups
+_BOUNDARY_RESULTS: Dict[frozenset, Mapping[str, Any]] = {
+    frozenset({"LUZON", "VISAYAS"}): MappingProxyType({
+        "crosses_boundary": True,
+        "boundary_type": "Luzon-Visayas",
+        "recommendation": "Flight or long ferry required",
+    }),
+    frozenset({"LUZON", "MINDANAO"}): MappingProxyType({
+        "crosses_boundary": True,
+        "boundary_type": "Luzon-Mindanao",
+        "recommendation": "Flight required",
+    }),
+    frozenset({"VISAYAS", "MINDANAO"}): MappingProxyType({
+        "crosses_boundary": True,
+        "boundary_type": "Visayas-Mindanao",
+        "recommendation": "Flight or ferry required",
+    }),
+}
+
+_NO_BOUNDARY_DATA = MappingProxyType({"crosses_boundary": False, "boundary_type": None})
+
+_SAME_ISLAND = MappingProxyType({
+    "crosses_boundary": False,
+    "boundary_type": "same-island-group",
+    "recommendation": "Ground transport may be available",
+})
+
+
+_STRIP_RE = re.compile(r"[\u2018\u2019'`.,]")
+_DASH_RE = re.compile(r"[\u2010-\u2015]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_city(city: str) -> str:
+    """
+    Normalize a city name for region lookup
+    
+    Folds unicode forms (NFKD, diacritics dropped), typographic dashes and
+    apostrophes, and runs of whitespace so "Cañlaon" / "Ma’asin" match
+    their plain ASCII spellings.
+    """
+    city = unicodedata.normalize("NFKD", city)
+    city = _DASH_RE.sub("-", _STRIP_RE.sub("", city))
+    city = city.encode("ascii", "ignore").decode("ascii")
+    return _SPACE_RE.sub(" ", city).strip().lower()
+
+
+def _build_city_index() -> Dict[str, str]:
+    """
+    Map normalized city name -> region key, built once at import
+    
+    A city listed in several corridors (e.g. Ormoc) maps to the first one,
+    matching the previous linear scan order.
+    """
+    index: Dict[str, str] = {}
+    for region_key, region_data in REGIONAL_TRANSPORT_CONTEXT.items():
+        for city in region_data["cities"]:
+            index.setdefault(_normalize_city(city), region_key)
+    return index
+
+
+_CITY_INDEX = _build_city_index()
+
+
+class _CityTrie:
+    """
+    Character trie over normalized city names
+    
+    Supports longest-prefix matching ("puerto princesa city" -> "puerto
+    princesa") and prefix enumeration for autocomplete in O(len(query)).
+    """
+    
+    _END = "$"
+    
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+    
+    def insert(self, key: str, value: Any) -> None:
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(self._END, value)
+    
+    def longest_prefix(self, query: str) -> Optional[Any]:
+        """Value of the longest stored key that prefixes query at a word boundary"""
+        node = self._root
+        match = None
+        for i, char in enumerate(query):
+            node = node.get(char)
+            if node is None:
+                break
+            if self._END in node and (i + 1 == len(query) or not query[i + 1].isalnum()):
+                match = node[self._END]
+        return match
+    
+    def values(self, prefix: str) -> List[Any]:
+        """Values of every stored key starting with prefix"""
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        
+        found = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char == self._END:
+                    found.append(child)
+                else:
+                    stack.append(child)
+        return found
+
+
+def _build_city_trie() -> _CityTrie:
+    """Trie of normalized city name -> (region key, display name)"""
+    trie = _CityTrie()
+    for region_key, region_data in REGIONAL_TRANSPORT_CONTEXT.items():
+        for city in region_data["cities"]:
+            trie.insert(_normalize_city(city), (region_key, city))
+    return trie
+
+
+_CITY_TRIE = _build_city_trie()
+
+# Fast negative for unknown cities: an exact or prefix match requires the
+# query's leading word to be the leading word of some known city. For ~100
+# cities an exact frozenset is as small as a Bloom filter with no false hits.
+_LEADING_WORD_RE = re.compile(r"[a-z0-9]+")
+_CITY_LEADING_WORDS = frozenset(
+    _LEADING_WORD_RE.match(city).group() for city in _CITY_INDEX
+)
+
+# Lowercased avoid/recommended route keys per region for O(1) membership
+_AVOID_LC: Dict[str, frozenset] = {
+    region_key: frozenset(route.lower() for route in region_data.get("avoid_routes", []))
+    for region_key, region_data in REGIONAL_TRANSPORT_CONTEXT.items()
+}
+_RECOMMEND_LC: Dict[str, frozenset] = {
+    region_key: frozenset(route.lower() for route in region_data.get("recommended_routes", []))
+    for region_key, region_data in REGIONAL_TRANSPORT_CONTEXT.items()
+}
+
+
+def find_regional_context(city_name: str, copy: bool = False) -> Optional[Mapping[str, Any]]:
     """
     Find which regional corridor a city belongs to
     
     Args:
         city_name: City to lookup
+        copy: Return a plain, mutable dict instead of the shared view
     
     Returns:
-        Regional context dict or None
+        Read-only regional context mapping (a dict with copy=True) or None
     """
+    region = _find_region(city_name)
+    return plain_copy(region) if copy else region
+
+
+@lru_cache(maxsize=2048)
+def _find_region(city_name: str) -> Optional[Mapping[str, Any]]:
+    """find_regional_context body; returns the shared read-only region view"""
     if not city_name:
         return None
     
-    def normalize_city(city):
-        return city.strip().lower().replace("  ", " ")
+    norm_city = _normalize_city(city_name)
+    leading = _LEADING_WORD_RE.match(norm_city)
+    if leading is None or leading.group() not in _CITY_LEADING_WORDS:
+        return None
     
-    norm_city = normalize_city(city_name)
+    region_key = _CITY_INDEX.get(norm_city)
+    if region_key is None:
+        # Fall back to the longest known city prefixing the query,
+        # e.g. "Cagayan de Oro City" or "Puerto Princesa, Palawan"
+        match = _CITY_TRIE.longest_prefix(norm_city)
+        if match is None:
+            return None
+        region_key = match[0]
     
-    for region_key, region_data in REGIONAL_TRANSPORT_CONTEXT.items():
-        has_city_match = any(
-            normalize_city(city) == norm_city
-            for city in region_data["cities"]
-        )
-        
-        if has_city_match:
-            return {
-                "region_key": region_key,
-                **region_data,
-            }
+    return _REGIONS[region_key]
+
+
+def suggest_cities(prefix: str) -> List[str]:
+    """
+    Autocomplete known corridor cities from a name prefix
+    
+    Args:
+        prefix: Partial city name
     
-    return None
+    Returns:
+        Sorted list of matching city names
+    """
+    if not prefix:
+        return []
+    return sorted({city for _, city in _CITY_TRIE.values(_normalize_city(prefix))})
+
+
+def _pair_part(city: str) -> str:
+    """Normalize one side of a city pair for the pair-result caches"""
+    return _normalize_city(city) if city else ""
 
 
-def is_regional_transport_practical(city1: str, city2: str) -> Dict[str, Any]:
+def is_regional_transport_practical(city1: str, city2: str, copy: bool = False) -> Mapping[str, Any]:
     """
     Check if two cities are in the same regional transport corridor
     
     Args:
         city1: First city
         city2: Second city
+        copy: Return a plain, mutable dict instead of the shared view
     
     Returns:
-        Regional relationship info
+        Read-only regional relationship info (a dict with copy=True)
     """
-    region1 = find_regional_context(city1)
-    region2 = find_regional_context(city2)
+    result = _regional_practical_cached(_pair_part(city1), _pair_part(city2))
+    return plain_copy(result) if copy else result
+
+
+@lru_cache(maxsize=4096)
+def _regional_practical_cached(city1: str, city2: str) -> Mapping[str, Any]:
+    """is_regional_transport_practical body, keyed on normalized city names"""
+    region1 = _find_region(city1)
+    region2 = _find_region(city2)
     
     # If either city not in database
     if not region1 or not region2:
-        return {
+        return MappingProxyType({
             "same_region": False,
             "recommendation": "Inter-regional travel - check specific route distances and times",
             "both_regions_found": bool(region1 and region2),
-        }
+        })
     
     # Same region
     if region1["region_key"] == region2["region_key"]:
@@ -297,17 +526,11 @@ def is_regional_transport_practical(city1: str, city2: str) -> Dict[str, Any]:
         route_key = f"{city1}-{city2}"
         reverse_key = f"{city2}-{city1}"
         
-        avoid_routes = region1.get("avoid_routes", [])
-        is_avoided = any(
-            route.lower() == route_key.lower() or route.lower() == reverse_key.lower()
-            for route in avoid_routes
-        )
+        avoid_routes = _AVOID_LC[region1["region_key"]]
+        is_avoided = route_key in avoid_routes or reverse_key in avoid_routes
         
-        recommended_routes = region1.get("recommended_routes", [])
-        is_recommended = any(
-            route.lower() == route_key.lower() or route.lower() == reverse_key.lower()
-            for route in recommended_routes
-        )
+        recommended_routes = _RECOMMEND_LC[region1["region_key"]]
+        is_recommended = route_key in recommended_routes or reverse_key in recommended_routes
         
         recommendation = (
             f"⚠️ Not recommended within {region1['name']} - consider flying or breaking journey"
@@ -319,7 +542,7 @@ def is_regional_transport_practical(city1: str, city2: str) -> Dict[str, Any]:
             )
         )
         
-        return {
+        return MappingProxyType({
             "same_region": True,
             "region": region1["name"],
             "is_recommended": is_recommended,
@@ -327,75 +550,51 @@ def is_regional_transport_practical(city1: str, city2: str) -> Dict[str, Any]:
             "characteristics": region1["characteristics"],
             "recommendation": recommendation,
             "hub": region1.get("hub"),
-        }
+        })
     
     # Different regions
-    return {
+    return MappingProxyType({
         "same_region": False,
         "region1": region1["name"],
         "region2": region2["name"],
         "recommendation": f"Inter-regional travel from {region1['name']} to {region2['name']} - check specific route or consider flying",
         "hub1": region1.get("hub"),
         "hub2": region2.get("hub"),
-    }
+    })
 
 
-def check_geographic_boundaries(city1: str, city2: str) -> Dict[str, Any]:
+def check_geographic_boundaries(city1: str, city2: str, copy: bool = False) -> Mapping[str, Any]:
     """
     Check if route crosses major geographic boundaries (e.g., inter-island)
     
     Args:
         city1: First city
         city2: Second city
+        copy: Return a plain, mutable dict instead of the shared view
     
     Returns:
-        Boundary crossing info
+        Read-only boundary crossing info (a dict with copy=True)
     """
-    region1 = find_regional_context(city1)
-    region2 = find_regional_context(city2)
+    # Crossing is symmetric, so both directions share one cache slot
+    pair = sorted((_pair_part(city1), _pair_part(city2)))
+    result = _boundaries_cached(*pair)
+    return plain_copy(result) if copy else result
+
+
+@lru_cache(maxsize=4096)
+def _boundaries_cached(city1: str, city2: str) -> Mapping[str, Any]:
+    """check_geographic_boundaries body, keyed on normalized city names"""
+    region1 = _find_region(city1)
+    region2 = _find_region(city2)
     
     if not region1 or not region2:
-        return {"crosses_boundary": False, "boundary_type": None}
-    
-    r1_key = region1["region_key"]
-    r2_key = region2["region_key"]
-    
-    # Define major island groups
-    luzon_regions = ["METRO_MANILA", "LUZON_SOUTH", "LUZON_NORTH", "LUZON_CENTRAL"]
-    visayas_regions = ["VISAYAS_CENTRAL", "VISAYAS_WESTERN", "VISAYAS_EASTERN"]
-    mindanao_regions = ["MINDANAO_WEST", "MINDANAO_SOUTH", "MINDANAO_NORTH"]
-    
-    is_luzon1 = r1_key in luzon_regions
-    is_luzon2 = r2_key in luzon_regions
-    is_visayas1 = r1_key in visayas_regions
-    is_visayas2 = r2_key in visayas_regions
-    is_mindanao1 = r1_key in mindanao_regions
-    is_mindanao2 = r2_key in mindanao_regions
-    
-    # Check for inter-island crossings
-    if (is_luzon1 and is_visayas2) or (is_visayas1 and is_luzon2):
-        return {
-            "crosses_boundary": True,
-            "boundary_type": "Luzon-Visayas",
-            "recommendation": "Flight or long ferry required",
-        }
-    
-    if (is_luzon1 and is_mindanao2) or (is_mindanao1 and is_luzon2):
-        return {
-            "crosses_boundary": True,
-            "boundary_type": "Luzon-Mindanao",
-            "recommendation": "Flight required",
-        }
-    
-    if (is_visayas1 and is_mindanao2) or (is_mindanao1 and is_visayas2):
-        return {
-            "crosses_boundary": True,
-            "boundary_type": "Visayas-Mindanao",
-            "recommendation": "Flight or ferry required",
-        }
-    
-    return {
-        "crosses_boundary": False,
-        "boundary_type": "same-island-group",
-        "recommendation": "Ground transport may be available",
-    }
+        return _NO_BOUNDARY_DATA
+    
+    island1 = _ISLAND_OF.get(region1["region_key"])
+    island2 = _ISLAND_OF.get(region2["region_key"])
+    
+    # Regions outside the three groups (Palawan, Mindoro) never cross
+    if island1 is None or island2 is None or island1 == island2:
+        return _SAME_ISLAND
+    
+    return _BOUNDARY_RESULTS[frozenset((island1, island2))]
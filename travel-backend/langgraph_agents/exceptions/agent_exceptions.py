@@ -5,14 +5,31 @@ Custom exceptions for LangGraph agents
 
 class LangGraphAgentError(Exception):
     """Base exception for all LangGraph agent errors"""
+    # Slots keep raised instances from materializing a per-instance __dict__
+    __slots__ = ('agent_type', 'error_code')
+    
     def __init__(self, message: str, agent_type: str = None, error_code: str = None):
         self.agent_type = agent_type
         self.error_code = error_code
         super().__init__(message)
+    
+    def __reduce__(self):
+        # BaseException only pickles __dict__, so carry slot values explicitly.
+        # args is restored too: subclass constructors rebuild the message.
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get('__slots__', ())
+            if hasattr(self, name)
+        }
+        state['args'] = self.args
+        return self.__class__, self.args, state
 
 
 class AgentExecutionError(LangGraphAgentError):
     """Raised when an agent fails to execute properly"""
+    __slots__ = ('original_error',)
+    
     def __init__(self, message: str, agent_type: str = None, original_error: Exception = None):
         self.original_error = original_error
         super().__init__(message, agent_type, "EXECUTION_ERROR")
@@ -20,6 +37,8 @@ class AgentExecutionError(LangGraphAgentError):
 
 class APIKeyMissingError(LangGraphAgentError):
     """Raised when required API keys are missing"""
+    __slots__ = ()
+    
     def __init__(self, service_name: str, agent_type: str = None):
         message = f"API key missing for {service_name}"
         super().__init__(message, agent_type, "API_KEY_MISSING")
@@ -27,6 +46,8 @@ class APIKeyMissingError(LangGraphAgentError):
 
 class DataValidationError(LangGraphAgentError):
     """Raised when input data validation fails"""
+    __slots__ = ('field_name',)
+    
     def __init__(self, message: str, field_name: str = None, agent_type: str = None):
         self.field_name = field_name
         super().__init__(message, agent_type, "DATA_VALIDATION_ERROR")
@@ -34,6 +55,8 @@ class DataValidationError(LangGraphAgentError):
 
 class ServiceUnavailableError(LangGraphAgentError):
     """Raised when external services are unavailable"""
+    __slots__ = ('service_name', 'status_code')
+    
     def __init__(self, service_name: str, agent_type: str = None, status_code: int = None):
         self.service_name = service_name
         self.status_code = status_code
@@ -45,6 +68,8 @@ class ServiceUnavailableError(LangGraphAgentError):
 
 class RateLimitError(LangGraphAgentError):
     """Raised when API rate limits are exceeded"""
+    __slots__ = ('service_name', 'retry_after')
+    
     def __init__(self, service_name: str, retry_after: int = None, agent_type: str = None):
         self.service_name = service_name
         self.retry_after = retry_after
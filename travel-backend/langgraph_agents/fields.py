@@ -0,0 +1,56 @@
+# langgraph_agents/fields.py
+"""
+Custom model fields for LangGraph agent storage
+"""
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class CompressedJSONField(models.BinaryField):
+    """
+    JSON value stored as zlib-compressed bytes
+
+    For write-heavy, read-rare payloads (full agent inputs/outputs) that are
+    never filtered on in the database. Typically several times smaller than
+    jsonb, which keeps rows small for list queries.
+    """
+
+    description = "JSON stored as zlib-compressed bytes"
+
+    def __init__(self, *args, compress_level=6, **kwargs):
+        self.compress_level = compress_level
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.compress_level != 6:
+            kwargs['compress_level'] = self.compress_level
+        return name, path, args, kwargs
+
+    def _decode(self, value):
+        return json.loads(zlib.decompress(bytes(value)))
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return self._decode(value)
+
+    def to_python(self, value):
+        # bytes come from the database, str from serialized fixtures
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return self._decode(value)
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        payload = json.dumps(value, cls=DjangoJSONEncoder, separators=(',', ':'))
+        return zlib.compress(payload.encode('utf-8'), self.compress_level)
+
+    def value_to_string(self, obj):
+        return json.dumps(self.value_from_object(obj), cls=DjangoJSONEncoder)
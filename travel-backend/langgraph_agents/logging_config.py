@@ -5,8 +5,27 @@ Implements structured logging with different levels and handlers
 """
 import logging
 import json
-from datetime import datetime
-from django.conf import settings
+import time
+from functools import lru_cache
+
+# orjson serializes these small log dicts several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj) -> str:
+    """Serialize a log payload to a JSON string"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+# Structured context fields routed into the LogRecord via `extra`
+_EXTRA_ATTRS = ('user_email', 'session_id', 'agent_type', 'execution_time_ms')
+_EXTRA_KEYS = frozenset(_EXTRA_ATTRS)
 
 
 class StructuredFormatter(logging.Formatter):
@@ -15,9 +34,15 @@ class StructuredFormatter(logging.Formatter):
     Ideal for production log aggregation systems (ELK, Splunk, CloudWatch)
     """
     
+    # UTC ISO-8601 timestamps from record.created, without a datetime per record.
+    # Level filtering already happens in the logger/handler before format().
+    converter = time.gmtime
+    default_time_format = '%Y-%m-%dT%H:%M:%S'
+    default_msec_format = '%s.%03d'
+    
     def format(self, record):
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': self.formatTime(record),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -26,21 +51,18 @@ class StructuredFormatter(logging.Formatter):
             'line': record.lineno,
         }
         
-        # Add extra fields if present
-        if hasattr(record, 'user_email'):
-            log_data['user_email'] = record.user_email
-        if hasattr(record, 'session_id'):
-            log_data['session_id'] = record.session_id
-        if hasattr(record, 'agent_type'):
-            log_data['agent_type'] = record.agent_type
-        if hasattr(record, 'execution_time_ms'):
-            log_data['execution_time_ms'] = record.execution_time_ms
+        # Add extra fields if present (read __dict__ directly, no hasattr round-trips)
+        record_dict = record.__dict__
+        for name in _EXTRA_ATTRS:
+            if name in record_dict:
+                log_data[name] = record_dict[name]
         
         # Add exception info if present
-        if record.exc_info:
-            log_data['exception'] = self.formatException(record.exc_info)
+        exc_info = record.exc_info
+        if exc_info:
+            log_data['exception'] = self.formatException(exc_info)
         
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
 class ProductionLogger:
@@ -51,55 +73,60 @@ class ProductionLogger:
     
     def __init__(self, name):
         self.logger = logging.getLogger(name)
-        self.is_production = not settings.DEBUG
     
-    def info(self, message, **kwargs):
+    def info(self, message, *args, **kwargs):
         """Log info level message with structured context"""
-        self._log(logging.INFO, message, **kwargs)
+        self._log(logging.INFO, message, *args, **kwargs)
     
-    def warning(self, message, **kwargs):
+    def warning(self, message, *args, **kwargs):
         """Log warning level message with structured context"""
-        self._log(logging.WARNING, message, **kwargs)
+        self._log(logging.WARNING, message, *args, **kwargs)
     
-    def error(self, message, **kwargs):
+    def error(self, message, *args, **kwargs):
         """Log error level message with structured context"""
-        self._log(logging.ERROR, message, **kwargs)
+        self._log(logging.ERROR, message, *args, **kwargs)
     
-    def debug(self, message, **kwargs):
+    def debug(self, message, *args, **kwargs):
         """Log debug level message with structured context"""
-        self._log(logging.DEBUG, message, **kwargs)
+        self._log(logging.DEBUG, message, *args, **kwargs)
     
-    def critical(self, message, **kwargs):
+    def critical(self, message, *args, **kwargs):
         """Log critical level message with structured context"""
-        self._log(logging.CRITICAL, message, **kwargs)
+        self._log(logging.CRITICAL, message, *args, **kwargs)
     
-    def _log(self, level, message, **kwargs):
-        """Internal method to log with extra context"""
-        extra = {}
+    def _log(self, level, message, *args, **kwargs):
+        """
+        Internal method to log with extra context
+        
+        `message` may be a %-style format string; `args` are interpolated
+        lazily by the logging module, only if the record is emitted.
+        """
+        # Filtered levels cost nothing beyond this check
+        if not self.logger.isEnabledFor(level):
+            return
         
         # Extract known fields
-        if 'user_email' in kwargs:
-            extra['user_email'] = kwargs.pop('user_email')
-        if 'session_id' in kwargs:
-            extra['session_id'] = kwargs.pop('session_id')
-        if 'agent_type' in kwargs:
-            extra['agent_type'] = kwargs.pop('agent_type')
-        if 'execution_time_ms' in kwargs:
-            extra['execution_time_ms'] = kwargs.pop('execution_time_ms')
+        extra = {key: kwargs.pop(key) for key in kwargs.keys() & _EXTRA_KEYS}
         
-        # Append remaining kwargs to message
+        # Append remaining kwargs to message (as an arg, so a '%' inside
+        # the JSON is never treated as a format directive)
         if kwargs:
-            message = f"{message} | {json.dumps(kwargs)}"
+            if not args:
+                # Plain message: escape literal '%' now that it gets formatted
+                message = message.replace('%', '%%')
+            message = f"{message} | %s"
+            args = (*args, _dumps(kwargs))
         
-        self.logger.log(level, message, extra=extra)
+        self.logger.log(level, message, *args, extra=extra)
     
     def agent_execution(self, agent_type, session_id, status, execution_time_ms=None, **kwargs):
         """
         Specialized logging for agent executions
         """
-        message = f"Agent execution: {agent_type} - {status}"
         self.info(
-            message,
+            "Agent execution: %s - %s",
+            agent_type,
+            status,
             agent_type=agent_type,
             session_id=session_id,
             execution_time_ms=execution_time_ms,
@@ -110,29 +137,38 @@ class ProductionLogger:
         """
         Specialized logging for API requests
         """
-        message = f"API {method} {endpoint} - {status_code}"
-        if status_code >= 400:
-            self.warning(message, response_time_ms=response_time_ms, **kwargs)
-        else:
-            self.info(message, response_time_ms=response_time_ms, **kwargs)
+        level = logging.WARNING if status_code >= 400 else logging.INFO
+        self._log(
+            level,
+            "API %s %s - %s",
+            method,
+            endpoint,
+            status_code,
+            response_time_ms=response_time_ms,
+            **kwargs
+        )
     
     def trip_generation(self, user_email, destination, status, **kwargs):
         """
         Specialized logging for trip generation
         """
-        message = f"Trip generation: {destination} - {status}"
         self.info(
-            message,
+            "Trip generation: %s - %s",
+            destination,
+            status,
             user_email=user_email,
             destination=destination,
             **kwargs
         )
 
 
+@lru_cache(maxsize=None)
 def get_production_logger(name):
     """
     Factory function to get a production logger instance
     
+    Returns the same instance per name, like logging.getLogger.
+    
     Usage:
         from langgraph_agents.logging_config import get_production_logger
         logger = get_production_logger(__name__)
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:36
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langgraph_agents', '0002_alter_agentexecutionlog_options_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='agentexecutionlog',
+            name='idx_log_session',
+        ),
+        migrations.RemoveIndex(
+            model_name='travelplanningsession',
+            name='idx_session_email',
+        ),
+        migrations.RemoveIndex(
+            model_name='travelplanningsession',
+            name='idx_session_id',
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langgraph_agents', '0003_drop_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='travelplanningsession',
+            name='idx_session_status',
+        ),
+        migrations.AddIndex(
+            model_name='travelplanningsession',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'running'])), fields=['created_at'], name='idx_active_sessions'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:40
+
+from django.db import migrations, models
+
+import langgraph_agents.fields
+
+
+def copy_payloads_forward(apps, schema_editor):
+    AgentExecutionLog = apps.get_model('langgraph_agents', 'AgentExecutionLog')
+    batch = []
+    for log in AgentExecutionLog.objects.only('id', 'input_data', 'output_data').iterator(chunk_size=500):
+        log.input_data_compressed = log.input_data or {}
+        log.output_data_compressed = log.output_data
+        batch.append(log)
+        if len(batch) >= 500:
+            AgentExecutionLog.objects.bulk_update(batch, ['input_data_compressed', 'output_data_compressed'])
+            batch = []
+    if batch:
+        AgentExecutionLog.objects.bulk_update(batch, ['input_data_compressed', 'output_data_compressed'])
+
+
+def copy_payloads_backward(apps, schema_editor):
+    AgentExecutionLog = apps.get_model('langgraph_agents', 'AgentExecutionLog')
+    batch = []
+    for log in AgentExecutionLog.objects.only('id', 'input_data_compressed', 'output_data_compressed').iterator(chunk_size=500):
+        log.input_data = log.input_data_compressed or {}
+        log.output_data = log.output_data_compressed
+        batch.append(log)
+        if len(batch) >= 500:
+            AgentExecutionLog.objects.bulk_update(batch, ['input_data', 'output_data'])
+            batch = []
+    if batch:
+        AgentExecutionLog.objects.bulk_update(batch, ['input_data', 'output_data'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langgraph_agents', '0004_active_sessions_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='agentexecutionlog',
+            name='input_data_compressed',
+            field=langgraph_agents.fields.CompressedJSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name='agentexecutionlog',
+            name='output_data_compressed',
+            field=langgraph_agents.fields.CompressedJSONField(blank=True, null=True),
+        ),
+        migrations.RunPython(copy_payloads_forward, copy_payloads_backward),
+        # Give the old column a default so reversing the removal can re-add it
+        migrations.AlterField(
+            model_name='agentexecutionlog',
+            name='input_data',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.RemoveField(
+            model_name='agentexecutionlog',
+            name='input_data',
+        ),
+        migrations.RemoveField(
+            model_name='agentexecutionlog',
+            name='output_data',
+        ),
+        migrations.RenameField(
+            model_name='agentexecutionlog',
+            old_name='input_data_compressed',
+            new_name='input_data',
+        ),
+        migrations.RenameField(
+            model_name='agentexecutionlog',
+            old_name='output_data_compressed',
+            new_name='output_data',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langgraph_agents', '0005_compress_agent_log_payloads'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='agentexecutionlog',
+            name='started_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-16 18:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('langgraph_agents', '0006_agent_log_started_at_default'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='agentexecutionlog',
+            index=models.Index(fields=['session', 'started_at'], name='idx_session_started'),
+        ),
+    ]
@@ -1,7 +1,11 @@
 # langgraph_agents/models.py
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 import uuid
 
+from .fields import CompressedJSONField
+
 class TravelPlanningSession(models.Model):
     """Track LangGraph execution sessions"""
     session_id = models.UUIDField(default=uuid.uuid4, unique=True)
@@ -38,16 +42,23 @@ class TravelPlanningSession(models.Model):
         ordering = ['-created_at']
         indexes = [
             # Single-field indexes for frequently queried fields
-            models.Index(fields=['user_email'], name='idx_session_email'),
-            models.Index(fields=['status'], name='idx_session_status'),
+            # (session_id is covered by its unique constraint, user_email by
+            # the leading column of idx_email_status / idx_email_created)
             models.Index(fields=['destination'], name='idx_session_dest'),
             models.Index(fields=['created_at'], name='idx_session_created'),
-            models.Index(fields=['session_id'], name='idx_session_id'),
             
             # Composite indexes for common query patterns
             models.Index(fields=['user_email', 'status'], name='idx_email_status'),
             models.Index(fields=['user_email', 'created_at'], name='idx_email_created'),
             models.Index(fields=['status', 'created_at'], name='idx_status_created'),
+            
+            # Partial index over in-flight sessions only (a small slice of rows);
+            # plain status lookups use the leading column of idx_status_created
+            models.Index(
+                fields=['created_at'],
+                name='idx_active_sessions',
+                condition=Q(status__in=['pending', 'running']),
+            ),
         ]
         verbose_name = "Travel Planning Session"
         verbose_name_plural = "Travel Planning Sessions"
@@ -69,19 +80,20 @@ class AgentExecutionLog(models.Model):
         ('failed', 'Failed')
     ], default='pending')
     
-    input_data = models.JSONField()
-    output_data = models.JSONField(null=True, blank=True)
+    # Full agent payloads, never queried into - stored compressed
+    input_data = CompressedJSONField(default=dict)
+    output_data = CompressedJSONField(null=True, blank=True)
     error_message = models.TextField(null=True, blank=True)
     execution_time_ms = models.IntegerField(null=True, blank=True)
     
-    started_at = models.DateTimeField(auto_now_add=True)
+    # default (not auto_now_add) so buffered rows keep the time they were queued
+    started_at = models.DateTimeField(default=timezone.now, editable=False)
     completed_at = models.DateTimeField(null=True, blank=True)
     
     class Meta:
         ordering = ['started_at']
         indexes = [
-            # Foreign key index (Django auto-creates this, but explicit is better)
-            models.Index(fields=['session'], name='idx_log_session'),
+            # session is already indexed by its ForeignKey
             
             # Single-field indexes
             models.Index(fields=['agent_type'], name='idx_log_agent_type'),
@@ -91,6 +103,8 @@ class AgentExecutionLog(models.Model):
             # Composite indexes for common query patterns
             models.Index(fields=['session', 'agent_type'], name='idx_session_agent'),
             models.Index(fields=['session', 'status'], name='idx_session_status_log'),
+            # Per-session timeline, read in started_at order without a sort
+            models.Index(fields=['session', 'started_at'], name='idx_session_started'),
         ]
         verbose_name = "Agent Execution Log"
         verbose_name_plural = "Agent Execution Logs"
\ No newline at end of file
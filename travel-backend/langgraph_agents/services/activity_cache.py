@@ -5,12 +5,85 @@ Activity caching service for GA-First workflow optimization
 
 from django.core.cache import cache
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
 import hashlib
-import json
 import logging
+import threading
+import time
+import zlib
+from collections import Counter
+
+from cachetools import TTLCache
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    from django_redis import get_redis_connection
+    DJANGO_REDIS_AVAILABLE = True
+except ImportError:
+    DJANGO_REDIS_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# v3: entries are tagged MessagePack blobs, zlib-compressed when large
+CACHE_PREFIX = "ga_activity_pool_v3"
+
+# Payloads below this size aren't worth compressing
+COMPRESS_MIN_BYTES = 4096
+COMPRESS_LEVEL = 3
+
+# One-byte tag in front of each stored blob
+_RAW_TAG = b'M'
+_ZLIB_TAG = b'Z'
+
+# Per-process L1 in front of the shared cache for hot destinations.
+# Cached lists are shared, not copied - callers must treat them as read-only.
+_L1 = TTLCache(maxsize=64, ttl=300)
+_L1_LOCK = threading.RLock()
+
+# Lookup outcomes for this process: hit, negative_hit, miss
+_STATS = Counter()
+
+
+def _pack(activities: List[Dict[str, Any]]):
+    """Serialize an activity list for the shared cache"""
+    if not MSGPACK_AVAILABLE:
+        return activities
+    
+    payload = msgpack.packb(activities, use_bin_type=True)
+    if len(payload) < COMPRESS_MIN_BYTES:
+        return _RAW_TAG + payload
+    return _ZLIB_TAG + zlib.compress(payload, COMPRESS_LEVEL)
+
+
+def _unpack(raw) -> Optional[List[Dict[str, Any]]]:
+    """Inverse of _pack; tolerates plain lists written without msgpack"""
+    if not isinstance(raw, bytes):
+        return raw
+    
+    payload = raw[1:]
+    if raw[:1] == _ZLIB_TAG:
+        payload = zlib.decompress(payload)
+    return msgpack.unpackb(payload, raw=False)
+
+
+@lru_cache(maxsize=1024)
+def _cache_key(destination: str, radius: int, max_activities: int, travel_style: str, trip_types: tuple) -> str:
+    """Build the cache key from a canonical parameter string (pure, so memoized)"""
+    signature = '|'.join((
+        destination,
+        str(radius),
+        str(max_activities),
+        travel_style,
+        ','.join(trip_types)
+    ))
+    param_hash = hashlib.blake2b(signature.encode('utf-8'), digest_size=4).hexdigest()
+    return f"{CACHE_PREFIX}_{destination}_{param_hash}"
+
 
 class ActivityCache:
     """
@@ -18,8 +91,15 @@ class ActivityCache:
     and speed up GA-First workflow for repeat destinations
     """
     
-    CACHE_PREFIX = "ga_activity_pool"
+    CACHE_PREFIX = CACHE_PREFIX
+    NEGATIVE_PREFIX = f"{CACHE_PREFIX}_neg"
     DEFAULT_TIMEOUT = 3600  # 1 hour (activities don't change frequently)
+    MAX_TIMEOUT = 86400  # Popular pools stay up to a day
+    FREQ_WINDOW = 86400  # Fetch counts older than this are forgotten
+    NEG_TIMEOUT = 60  # Empty results: short, so outages and typos recover quickly
+    INDEX_LOCK_TIMEOUT = 5  # A crashed writer's index lock expires after this
+    INDEX_LOCK_ATTEMPTS = 10
+    INDEX_LOCK_WAIT = 0.005
     
     @staticmethod
     def _generate_cache_key(destination: str, radius: int, max_activities: int, preferences: Dict = None) -> str:
@@ -35,29 +115,94 @@ class ActivityCache:
         Returns:
             Cache key string
         """
-        # Normalize destination (lowercase, strip whitespace)
-        normalized_dest = destination.lower().strip()
+        trip_types = ()
+        travel_style = ''
         
-        # Create parameter signature
-        params = {
-            'destination': normalized_dest,
-            'radius': radius,
-            'max_activities': max_activities
-        }
-        
-        # Include relevant preferences if provided
+        # Only these preferences affect the fetched pool
         if preferences:
-            relevant_prefs = {
-                'preferred_trip_types': preferences.get('preferredTripTypes', []),
-                'travel_style': preferences.get('travelStyle', ''),
-            }
-            params['preferences'] = relevant_prefs
+            trip_types = tuple(sorted(preferences.get('preferredTripTypes') or ()))
+            travel_style = preferences.get('travelStyle') or ''
         
-        # Generate hash from parameters
-        param_string = json.dumps(params, sort_keys=True)
-        param_hash = hashlib.md5(param_string.encode()).hexdigest()[:8]
+        return _cache_key(
+            destination.lower().strip(),
+            radius,
+            max_activities,
+            travel_style,
+            trip_types
+        )
+    
+    @classmethod
+    def _negative_key(cls, cache_key: str) -> str:
+        """Key marking that a search returned no activities"""
+        return cls.NEGATIVE_PREFIX + cache_key[len(cls.CACHE_PREFIX):]
+    
+    @classmethod
+    def _record_fetch(cls, cache_key: str) -> int:
+        """Count a fresh pool written for cache_key; returns the count in the current window"""
+        freq_key = f"{cls.CACHE_PREFIX}_freq_{cache_key}"
+        try:
+            cache.add(freq_key, 0, cls.FREQ_WINDOW)
+            return cache.incr(freq_key)
+        except ValueError:
+            # Expired between add and incr
+            return 1
+    
+    @classmethod
+    def _tiered_timeout(cls, frequency: int) -> int:
+        """TTL grows with how often a pool is refetched, capped at MAX_TIMEOUT"""
+        return min(cls.DEFAULT_TIMEOUT * max(frequency, 1), cls.MAX_TIMEOUT)
+    
+    @classmethod
+    def _index_key(cls, destination: str) -> str:
+        """Key of the set tracking every cache key written for a destination"""
+        return f"{cls.CACHE_PREFIX}_index_{destination.lower().strip()}"
+    
+    @staticmethod
+    def _redis_connection():
+        """Raw Redis connection when the cache runs on django-redis, else None"""
+        if not DJANGO_REDIS_AVAILABLE:
+            return None
+        try:
+            return get_redis_connection("default")
+        except NotImplementedError:
+            # Configured cache backend is not django-redis
+            return None
+    
+    @classmethod
+    def _track_key(cls, destination: str, cache_key: str):
+        """
+        Record cache_key in the destination's index so it can be cleared without a scan
         
-        return f"{ActivityCache.CACHE_PREFIX}_{normalized_dest}_{param_hash}"
+        The index lives for MAX_TIMEOUT so it outlives every entry it tracks.
+        On Redis the update is an atomic SADD. Other backends read, modify
+        and write the whole set, so writers serialize on a cache.add lock;
+        if it stays taken, the key goes untracked and simply expires with
+        its TTL instead of being cleared early.
+        """
+        index_key = cls._index_key(destination)
+        conn = cls._redis_connection()
+        
+        if conn is not None:
+            raw_index = cache.make_key(index_key)
+            pipe = conn.pipeline()
+            pipe.sadd(raw_index, cache.make_key(cache_key))
+            pipe.expire(raw_index, cls.MAX_TIMEOUT)
+            pipe.execute()
+            return
+        
+        lock_key = f"{index_key}_lock"
+        for _ in range(cls.INDEX_LOCK_ATTEMPTS):
+            if cache.add(lock_key, 1, cls.INDEX_LOCK_TIMEOUT):
+                try:
+                    keys = cache.get(index_key) or set()
+                    keys.add(cache_key)
+                    cache.set(index_key, keys, cls.MAX_TIMEOUT)
+                finally:
+                    cache.delete(lock_key)
+                return
+            time.sleep(cls.INDEX_LOCK_WAIT)
+        
+        logger.warning(f"⚠️  Index for {destination} busy; {cache_key} not tracked")
     
     @classmethod
     def get_cached_activities(
@@ -77,19 +222,40 @@ class ActivityCache:
             preferences: User preferences
             
         Returns:
-            Cached activities list or None if not found
+            Cached activities list, an empty list if the search is known to
+            return nothing, or None if not found
         """
         cache_key = cls._generate_cache_key(destination, radius, max_activities, preferences)
         
+        with _L1_LOCK:
+            cached_data = _L1.get(cache_key)
+        
+        if cached_data:
+            _STATS['hit'] += 1
+            logger.debug(f"✅ L1 cache HIT for {destination} - {len(cached_data)} activities")
+            return cached_data
+        
         try:
-            cached_data = cache.get(cache_key)
+            # Entry and negative marker in one round trip; hits write nothing
+            negative_key = cls._negative_key(cache_key)
+            found = cache.get_many([cache_key, negative_key])
+            cached_data = _unpack(found.get(cache_key))
             
             if cached_data:
+                with _L1_LOCK:
+                    _L1[cache_key] = cached_data
+                _STATS['hit'] += 1
                 logger.info(f"✅ Cache HIT for {destination} - {len(cached_data)} activities")
                 return cached_data
-            else:
-                logger.info(f"⚠️  Cache MISS for {destination}")
-                return None
+            
+            if found.get(negative_key) is not None:
+                _STATS['negative_hit'] += 1
+                logger.info(f"🚫 Negative cache HIT for {destination} - no activities")
+                return []
+            
+            _STATS['miss'] += 1
+            logger.info(f"⚠️  Cache MISS for {destination}")
+            return None
                 
         except Exception as e:
             logger.error(f"❌ Cache retrieval failed: {e}")
@@ -103,7 +269,7 @@ class ActivityCache:
         radius: int = 15000,
         max_activities: int = 50,
         preferences: Dict = None,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = None
     ) -> bool:
         """
         Cache activities for a destination
@@ -114,7 +280,7 @@ class ActivityCache:
             radius: Search radius in meters
             max_activities: Maximum number of activities
             preferences: User preferences
-            timeout: Cache timeout in seconds
+            timeout: Cache timeout in seconds (default: tiered by refetch frequency)
             
         Returns:
             True if cached successfully, False otherwise
@@ -122,7 +288,14 @@ class ActivityCache:
         cache_key = cls._generate_cache_key(destination, radius, max_activities, preferences)
         
         try:
-            cache.set(cache_key, activities, timeout)
+            if timeout is None:
+                # Pools that keep being refetched after expiring get longer TTLs
+                timeout = cls._tiered_timeout(cls._record_fetch(cache_key))
+            
+            cache.set(cache_key, _pack(activities), timeout)
+            cls._track_key(destination, cache_key)
+            with _L1_LOCK:
+                _L1[cache_key] = activities
             logger.info(f"✅ Cached {len(activities)} activities for {destination} (TTL: {timeout}s)")
             return True
             
@@ -130,6 +303,42 @@ class ActivityCache:
             logger.error(f"❌ Cache storage failed: {e}")
             return False
     
+    @classmethod
+    def cache_empty_result(
+        cls,
+        destination: str,
+        radius: int = 15000,
+        max_activities: int = 50,
+        preferences: Dict = None,
+        timeout: int = NEG_TIMEOUT
+    ) -> bool:
+        """
+        Remember that a search returned no activities
+        
+        Args:
+            destination: Destination name
+            radius: Search radius in meters
+            max_activities: Maximum number of activities
+            preferences: User preferences
+            timeout: Cache timeout in seconds
+            
+        Returns:
+            True if cached successfully, False otherwise
+        """
+        cache_key = cls._negative_key(
+            cls._generate_cache_key(destination, radius, max_activities, preferences)
+        )
+        
+        try:
+            cache.set(cache_key, 1, timeout)
+            cls._track_key(destination, cache_key)
+            logger.info(f"🚫 Cached empty result for {destination} (TTL: {timeout}s)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Cache storage failed: {e}")
+            return False
+    
     @classmethod
     def clear_destination_cache(cls, destination: str) -> int:
         """
@@ -141,19 +350,31 @@ class ActivityCache:
         Returns:
             Number of cache entries cleared
         """
-        normalized_dest = destination.lower().strip()
-        pattern = f"{cls.CACHE_PREFIX}_{normalized_dest}_*"
+        index_key = cls._index_key(destination)
+        key_base = f"{cls.CACHE_PREFIX}_{destination.lower().strip()}"
+        
+        with _L1_LOCK:
+            for key in [k for k in _L1 if k.rpartition('_')[0] == key_base]:
+                del _L1[key]
         
         try:
-            # Note: This requires Redis cache backend for pattern matching
-            # For simple cache backends, this might not work
-            cache.delete_pattern(pattern)
-            logger.info(f"✅ Cleared cache for destination: {destination}")
-            return 1
+            conn = cls._redis_connection()
+            
+            if conn is not None:
+                raw_index = cache.make_key(index_key)
+                keys = conn.smembers(raw_index)
+                pipe = conn.pipeline()
+                if keys:
+                    pipe.delete(*keys)
+                pipe.delete(raw_index)
+                pipe.execute()
+            else:
+                keys = cache.get(index_key) or set()
+                cache.delete_many([*keys, index_key])
+            
+            logger.info(f"✅ Cleared {len(keys)} cache entries for destination: {destination}")
+            return len(keys)
             
-        except AttributeError:
-            logger.warning("Cache backend doesn't support pattern deletion")
-            return 0
         except Exception as e:
             logger.error(f"❌ Cache clearing failed: {e}")
             return 0
@@ -174,7 +395,14 @@ class ActivityCache:
                     'get': True,
                     'set': True,
                     'delete': True,
-                    'pattern_delete': hasattr(cache, 'delete_pattern')
+                    'pattern_delete': hasattr(cache, 'delete_pattern'),
+                    'indexed_delete': True
+                },
+                'redis_index': cls._redis_connection() is not None,
+                'lookups': {
+                    'hit': _STATS['hit'],
+                    'negative_hit': _STATS['negative_hit'],
+                    'miss': _STATS['miss']
                 }
             }
             return stats
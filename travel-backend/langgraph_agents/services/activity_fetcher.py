@@ -4,20 +4,25 @@ Uses Google Places API to get comprehensive activity data
 """
 
 import os
-import requests
+import asyncio
+import concurrent.futures
 import logging
-from typing import List, Dict, Any
+import threading
+from difflib import get_close_matches
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 from django.conf import settings
 from .activity_cache import ActivityCache
+from .api_client_service import APIClientService
+from ..exceptions import ServiceUnavailableError
 
 logger = logging.getLogger(__name__)
 
-
-class ActivityPoolFetcher:
-    """Fetches comprehensive activity pool for genetic algorithm optimization"""
-    
-    # Activity categories for different user preferences
-    ACTIVITY_CATEGORIES = {
+# Activity categories for different user preferences -> Google Places types
+ACTIVITY_CATEGORIES = {
+    category: frozenset(types)
+    for category, types in {
         'Cultural': ['museum', 'art_gallery', 'church', 'hindu_temple', 'synagogue', 'mosque'],
         'Nature': ['park', 'natural_feature', 'zoo', 'aquarium', 'campground'],
         'Entertainment': ['amusement_park', 'bowling_alley', 'movie_theater', 'night_club', 'casino'],
@@ -26,9 +31,102 @@ class ActivityPoolFetcher:
         'Historical': ['tourist_attraction', 'point_of_interest', 'establishment'],
         'Adventure': ['stadium', 'gym', 'spa', 'rv_park'],
         'Relaxation': ['spa', 'beauty_salon', 'park', 'cafe']
-    }
+    }.items()
+}
+
+# Popular types searched when no preference maps to a category
+DEFAULT_ACTIVITY_TYPES = frozenset({
+    'tourist_attraction', 'museum', 'park', 'restaurant',
+    'shopping_mall', 'church', 'point_of_interest'
+})
+
+
+# Case-insensitive lookup for category names from user profiles
+_CATEGORY_BY_LOWER = {category.lower(): category for category in ACTIVITY_CATEGORIES}
+
+
+def _match_category(name: str) -> Optional[str]:
+    """Resolve a user-supplied category name, tolerating case and small typos"""
+    if name in ACTIVITY_CATEGORIES:
+        return name
+    
+    lowered = name.lower().strip()
+    if lowered in _CATEGORY_BY_LOWER:
+        return _CATEGORY_BY_LOWER[lowered]
+    
+    close = get_close_matches(lowered, _CATEGORY_BY_LOWER, n=1, cutoff=0.8)
+    return _CATEGORY_BY_LOWER[close[0]] if close else None
+
+
+@lru_cache(maxsize=128)
+def _resolve_types(categories: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Map preferred categories to the sorted Places types to search"""
+    types_to_search = set()
+    unmatched = []
+    
+    for category in categories:
+        matched = _match_category(category)
+        if matched is None:
+            unmatched.append(category)
+            continue
+        if matched != category:
+            logger.info(f"🔤 Treating activity category '{category}' as '{matched}'")
+        types_to_search.update(ACTIVITY_CATEGORIES[matched])
+    
+    if unmatched:
+        logger.warning(f"⚠️  Unknown activity categories ignored: {unmatched}")
+    
+    # If no preferences matched, include popular types
+    if not types_to_search:
+        types_to_search = DEFAULT_ACTIVITY_TYPES
+    
+    return tuple(sorted(types_to_search))
+
+
+class ActivityPoolFetcher:
+    """Fetches comprehensive activity pool for genetic algorithm optimization"""
+    
+    # Activity categories for different user preferences
+    ACTIVITY_CATEGORIES = ACTIVITY_CATEGORIES
+    
+    # Price ranges based on price_level (0-4)
+    _PRICE_RANGES = MappingProxyType({
+        0: 'Free',
+        1: '₱50 - ₱200',
+        2: '₱200 - ₱500',
+        3: '₱500 - ₱1,500',
+        4: '₱1,500 - ₱5,000'
+    })
+    _FREE_TYPES = frozenset({'park', 'church', 'point_of_interest'})
+    _MUSEUM_TYPES = frozenset({'museum', 'art_gallery'})
+    
+    # Typical visit length per activity type
+    _DURATIONS = MappingProxyType({
+        'museum': '2 - 3 hours',
+        'art_gallery': '1.5 - 2 hours',
+        'park': '1 - 2 hours',
+        'restaurant': '1 - 1.5 hours',
+        'shopping_mall': '2 - 3 hours',
+        'church': '30 minutes - 1 hour',
+        'tourist_attraction': '1 - 2 hours',
+        'amusement_park': '3 - 5 hours',
+        'zoo': '2 - 3 hours',
+        'aquarium': '2 - 3 hours'
+    })
     
-    def __init__(self):
+    # Concurrent Nearby Search calls per fetch
+    MAX_CONCURRENT_SEARCHES = 5
+    
+    # Places statuses for a search that worked, whether or not it found anything
+    _SEARCH_OK_STATUSES = frozenset({'OK', 'ZERO_RESULTS'})
+    
+    # Uncached fetches in progress, keyed by cache key, so concurrent requests
+    # for the same pool share a single upstream fan-out. Requests run on
+    # their own event loops, so these are thread-safe futures.
+    _inflight: Dict[str, concurrent.futures.Future] = {}
+    _inflight_lock = threading.Lock()
+    
+    def __init__(self, api_client: APIClientService = None):
         # Try to get from Django settings first, fallback to environment variable
         try:
             from django.conf import settings
@@ -40,6 +138,10 @@ class ActivityPoolFetcher:
             raise ValueError("GOOGLE_PLACES_API_KEY not configured")
         
         self.base_url = "https://maps.googleapis.com/maps/api/place"
+        self.api_client = api_client or APIClientService()
+        # Uncached fetches running per event loop; the loop's client
+        # session is closed when its last one finishes
+        self._active_fetches: Dict[asyncio.AbstractEventLoop, int] = {}
     
     async def fetch_activity_pool(
         self,
@@ -71,15 +173,83 @@ class ActivityPoolFetcher:
             preferences=user_preferences
         )
         
-        if cached_activities:
+        if cached_activities is not None:
             logger.info(f"⚡ Using cached activities for {destination} - saved 5-8s!")
             return cached_activities
         
+        cache_key = ActivityCache._generate_cache_key(
+            destination, radius, max_activities, user_preferences
+        )
+        
+        with self._inflight_lock:
+            pending = self._inflight.get(cache_key)
+            if pending is None:
+                future = concurrent.futures.Future()
+                self._inflight[cache_key] = future
+        
+        if pending is not None:
+            logger.info(f"⏳ Joining in-flight activity fetch for {destination}")
+            try:
+                # Shielded so a cancelled joiner doesn't cancel the shared fetch
+                return await asyncio.shield(asyncio.wrap_future(pending))
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The fetch we joined was cancelled; run our own instead
+                return await self.fetch_activity_pool(
+                    destination, user_preferences, radius, max_activities
+                )
+        
+        loop = asyncio.get_running_loop()
+        self._active_fetches[loop] = self._active_fetches.get(loop, 0) + 1
+        try:
+            activities = await self._fetch_and_cache(
+                destination, user_preferences, radius, max_activities
+            )
+            if activities is None:
+                # Upstream failure: nothing cached, so the next request retries
+                activities = []
+            elif not activities:
+                # Don't repeat the whole fan-out for every request in the next minute
+                ActivityCache.cache_empty_result(
+                    destination=destination,
+                    radius=radius,
+                    max_activities=max_activities,
+                    preferences=user_preferences
+                )
+            future.set_result(activities)
+            return activities
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+            if not future.done():
+                future.cancel()
+            
+            self._active_fetches[loop] -= 1
+            if not self._active_fetches[loop]:
+                del self._active_fetches[loop]
+                await self.api_client.close_session()
+    
+    async def _fetch_and_cache(
+        self,
+        destination: str,
+        user_preferences: Dict[str, Any],
+        radius: int,
+        max_activities: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the activity pool from Google Places and cache the result
+        
+        Returns an empty list only when Google genuinely has nothing for the
+        search, and None if a request failed. Results from a partly failed
+        fan-out are returned but not cached.
+        """
+        
         try:
             # Step 1: Get destination coordinates
             coordinates = await self._get_coordinates(destination)
             if not coordinates:
-                logger.error(f"Failed to get coordinates for {destination}")
+                logger.warning(f"No place found for {destination}")
                 return []
             
             logger.info(f"📍 Location: {coordinates['lat']}, {coordinates['lng']}")
@@ -88,15 +258,33 @@ class ActivityPoolFetcher:
             activity_types = self._get_activity_types(user_preferences)
             logger.info(f"🎯 Searching for types: {activity_types}")
             
-            # Step 3: Fetch activities for each type
+            # Step 3: Fetch activities for all types concurrently,
+            # converting each response as soon as it arrives
+            location = f"{coordinates['lat']},{coordinates['lng']}"
+            search_requests = [
+                self.api_client.google_places_config(
+                    endpoint='nearbysearch',
+                    api_key=self.api_key,
+                    params={
+                        'location': location,
+                        'radius': radius,
+                        'type': activity_type
+                    }
+                )
+                for activity_type in activity_types
+            ]
+            
             all_activities = []
-            for activity_type in activity_types:
-                activities = await self._search_places(
-                    coordinates,
-                    activity_type,
-                    radius
+            failed_searches = 0
+            async for index, data in self.api_client.batch_requests(
+                search_requests,
+                max_concurrent=self.MAX_CONCURRENT_SEARCHES
+            ):
+                if data.get('status') not in self._SEARCH_OK_STATUSES:
+                    failed_searches += 1
+                all_activities.extend(
+                    self._parse_search_results(data, activity_types[index])
                 )
-                all_activities.extend(activities)
             
             # Step 4: Deduplicate and enhance
             unique_activities = self._deduplicate_activities(all_activities)
@@ -110,14 +298,23 @@ class ActivityPoolFetcher:
             
             final_activities = sorted_activities[:max_activities]
             
+            if failed_searches:
+                logger.error(
+                    f"❌ {failed_searches} of {len(activity_types)} place searches failed "
+                    f"for {destination}; not caching"
+                )
+                return final_activities or None
+            
+            if not final_activities:
+                return final_activities
+            
             # 🚀 NEW: Cache the results for future requests
             ActivityCache.cache_activities(
                 destination=destination,
                 activities=final_activities,
                 radius=radius,
                 max_activities=max_activities,
-                preferences=user_preferences,
-                timeout=3600  # 1 hour cache
+                preferences=user_preferences
             )
             
             logger.info(f"✅ Fetched {len(final_activities)} activities (cached for next request)")
@@ -125,95 +322,67 @@ class ActivityPoolFetcher:
             
         except Exception as e:
             logger.error(f"❌ Failed to fetch activity pool: {str(e)}")
-            return []
+            return None
     
-    async def _get_coordinates(self, destination: str) -> Dict[str, float]:
-        """Get coordinates for destination using Geocoding API"""
+    async def _get_coordinates(self, destination: str) -> Optional[Dict[str, float]]:
+        """
+        Get coordinates for destination using Geocoding API
         
-        try:
-            url = f"{self.base_url}/findplacefromtext/json"
-            params = {
+        Returns None if no place matches; raises ServiceUnavailableError if
+        the lookup itself fails.
+        """
+        
+        data = await self.api_client.google_places_request(
+            endpoint='findplacefromtext',
+            api_key=self.api_key,
+            params={
                 'input': destination,
                 'inputtype': 'textquery',
-                'fields': 'geometry',
-                'key': self.api_key
+                'fields': 'geometry'
             }
-            
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
-            
-            if data.get('status') == 'OK' and data.get('candidates'):
-                location = data['candidates'][0]['geometry']['location']
-                return {
-                    'lat': location['lat'],
-                    'lng': location['lng']
-                }
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Geocoding failed: {str(e)}")
+        )
+        
+        status = data.get('status')
+        if status == 'OK' and data.get('candidates'):
+            location = data['candidates'][0]['geometry']['location']
+            return {
+                'lat': location['lat'],
+                'lng': location['lng']
+            }
+        
+        if status in self._SEARCH_OK_STATUSES:
             return None
+        
+        logger.error(f"Geocoding failed for {destination}: {status} {data.get('error_message', '')}")
+        raise ServiceUnavailableError("Google Places API")
     
     def _get_activity_types(self, user_preferences: Dict[str, Any]) -> List[str]:
         """Determine which activity types to search based on user preferences"""
         
         preferred_categories = user_preferences.get('activityTypes', [])
-        
-        # Map user preferences to Google Places types
-        types_to_search = set()
-        
-        for category in preferred_categories:
-            if category in self.ACTIVITY_CATEGORIES:
-                types_to_search.update(self.ACTIVITY_CATEGORIES[category])
-        
-        # If no preferences, include popular types
-        if not types_to_search:
-            types_to_search = {
-                'tourist_attraction', 'museum', 'park', 'restaurant',
-                'shopping_mall', 'church', 'point_of_interest'
-            }
-        
-        return list(types_to_search)
+        return list(_resolve_types(tuple(sorted(set(preferred_categories)))))
     
-    async def _search_places(
+    def _parse_search_results(
         self,
-        coordinates: Dict[str, float],
-        place_type: str,
-        radius: int
+        data: Dict[str, Any],
+        place_type: str
     ) -> List[Dict[str, Any]]:
-        """Search for places of specific type near coordinates"""
+        """Convert a Nearby Search response for one place type into activities"""
         
-        try:
-            url = f"{self.base_url}/nearbysearch/json"
-            params = {
-                'location': f"{coordinates['lat']},{coordinates['lng']}",
-                'radius': radius,
-                'type': place_type,
-                'key': self.api_key
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
-            
-            if data.get('status') == 'OK':
-                results = data.get('results', [])
-                
-                # Convert to our activity format
-                activities = []
-                for place in results:
-                    activity = self._convert_place_to_activity(place, place_type)
-                    if activity:
-                        activities.append(activity)
-                
-                logger.info(f"  Found {len(activities)} {place_type} activities")
-                return activities
-            
-            return []
-            
-        except Exception as e:
-            logger.error(f"Place search failed for {place_type}: {str(e)}")
+        if data.get('status') != 'OK':
+            if 'error' in data:
+                logger.error(f"Place search failed for {place_type}: {data['error']}")
             return []
+        
+        # Convert to our activity format
+        activities = []
+        for place in data.get('results', []):
+            activity = self._convert_place_to_activity(place, place_type)
+            if activity:
+                activities.append(activity)
+        
+        logger.info(f"  Found {len(activities)} {place_type} activities")
+        return activities
     
     def _convert_place_to_activity(
         self,
@@ -223,23 +392,27 @@ class ActivityPoolFetcher:
         """Convert Google Places result to activity format"""
         
         try:
+            # Bind lookups once; this runs for every place of every type
+            get = place.get
+            location = place['geometry']['location']
+            
             return {
-                'placeName': place.get('name', 'Unknown'),
-                'placeDetails': place.get('vicinity', ''),
+                'placeName': get('name', 'Unknown'),
+                'placeDetails': get('vicinity', ''),
                 'placeImageUrl': self._get_place_photo(place),
                 'geoCoordinates': {
-                    'latitude': place['geometry']['location']['lat'],
-                    'longitude': place['geometry']['location']['lng']
+                    'latitude': location['lat'],
+                    'longitude': location['lng']
                 },
                 'ticketPricing': self._estimate_price(place, activity_type),
-                'rating': place.get('rating', 0),
-                'userRatingCount': place.get('user_ratings_total', 0),
-                'placeId': place.get('place_id', ''),
+                'rating': get('rating', 0),
+                'userRatingCount': get('user_ratings_total', 0),
+                'placeId': get('place_id', ''),
                 'activityType': activity_type,
-                'businessStatus': place.get('business_status', 'OPERATIONAL'),
-                'openNow': place.get('opening_hours', {}).get('open_now', True),
-                'priceLevel': place.get('price_level', 2),
-                'types': place.get('types', []),
+                'businessStatus': get('business_status', 'OPERATIONAL'),
+                'openNow': get('opening_hours', {}).get('open_now', True),
+                'priceLevel': get('price_level', 2),
+                'types': get('types', []),
                 'timeTravel': self._estimate_duration(activity_type)
             }
         except Exception as e:
@@ -262,61 +435,37 @@ class ActivityPoolFetcher:
         
         price_level = place.get('price_level', 2)
         
-        # Price ranges based on price_level (0-4)
-        price_ranges = {
-            0: 'Free',
-            1: '₱50 - ₱200',
-            2: '₱200 - ₱500',
-            3: '₱500 - ₱1,500',
-            4: '₱1,500 - ₱5,000'
-        }
-        
         # Specific overrides for certain types
-        if activity_type in ['park', 'church', 'point_of_interest']:
+        if activity_type in self._FREE_TYPES:
             return 'Free'
-        elif activity_type in ['museum', 'art_gallery']:
-            return price_ranges.get(price_level, '₱150 - ₱300')
+        elif activity_type in self._MUSEUM_TYPES:
+            return self._PRICE_RANGES.get(price_level, '₱150 - ₱300')
         
-        return price_ranges.get(price_level, '₱200 - ₱500')
+        return self._PRICE_RANGES.get(price_level, '₱200 - ₱500')
     
     def _estimate_duration(self, activity_type: str) -> str:
         """Estimate time needed for activity"""
         
-        duration_map = {
-            'museum': '2 - 3 hours',
-            'art_gallery': '1.5 - 2 hours',
-            'park': '1 - 2 hours',
-            'restaurant': '1 - 1.5 hours',
-            'shopping_mall': '2 - 3 hours',
-            'church': '30 minutes - 1 hour',
-            'tourist_attraction': '1 - 2 hours',
-            'amusement_park': '3 - 5 hours',
-            'zoo': '2 - 3 hours',
-            'aquarium': '2 - 3 hours'
-        }
-        
-        return duration_map.get(activity_type, '1.5 - 2 hours')
+        return self._DURATIONS.get(activity_type, '1.5 - 2 hours')
     
     def _deduplicate_activities(
         self,
         activities: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Remove duplicate activities based on place name and coordinates"""
+        """Remove duplicate activities by place ID, or name and coordinates without one"""
         
-        seen = set()
-        unique = []
+        # Dict keeps the first occurrence in insertion order
+        unique_by_key = {}
         
         for activity in activities:
-            # Create unique key from name and coordinates
-            key = (
+            key = activity.get('placeId') or (
                 activity['placeName'].lower(),
                 round(activity['geoCoordinates']['latitude'], 4),
                 round(activity['geoCoordinates']['longitude'], 4)
             )
-            
-            if key not in seen:
-                seen.add(key)
-                unique.append(activity)
+            unique_by_key.setdefault(key, activity)
+        
+        unique = list(unique_by_key.values())
         
         logger.info(f"🔄 Deduplicated: {len(activities)} → {len(unique)}")
         return unique
@@ -342,15 +491,20 @@ class ActivityPoolFetcher:
     ) -> List[Dict[str, Any]]:
         """Sort activities by relevance to user preferences"""
         
-        def calculate_relevance(activity):
-            score = 0
-            
-            # Rating score (0-5)
-            score += activity.get('rating', 0) * 20
-            
-            # Popularity score (reviews)
-            review_count = activity.get('userRatingCount', 0)
-            score += min(review_count / 100, 10)
+        # Derive preference data once, not per activity
+        preferred_lower = tuple(
+            pref.lower() for pref in user_preferences.get('activityTypes', [])
+        )
+        
+        # A pool only has a handful of distinct activity types
+        type_bonus: Dict[str, int] = {}
+        
+        # Score every activity in a single pass, then sort the scores
+        scores = []
+        for activity in activities:
+            # Rating score (0-5) and popularity (reviews)
+            score = activity.get('rating', 0) * 20
+            score += min(activity.get('userRatingCount', 0) / 100, 10)
             
             # Business status
             if activity.get('businessStatus') == 'OPERATIONAL':
@@ -360,21 +514,29 @@ class ActivityPoolFetcher:
             if activity.get('openNow'):
                 score += 5
             
-            # Activity type match
-            preferred_types = user_preferences.get('activityTypes', [])
+            # Activity type match, computed once per distinct type
             activity_type = activity.get('activityType', '')
+            bonus = type_bonus.get(activity_type)
+            if bonus is None:
+                type_lower = activity_type.lower()
+                bonus = type_bonus[activity_type] = 30 * sum(
+                    1 for pref in preferred_lower if pref in type_lower
+                )
+            score += bonus
             
-            for pref in preferred_types:
-                if pref.lower() in activity_type.lower():
-                    score += 30
-            
-            return score
+            scores.append(score)
         
-        return sorted(activities, key=calculate_relevance, reverse=True)
+        order = sorted(range(len(activities)), key=scores.__getitem__, reverse=True)
+        return [activities[i] for i in order]
+
+
+def get_activity_fetcher() -> ActivityPoolFetcher:
+    """Process-wide fetcher managed by the langgraph_agents app config"""
+    from django.apps import apps
+    return apps.get_app_config('langgraph_agents').activity_fetcher
 
 
 # Async wrapper for synchronous code
 async def fetch_activity_pool_async(*args, **kwargs):
     """Async wrapper for activity fetcher"""
-    fetcher = ActivityPoolFetcher()
-    return await fetcher.fetch_activity_pool(*args, **kwargs)
+    return await get_activity_fetcher().fetch_activity_pool(*args, **kwargs)
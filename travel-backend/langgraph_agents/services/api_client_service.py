@@ -4,33 +4,182 @@ API client service for external integrations
 
 import aiohttp
 import asyncio
-from typing import Dict, Any, Optional
+import json
+import threading
+import time
+import weakref
+from typing import AsyncIterator, Dict, Any, Optional, Tuple, Union
 from urllib.parse import urlencode
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from django.conf import settings
+
 from ..utils import get_agent_logger
 from ..exceptions import ServiceUnavailableError, RateLimitError, APIKeyMissingError
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(body: bytes) -> Any:
+    """Parse response bodies, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _timeout_kwargs(timeout: Union[float, Tuple[float, float], None]) -> Dict[str, Any]:
+    """
+    Per-request timeout override; passing timeout=None to aiohttp would disable it
+    
+    A number is a total timeout; a (connect, read) tuple bounds connecting
+    and each wait for data instead, leaving long streams uncapped.
+    """
+    if timeout is None:
+        return {}
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return {'timeout': aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)}
+    return {'timeout': aiohttp.ClientTimeout(total=timeout)}
+
+
+class TokenBucket:
+    """
+    Request-rate limiter shared across threads and event loops
+    
+    Each acquire() reserves a token; when the bucket is empty the caller
+    sleeps until its reserved token has refilled, so bursts are smoothed
+    to `rate` requests per second in arrival order.
+    """
+    
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+    
+    async def acquire(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def acquire_blocking(self):
+        """acquire() for worker threads: sleeps the thread instead of a coroutine"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Per-service limits shared by every APIClientService in the process
+_RATE_LIMITERS: Dict[str, TokenBucket] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def _get_rate_limiter(service_name: str) -> Optional[TokenBucket]:
+    """Token bucket for services with a configured QPS, else None"""
+    limiter = _RATE_LIMITERS.get(service_name)
+    if limiter is None and service_name == 'Google Places API':
+        with _RATE_LIMITERS_LOCK:
+            limiter = _RATE_LIMITERS.get(service_name)
+            if limiter is None:
+                qps = getattr(settings, 'GOOGLE_PLACES_QPS', 10)
+                limiter = _RATE_LIMITERS[service_name] = TokenBucket(qps)
+    return limiter
+
+
 class APIClientService:
     """
     Service for making API calls to external services
     """
     
+    # Connection pool shared by every request made through one session
+    POOL_LIMIT = 20
+    POOL_LIMIT_PER_HOST = 10
+    DNS_CACHE_TTL = 300
+    
+    # Bytes of an error response body kept for logging
+    ERROR_BODY_LIMIT = 2048
+    
+    # Retries of a rate-limited batch request, and the longest backoff
+    BATCH_RATE_LIMIT_RETRIES = 2
+    MAX_RATE_LIMIT_WAIT = 5
+    
     def __init__(self):
         self.logger = get_agent_logger("APIClientService")
-        self.session = None
+        # aiohttp sessions are bound to the loop they were created on, and
+        # views run each request on its own loop - keep one session per loop
+        self._sessions = weakref.WeakKeyDictionary()
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self.session is None or self.session.closed:
+        """Get or create the aiohttp session for the running event loop"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
             timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
-        return self.session
+            connector = aiohttp.TCPConnector(
+                limit=self.POOL_LIMIT,
+                limit_per_host=self.POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=self.DNS_CACHE_TTL
+            )
+            session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                json_serialize=_json_dumps
+            )
+            self._sessions[loop] = session
+        return session
     
     async def close_session(self):
-        """Close the aiohttp session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """Close the aiohttp session of the running event loop"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session and not session.closed:
+            await session.close()
+    
+    async def _check_status(self, response: aiohttp.ClientResponse, service_name: str):
+        """Raise the matching service error for a failed response"""
+        # Handle rate limiting
+        if response.status == 429:
+            retry_after = int(response.headers.get('Retry-After', 60))
+            raise RateLimitError(service_name, retry_after)
+        
+        # Handle service unavailable
+        if response.status >= 500:
+            raise ServiceUnavailableError(service_name, status_code=response.status)
+        
+        # Handle client errors
+        if response.status >= 400:
+            # Only the head of the body is needed for the log line;
+            # release() drops the rest instead of draining it
+            error_bytes = await response.content.read(self.ERROR_BODY_LIMIT)
+            response.release()
+            error_text = error_bytes.decode('utf-8', 'replace')
+            self.logger.warning("❌ API call failed: %s - %s", response.status, error_text)
+            raise ServiceUnavailableError(
+                service_name, 
+                status_code=response.status
+            )
     
     async def make_request(
         self, 
@@ -39,7 +188,8 @@ class APIClientService:
         headers: Dict[str, str] = None,
         params: Dict[str, Any] = None,
         data: Dict[str, Any] = None,
-        service_name: str = "external_api"
+        service_name: str = "external_api",
+        timeout: Union[float, Tuple[float, float]] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP request with error handling
@@ -51,6 +201,8 @@ class APIClientService:
             params: URL parameters
             data: Request body data
             service_name: Name of the service for logging
+            timeout: Total seconds, or a (connect, read) tuple (defaults to
+                the session's 30s total)
             
         Returns:
             Response data
@@ -61,50 +213,84 @@ class APIClientService:
         """
         session = await self._get_session()
         
+        limiter = _get_rate_limiter(service_name)
+        if limiter is not None:
+            await limiter.acquire()
+        
         try:
-            self.logger.debug(f"🔗 API call to {service_name}: {method} {url}")
+            self.logger.debug("🔗 API call to %s: %s %s", service_name, method, url)
             
             async with session.request(
                 method=method,
                 url=url,
                 headers=headers or {},
                 params=params,
-                json=data
+                json=data,
+                **_timeout_kwargs(timeout)
             ) as response:
                 
-                # Handle rate limiting
-                if response.status == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    raise RateLimitError(service_name, retry_after)
-                
-                # Handle service unavailable
-                if response.status >= 500:
-                    raise ServiceUnavailableError(service_name, status_code=response.status)
-                
-                # Handle client errors
-                if response.status >= 400:
-                    error_text = await response.text()
-                    self.logger.warning(f"❌ API call failed: {response.status} - {error_text}")
-                    raise ServiceUnavailableError(
-                        service_name, 
-                        status_code=response.status
-                    )
+                await self._check_status(response, service_name)
                 
                 # Success - parse response
                 if response.content_type == 'application/json':
-                    result = await response.json()
+                    result = _json_loads(await response.read())
                 else:
                     result = {'data': await response.text()}
                 
-                self.logger.debug(f"✅ API call to {service_name} successful")
+                self.logger.debug("✅ API call to %s successful", service_name)
                 return result
                 
         except aiohttp.ClientError as e:
-            self.logger.error(f"❌ Network error calling {service_name}: {str(e)}")
+            self.logger.error("❌ Network error calling %s: %s", service_name, e)
+            raise ServiceUnavailableError(service_name)
+        
+        except asyncio.TimeoutError:
+            self.logger.error("❌ Timeout calling %s", service_name)
+            raise ServiceUnavailableError(service_name)
+    
+    async def stream_request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] = None,
+        data: Dict[str, Any] = None,
+        service_name: str = "external_api",
+        timeout: Union[float, Tuple[float, float]] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Make HTTP request and yield the response body in chunks as it arrives
+        
+        Same arguments and errors as make_request; used for streamed
+        (e.g. server-sent event) responses.
+        """
+        session = await self._get_session()
+        
+        limiter = _get_rate_limiter(service_name)
+        if limiter is not None:
+            await limiter.acquire()
+        
+        try:
+            self.logger.debug("🔗 Streaming API call to %s: %s %s", service_name, method, url)
+            
+            async with session.request(
+                method=method,
+                url=url,
+                headers=headers or {},
+                json=data,
+                **_timeout_kwargs(timeout)
+            ) as response:
+                
+                await self._check_status(response, service_name)
+                
+                async for chunk in response.content.iter_any():
+                    yield chunk
+                
+        except aiohttp.ClientError as e:
+            self.logger.error("❌ Network error calling %s: %s", service_name, e)
             raise ServiceUnavailableError(service_name)
         
         except asyncio.TimeoutError:
-            self.logger.error(f"❌ Timeout calling {service_name}")
+            self.logger.error("❌ Timeout calling %s", service_name)
             raise ServiceUnavailableError(service_name)
     
     async def google_places_request(
@@ -128,23 +314,46 @@ class APIClientService:
             APIKeyMissingError: If API key is missing
             ServiceUnavailableError: If service call fails
         """
+        return await self.make_request(
+            **self.google_places_config(endpoint, api_key, params)
+        )
+    
+    def google_places_config(
+        self,
+        endpoint: str,
+        api_key: str,
+        params: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Build make_request arguments for a Google Places API call
+        
+        Usable directly as an entry of batch_requests.
+        
+        Args:
+            endpoint: API endpoint (e.g., 'textsearch', 'details')
+            api_key: Google Places API key
+            params: Request parameters
+            
+        Returns:
+            Keyword arguments for make_request
+            
+        Raises:
+            APIKeyMissingError: If API key is missing
+        """
         if not api_key:
             raise APIKeyMissingError("Google Places API", "HotelAgent")
         
         base_url = "https://maps.googleapis.com/maps/api/place"
-        url = f"{base_url}/{endpoint}/json"
         
-        request_params = {
-            'key': api_key,
-            **(params or {})
+        return {
+            'method': 'GET',
+            'url': f"{base_url}/{endpoint}/json",
+            'params': {
+                'key': api_key,
+                **(params or {})
+            },
+            'service_name': 'Google Places API'
         }
-        
-        return await self.make_request(
-            method='GET',
-            url=url,
-            params=request_params,
-            service_name='Google Places API'
-        )
     
     async def serpapi_request(
         self, 
@@ -187,39 +396,48 @@ class APIClientService:
         self, 
         requests: list[Dict[str, Any]], 
         max_concurrent: int = 5
-    ) -> list[Dict[str, Any]]:
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
         """
         Make multiple API requests concurrently with rate limiting
         
+        Results are yielded as soon as each request finishes, so callers
+        can process early responses while slower ones are still in flight.
+        
         Args:
             requests: List of request configurations
             max_concurrent: Maximum concurrent requests
             
-        Returns:
-            List of response data
+        Yields:
+            (index into requests, response data) in completion order;
+            failed requests yield {'error': ..., 'success': False}
         """
         semaphore = asyncio.Semaphore(max_concurrent)
         
-        async def bounded_request(request_config):
+        async def bounded_request(index, request_config):
             async with semaphore:
                 try:
-                    return await self.make_request(**request_config)
+                    for attempt in range(self.BATCH_RATE_LIMIT_RETRIES + 1):
+                        try:
+                            return index, await self.make_request(**request_config)
+                        except RateLimitError as e:
+                            if attempt == self.BATCH_RATE_LIMIT_RETRIES:
+                                raise
+                            wait = min(e.retry_after or 2 ** attempt, self.MAX_RATE_LIMIT_WAIT)
+                            self.logger.warning("⏳ Rate limited, retrying in %ss", wait)
+                            await asyncio.sleep(wait)
                 except Exception as e:
-                    self.logger.error(f"❌ Batch request failed: {str(e)}")
-                    return {'error': str(e), 'success': False}
-        
-        tasks = [bounded_request(req) for req in requests]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results and handle exceptions
-        processed_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                processed_results.append({
-                    'error': str(result),
-                    'success': False
-                })
-            else:
-                processed_results.append(result)
-        
-        return processed_results
\ No newline at end of file
+                    self.logger.error("❌ Batch request failed: %s", e)
+                    return index, {'error': str(e), 'success': False}
+        
+        tasks = [
+            asyncio.ensure_future(bounded_request(index, req))
+            for index, req in enumerate(requests)
+        ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early: don't leave requests running
+            for task in tasks:
+                task.cancel()
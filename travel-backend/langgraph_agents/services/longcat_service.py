@@ -9,14 +9,326 @@ Models:
 - LongCat-Flash-Thinking: Deep reasoning with thinking process
 """
 
+import aiohttp
+import asyncio
+import hashlib
+import json
 import os
 import logging
+import random
+import threading
+import time
+from collections import deque
 import requests
-from typing import List, Dict, Optional, Generator
+from requests.adapters import HTTPAdapter
+from typing import AsyncIterator, List, Dict, Optional, Generator, Tuple, Union
+from cachetools import TTLCache
 from django.conf import settings
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .api_client_service import APIClientService
+from ..exceptions import ServiceUnavailableError, RateLimitError
+from ..utils import Bulkhead
+
 logger = logging.getLogger(__name__)
 
+def _dumps(obj) -> bytes:
+    """Encode a request body, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(body: bytes):
+    """Decode a response body, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+# Keep-alive pool shared by every LongCatService in the process, so calls
+# reuse TLS connections instead of handshaking per request. Rebuilt after
+# a fork (e.g. gunicorn --preload) since sockets must not be shared.
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Get or create the pooled HTTP session for this process"""
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+                )
+                _session, _session_pid = session, pid
+    return _session
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a dependency is down
+    
+    Closed: calls pass through; fail_max failures within `window` seconds
+    open the circuit. Open: calls raise ServiceUnavailableError without
+    touching the network for reset_timeout seconds. Half-open: the next
+    call is let through as a probe - success closes the circuit, failure
+    re-opens it.
+    """
+
+    def __init__(self, service_name: str, fail_max: int = 5, window: float = 30.0,
+                 reset_timeout: float = 10.0):
+        self.service_name = service_name
+        self.fail_max = fail_max
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self._failures = deque()
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_call(self) -> bool:
+        """
+        Raise ServiceUnavailableError if the circuit is open
+        
+        Returns True if this call is the half-open probe. The caller must
+        then end it with record_success, record_failure or release_probe,
+        whatever happens, or every later call keeps failing fast.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+                raise ServiceUnavailableError(self.service_name)
+            self._probing = True
+            return True
+
+    def release_probe(self):
+        """End a probe that gave no verdict (cancelled, caller error); the next call probes"""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self):
+        with self._lock:
+            self._failures.clear()
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._probing:
+                self._opened_at = now
+                self._probing = False
+                logger.warning("%s probe failed, circuit re-opened", self.service_name)
+                return
+
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window:
+                self._failures.popleft()
+            if len(self._failures) >= self.fail_max:
+                self._opened_at = now
+                self._failures.clear()
+                logger.warning(
+                    "%s circuit opened after %s failures, failing fast for %.0fs",
+                    self.service_name, self.fail_max, self.reset_timeout
+                )
+
+
+_breaker = CircuitBreaker("LongCat API")
+
+# Concurrent LongCat requests per process, sync and async callers alike;
+# keeps a burst of workflows from hitting the rate limit all at once
+_llm_bulkhead = Bulkhead("LongCat API", 16)
+
+
+def _is_outage(error: BaseException) -> bool:
+    """Whether an async call's exception means LongCat itself is failing"""
+    if isinstance(error, RateLimitError):
+        return True
+    if isinstance(error, ServiceUnavailableError):
+        return error.status_code is None or error.status_code >= 500
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+# Transient failures worth retrying; other 4xx responses fail immediately
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _backoff_delay(attempt: int, base: float, cap: float, jitter: float) -> float:
+    """Exponential backoff with multiplicative jitter"""
+    return min(cap, base * 2 ** attempt) * (1 + random.uniform(0, jitter))
+
+
+def _post_in_bulkhead(url: str, **kwargs) -> requests.Response:
+    """POST through the pooled session holding an _llm_bulkhead slot, released on error"""
+    _llm_bulkhead.acquire()
+    try:
+        return _get_session().post(url, **kwargs)
+    except BaseException:
+        _llm_bulkhead.release()
+        raise
+
+
+def _post_with_retry(
+    url: str,
+    max_retries: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0,
+    jitter: float = 0.5,
+    **kwargs,
+) -> requests.Response:
+    """
+    POST through the pooled session, retrying transient failures
+    
+    Connection errors, timeouts and RETRYABLE_STATUS responses are retried
+    up to max_retries times, honoring Retry-After when the server sends it.
+    The final response is returned as-is for the caller to raise_for_status.
+    Outcomes feed the LongCat circuit breaker, which fails fast with
+    ServiceUnavailableError while open.
+    
+    Each attempt holds an _llm_bulkhead slot. With stream=True the returned
+    response keeps its slot while the body is read: the caller must close
+    it and call _llm_bulkhead.release().
+    """
+    stream = kwargs.get("stream", False)
+    probe = _breaker.before_call()
+
+    try:
+        for attempt in range(max_retries + 1):
+            try:
+                response = _post_in_bulkhead(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == max_retries:
+                    _breaker.record_failure()
+                    raise
+                delay = _backoff_delay(attempt, base, cap, jitter)
+                logger.warning("LongCat request failed (%s), retrying in %.1fs", e, delay)
+            except requests.exceptions.RequestException:
+                _breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS or attempt == max_retries:
+                    if not stream:
+                        # Body already read; the connection is back in the pool
+                        _llm_bulkhead.release()
+                    if response.status_code in RETRYABLE_STATUS:
+                        _breaker.record_failure()
+                    else:
+                        _breaker.record_success()
+                    return response
+
+                delay = _backoff_delay(attempt, base, cap, jitter)
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = min(cap, int(retry_after))
+                response.close()
+                _llm_bulkhead.release()
+                logger.warning("LongCat returned %s, retrying in %.1fs", response.status_code, delay)
+
+            time.sleep(delay)
+    except BaseException:
+        # Failures worth recording were recorded above; anything else
+        # (interrupts, caller errors) must not leave the probe pending
+        if probe:
+            _breaker.release_probe()
+        raise
+
+
+# Read size for streamed responses; large enough that a burst of SSE
+# events arrives in a handful of chunks
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _SSEParser:
+    """
+    Incremental server-sent events parser over raw bytes
+    
+    Chunks are appended to one buffer and scanned with a cursor, so each
+    byte is searched once no matter how the stream is fragmented. Yields
+    the payload of each `data:` line, stopping short of the [DONE] marker.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> List[str]:
+        buffer = self._buffer
+        buffer += chunk
+        events = []
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end == -1:
+                break
+            if buffer.startswith(b"data:", start):
+                data = bytes(buffer[start + 5:end]).strip()
+                if data != b"[DONE]":
+                    events.append(data.decode("utf-8"))
+            start = end + 1
+        # Keep only the unterminated tail
+        del buffer[:start]
+        return events
+
+    def close(self) -> List[str]:
+        """Events from a final line the stream ended without terminating"""
+        if not self._buffer:
+            return []
+        return self.feed(b"\n")
+
+
+# Recent completions keyed by API key and request body, so identical
+# prompts (retries, repeated template plans) are answered without another
+# API call. Bodies are stored serialized, so every hit returns a fresh
+# copy. Health results are cached separately and briefly, for frequent
+# readiness probes.
+RESPONSE_CACHE_TTL = 3600
+HEALTH_CACHE_TTL = 60
+_response_cache = TTLCache(maxsize=512, ttl=RESPONSE_CACHE_TTL)
+_health_cache = TTLCache(maxsize=16, ttl=HEALTH_CACHE_TTL)
+_cache_lock = threading.Lock()
+
+
+def _response_key(key_id: bytes, payload: Dict) -> bytes:
+    """Cache key for a chat completion request body sent with an API key"""
+    return hashlib.blake2b(key_id + _dumps(payload), digest_size=16).digest()
+
+
+def _use_cache(cache: Optional[bool], temperature: float) -> bool:
+    """Whether a completion may be served from or stored in the response cache"""
+    # Sampled completions are only cached on request
+    return temperature == 0 if cache is None else cache
+
+
+# Async callers share one client; it keeps an aiohttp session per event loop
+_async_client: Optional[APIClientService] = None
+
+
+def _get_async_client() -> APIClientService:
+    """Get or create the shared async HTTP client"""
+    global _async_client
+    if _async_client is None:
+        _async_client = APIClientService()
+    return _async_client
+
 
 class LongCatService:
     """
@@ -28,6 +340,16 @@ class LongCatService:
     CHAT_MODEL = "LongCat-Flash-Chat"
     THINKING_MODEL = "LongCat-Flash-Thinking"
 
+    # Independent prompts in flight at once for abatch_chat_completion
+    BATCH_CONCURRENCY = 8
+
+    # (connect, read) timeouts in seconds. Read bounds each wait for the
+    # next bytes, so a hung server is dropped well before a slow but live
+    # completion; the thinking model may reason a while before answering.
+    DEFAULT_TIMEOUT = (5, 45)
+    THINKING_TIMEOUT = (5, 60)
+    HEALTH_TIMEOUT = (3, 3)
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize LongCat service
@@ -39,10 +361,53 @@ class LongCatService:
         if not self.api_key:
             logger.warning("LongCat API key not configured")
 
+        # Built once and reused by every call
+        self._key_id = hashlib.blake2b((self.api_key or "").encode(), digest_size=16).digest()
+        self._url = f"{self.BASE_URL}/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
     def is_configured(self) -> bool:
         """Check if LongCat API key is configured"""
         return bool(self.api_key)
 
+    def _timeout(self, model: str, timeout: Optional[Tuple[float, float]]) -> Tuple[float, float]:
+        """Timeout for a call, defaulting by model"""
+        if timeout is not None:
+            return timeout
+        return self.THINKING_TIMEOUT if model == self.THINKING_MODEL else self.DEFAULT_TIMEOUT
+
+    def _build_payload(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        stream: bool,
+        enable_thinking: bool,
+        thinking_budget: int,
+    ) -> Dict:
+        """Build the chat completion request body"""
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": stream,
+        }
+
+        # Add thinking parameters if using thinking model
+        if model == self.THINKING_MODEL and enable_thinking:
+            payload["enable_thinking"] = True
+            payload["thinking_budget"] = max(thinking_budget, 1024)
+            # Ensure max_tokens > thinking_budget
+            if payload["max_tokens"] <= payload["thinking_budget"]:
+                payload["max_tokens"] = payload["thinking_budget"] + 1024
+
+        return payload
+
     def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -52,6 +417,8 @@ class LongCatService:
         stream: bool = False,
         enable_thinking: bool = False,
         thinking_budget: int = 1024,
+        timeout: Optional[Tuple[float, float]] = None,
+        cache: Optional[bool] = None,
     ) -> Dict:
         """
         Create a chat completion using LongCat API
@@ -64,6 +431,12 @@ class LongCatService:
             stream: Whether to stream the response
             enable_thinking: Enable thinking mode (only for THINKING_MODEL)
             thinking_budget: Max thinking tokens (only for THINKING_MODEL)
+            timeout: (connect, read) seconds; defaults to DEFAULT_TIMEOUT,
+                or THINKING_TIMEOUT for THINKING_MODEL
+            cache: Reuse the response of an identical request made within
+                RESPONSE_CACHE_TTL. By default only temperature 0 requests
+                are cached; pass True to cache a sampled completion too, or
+                False for a fresh one
             
         Returns:
             Response dict with 'choices', 'usage', etc.
@@ -71,47 +444,41 @@ class LongCatService:
         if not self.is_configured():
             raise ValueError("LongCat API key not configured")
 
-        url = f"{self.BASE_URL}/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        payload = self._build_payload(
+            messages, model, temperature, max_tokens, stream, enable_thinking, thinking_budget
+        )
 
-        payload = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "stream": stream,
-        }
-
-        # Add thinking parameters if using thinking model
-        if model == self.THINKING_MODEL and enable_thinking:
-            payload["enable_thinking"] = True
-            payload["thinking_budget"] = max(thinking_budget, 1024)
-            # Ensure max_tokens > thinking_budget
-            if payload["max_tokens"] <= payload["thinking_budget"]:
-                payload["max_tokens"] = payload["thinking_budget"] + 1024
+        key = None
+        if _use_cache(cache, temperature) and not stream:
+            key = _response_key(self._key_id, payload)
+            with _cache_lock:
+                cached = _response_cache.get(key)
+            if cached is not None:
+                logger.debug("LongCat API cache hit")
+                return _loads(cached)
 
         try:
-            logger.info(f"LongCat API request: model={model}, thinking={enable_thinking}")
+            logger.info("LongCat API request: model=%s, thinking=%s", model, enable_thinking)
             
-            response = requests.post(
-                url,
-                headers=headers,
-                json=payload,
-                timeout=60,  # 60s timeout for thinking mode
+            response = _post_with_retry(
+                self._url,
+                headers=self._headers,
+                data=_dumps(payload),
+                timeout=self._timeout(model, timeout),
             )
             response.raise_for_status()
             
-            result = response.json()
-            logger.info(f"LongCat API success: {result.get('usage', {})}")
+            result = _loads(response.content)
+            logger.info("LongCat API success: %s", result.get('usage', {}))
+            if key is not None:
+                with _cache_lock:
+                    _response_cache[key] = response.content
             return result
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"LongCat API error: {str(e)}")
+            logger.error("LongCat API error: %s", e)
             if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response: {e.response.text}")
+                logger.error("Response: %s", e.response.text)
             raise
 
     def chat_completion_stream(
@@ -122,6 +489,7 @@ class LongCatService:
         max_tokens: int = 2000,
         enable_thinking: bool = False,
         thinking_budget: int = 1024,
+        timeout: Optional[Tuple[float, float]] = None,
     ) -> Generator[str, None, None]:
         """
         Stream chat completion from LongCat API
@@ -135,52 +503,201 @@ class LongCatService:
         if not self.is_configured():
             raise ValueError("LongCat API key not configured")
 
-        url = f"{self.BASE_URL}/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "stream": True,
-        }
-
-        if model == self.THINKING_MODEL and enable_thinking:
-            payload["enable_thinking"] = True
-            payload["thinking_budget"] = max(thinking_budget, 1024)
-            if payload["max_tokens"] <= payload["thinking_budget"]:
-                payload["max_tokens"] = payload["thinking_budget"] + 1024
+        payload = self._build_payload(
+            messages, model, temperature, max_tokens, True, enable_thinking, thinking_budget
+        )
 
         try:
-            response = requests.post(
-                url,
-                headers=headers,
-                json=payload,
+            response = _post_with_retry(
+                self._url,
+                headers=self._headers,
+                data=_dumps(payload),
                 stream=True,
-                timeout=60,
+                timeout=self._timeout(model, timeout),
             )
-            response.raise_for_status()
+            try:
+                response.raise_for_status()
 
-            for line in response.iter_lines():
-                if line:
-                    decoded_line = line.decode('utf-8')
-                    if decoded_line.startswith('data: '):
-                        data = decoded_line[6:]  # Remove 'data: ' prefix
-                        if data.strip() != '[DONE]':
-                            yield data
+                parser = _SSEParser()
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    yield from parser.feed(chunk)
+                yield from parser.close()
+            finally:
+                response.close()
+                _llm_bulkhead.release()
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"LongCat streaming error: {str(e)}")
+            logger.error("LongCat streaming error: %s", e)
             raise
 
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = CHAT_MODEL,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        enable_thinking: bool = False,
+        thinking_budget: int = 1024,
+        timeout: Optional[Tuple[float, float]] = None,
+        cache: Optional[bool] = None,
+    ) -> Dict:
+        """
+        Async chat completion; does not block the event loop
+        
+        Args:
+            Same as chat_completion (without stream)
+            
+        Returns:
+            Response dict with 'choices', 'usage', etc.
+            
+        Raises:
+            ServiceUnavailableError: If the API call fails
+            RateLimitError: If rate limit is exceeded
+        """
+        if not self.is_configured():
+            raise ValueError("LongCat API key not configured")
+
+        payload = self._build_payload(
+            messages, model, temperature, max_tokens, False, enable_thinking, thinking_budget
+        )
+
+        key = None
+        if _use_cache(cache, temperature):
+            key = _response_key(self._key_id, payload)
+            with _cache_lock:
+                cached = _response_cache.get(key)
+            if cached is not None:
+                logger.debug("LongCat API cache hit")
+                return _loads(cached)
+
+        logger.info("LongCat API async request: model=%s, thinking=%s", model, enable_thinking)
+
+        # A full bulkhead is local backpressure, not an outage, so the slot
+        # is taken before the breaker sees the call
+        async with _llm_bulkhead:
+            probe = _breaker.before_call()
+            try:
+                result = await _get_async_client().make_request(
+                    method="POST",
+                    url=self._url,
+                    headers=self._headers,
+                    data=payload,
+                    service_name="LongCat API",
+                    timeout=self._timeout(model, timeout),
+                )
+            except BaseException as e:
+                if _is_outage(e):
+                    _breaker.record_failure()
+                elif probe:
+                    _breaker.release_probe()
+                raise
+            _breaker.record_success()
+
+        logger.info("LongCat API success: %s", result.get('usage', {}))
+        if key is not None:
+            body = _dumps(result)
+            with _cache_lock:
+                _response_cache[key] = body
+        return result
+
+    async def achat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = CHAT_MODEL,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        enable_thinking: bool = False,
+        thinking_budget: int = 1024,
+        timeout: Optional[Tuple[float, float]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async streaming chat completion
+        
+        Args:
+            Same as chat_completion
+            
+        Yields:
+            SSE data strings
+        """
+        if not self.is_configured():
+            raise ValueError("LongCat API key not configured")
+
+        payload = self._build_payload(
+            messages, model, temperature, max_tokens, True, enable_thinking, thinking_budget
+        )
+
+        parser = _SSEParser()
+        async with _llm_bulkhead:
+            probe = _breaker.before_call()
+            try:
+                async for chunk in _get_async_client().stream_request(
+                    method="POST",
+                    url=self._url,
+                    headers=self._headers,
+                    data=payload,
+                    service_name="LongCat API",
+                    timeout=self._timeout(model, timeout),
+                ):
+                    for data in parser.feed(chunk):
+                        yield data
+                for data in parser.close():
+                    yield data
+            except GeneratorExit:
+                # Consumer stopped reading; the connection itself worked
+                _breaker.record_success()
+                raise
+            except BaseException as e:
+                if _is_outage(e):
+                    _breaker.record_failure()
+                elif probe:
+                    _breaker.release_probe()
+                raise
+            _breaker.record_success()
+
+    async def abatch_chat_completion(
+        self,
+        message_batches: List[List[Dict[str, str]]],
+        max_concurrent: int = BATCH_CONCURRENCY,
+        **kwargs,
+    ) -> List[Union[Dict, Exception]]:
+        """
+        Run independent chat completions concurrently
+        
+        The prompts share the pooled connections and overlap their network
+        and prefill latency instead of running back to back.
+        
+        Args:
+            message_batches: One messages list per completion
+            max_concurrent: Maximum completions in flight at once
+            **kwargs: Passed to achat_completion (model, temperature, ...)
+            
+        Returns:
+            Results in input order; a failed completion is returned as its
+            exception so one bad prompt doesn't discard the others
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def bounded(messages):
+            async with semaphore:
+                return await self.achat_completion(messages, **kwargs)
+
+        return await asyncio.gather(
+            *(bounded(messages) for messages in message_batches),
+            return_exceptions=True,
+        )
+
+    async def aclose(self):
+        """Close the async HTTP session of the running event loop"""
+        if _async_client is not None:
+            await _async_client.close_session()
+
     def check_health(self) -> Dict:
         """
         Check LongCat API health and configuration
         
+        The outcome is cached per API key for HEALTH_CACHE_TTL seconds, so
+        frequent readiness probes don't each spend a request.
+        
         Returns:
             Dict with status information
         """
@@ -191,17 +708,45 @@ class LongCatService:
                 "message": "API key not configured"
             }
 
+        with _cache_lock:
+            health = _health_cache.get(self.api_key)
+        if health is None:
+            health = self._probe_health()
+            with _cache_lock:
+                _health_cache[self.api_key] = health
+        return dict(health)
+
+    def _probe_health(self) -> Dict:
+        """Check the configured key against the API"""
         try:
-            # Test with a simple request
-            result = self.chat_completion(
-                messages=[{"role": "user", "content": "Hi"}],
-                max_tokens=10,
+            # Listing models proves auth and connectivity without spending
+            # tokens or waiting on generation; no retries, fail fast
+            response = _get_session().get(
+                f"{self.BASE_URL}/models",
+                headers=self._headers,
+                timeout=self.HEALTH_TIMEOUT,
             )
             
+            if response.status_code == 401:
+                return {
+                    "configured": True,
+                    "valid": False,
+                    "message": "LongCat API key rejected"
+                }
+            if response.status_code != 200:
+                return {
+                    "configured": True,
+                    "valid": False,
+                    "error": f"HTTP {response.status_code}",
+                    "circuit": _breaker.state,
+                    "message": "LongCat API degraded"
+                }
+            
+            models = [m.get("id") for m in _loads(response.content).get("data", [])]
             return {
                 "configured": True,
                 "valid": True,
-                "model": result.get("model"),
+                "model": self.CHAT_MODEL if self.CHAT_MODEL in models else None,
                 "message": "LongCat API operational"
             }
 
@@ -210,5 +755,6 @@ class LongCatService:
                 "configured": True,
                 "valid": False,
                 "error": str(e),
+                "circuit": _breaker.state,
                 "message": "LongCat API error"
             }
@@ -7,8 +7,6 @@ import time
 from typing import Dict, Any, List, Tuple
 
 from ..agents.coordinator import CoordinatorAgent
-from ..agents.flight_agent import FlightAgent  
-from ..agents.hotel_agent import HotelAgent
 from ..services.session_service import SessionService
 from ..utils import get_agent_logger, sanitize_response_data
 from ..exceptions import LangGraphAgentError, AgentExecutionError
@@ -30,10 +28,12 @@ class OrchestrationService:
     
     def _initialize_agents(self, session_id: str):
         """Initialize agents with session_id"""
-        self.flight_agent = FlightAgent(session_id)
-        self.hotel_agent = HotelAgent(session_id)
         self.coordinator = CoordinatorAgent(session_id)
-        self.logger.info(f"✅ Agents initialized for session: {session_id}")
+        # The coordinator already owns session-bound flight/hotel agents;
+        # share them rather than building a second pair per workflow
+        self.flight_agent = self.coordinator.flight_agent
+        self.hotel_agent = self.coordinator.hotel_agent
+        self.logger.info("✅ Agents initialized for session: %s", session_id)
     
     async def execute_workflow(self, user_email: str, trip_params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -61,7 +61,7 @@ class OrchestrationService:
             self._initialize_agents(session_id)
             
             # Delegate entire workflow to coordinator
-            self.logger.info(f"🤖 Delegating workflow to coordinator for session: {session_id}")
+            self.logger.info("🤖 Delegating workflow to coordinator for session: %s", session_id)
             
             # Prepare input for coordinator
             coordinator_input = {
@@ -80,7 +80,7 @@ class OrchestrationService:
                 optimized_results
             )
             
-            self.logger.info(f"✅ LangGraph workflow completed successfully for session: {session_id}")
+            self.logger.info("✅ LangGraph workflow completed successfully for session: %s", session_id)
             
             return {
                 'success': True,
@@ -89,7 +89,7 @@ class OrchestrationService:
             }
             
         except Exception as e:
-            self.logger.error(f"❌ LangGraph workflow failed: {str(e)}")
+            self.logger.error("❌ LangGraph workflow failed: %s", e)
             
             if session_id:
                 await self.session_service.update_session_status(
@@ -134,7 +134,7 @@ class OrchestrationService:
                 execution_time_ms=execution_time
             )
             
-            self.logger.info(f"📋 Execution plan generated: {len(plan.get('parallel_tasks', []))} parallel tasks")
+            self.logger.info("📋 Execution plan generated: %s parallel tasks", len(plan.get('parallel_tasks', [])))
             
             return plan
             
@@ -168,7 +168,7 @@ class OrchestrationService:
             return coordinator_result
             
         except Exception as e:
-            self.logger.error(f"❌ Coordinator parallel execution failed: {str(e)}")
+            self.logger.error("❌ Coordinator parallel execution failed: %s", e)
             return {
                 'flights': None,
                 'hotels': None,
@@ -197,7 +197,7 @@ class OrchestrationService:
             )
             
             result = await self.flight_agent.search_flights(params)
-            sanitized_result = sanitize_response_data(result)
+            sanitized_result = sanitize_response_data(result, inplace=True)
             
             execution_time = int((time.time() - start_time) * 1000)
             
@@ -248,7 +248,7 @@ class OrchestrationService:
             )
             
             result = await self.hotel_agent.search_hotels(params)
-            sanitized_result = sanitize_response_data(result)
+            sanitized_result = sanitize_response_data(result, inplace=True)
             
             execution_time = int((time.time() - start_time) * 1000)
             
@@ -325,7 +325,7 @@ class OrchestrationService:
                 error_message=str(e)
             )
             
-            self.logger.error(f"❌ Results optimization failed: {str(e)}")
+            self.logger.error("❌ Results optimization failed: %s", e)
             
             # Return basic merged results as fallback
             return {
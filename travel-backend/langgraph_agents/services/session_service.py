@@ -2,10 +2,14 @@
 Session management service for LangGraph agents
 """
 
+import asyncio
+import time
 import uuid
-from typing import Dict, Any, Optional, List
-from datetime import datetime, date
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Any, Optional, List
+from datetime import date
 
+from django.db import close_old_connections
 from django.utils import timezone
 from asgiref.sync import sync_to_async
 
@@ -14,20 +18,119 @@ from ..utils import get_agent_logger, validate_trip_params
 from ..exceptions import DataValidationError, LangGraphAgentError
 
 
+class AgentLogBuffer:
+    """
+    Session-scoped buffer of AgentExecutionLog rows
+    
+    Agent executions append here instead of issuing one INSERT each; the
+    buffer is written with a single bulk_create when the session finishes,
+    fills up, or sits idle. Buffered rows get no primary key, which is fine
+    for append-only logs.
+    """
+    
+    BATCH_SIZE = 500
+    
+    # Service-level names -> AgentExecutionLog choices
+    AGENT_TYPES = {
+        'CoordinatorAgent': 'coordinator',
+        'FlightAgent': 'flight',
+        'HotelAgent': 'hotel',
+    }
+    STATUSES = {
+        'started': 'running',
+        'success': 'completed',
+    }
+    
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self._pending: List[AgentExecutionLog] = []
+        self.updated = time.monotonic()
+    
+    def __len__(self) -> int:
+        return len(self._pending)
+    
+    def add(
+        self,
+        agent_type: str,
+        status: str,
+        input_data: Dict[str, Any] = None,
+        output_data: Dict[str, Any] = None,
+        error_message: str = None,
+        execution_time_ms: int = None
+    ):
+        """Queue one execution log row"""
+        status = self.STATUSES.get(status, status)
+        now = timezone.now()
+        self.updated = time.monotonic()
+        self._pending.append(AgentExecutionLog(
+            agent_type=self.AGENT_TYPES.get(agent_type, agent_type),
+            status=status,
+            input_data=input_data or {},
+            output_data=output_data or {},
+            error_message=error_message,
+            execution_time_ms=execution_time_ms,
+            started_at=now,
+            completed_at=now if status in ('completed', 'failed') else None,
+        ))
+    
+    def flush(self) -> int:
+        """Write all queued rows in one bulk INSERT (per 500 rows)"""
+        if not self._pending:
+            return 0
+        
+        pending, self._pending = self._pending, []
+        session_pk = TravelPlanningSession.objects.values_list('pk', flat=True).get(
+            session_id=self.session_id
+        )
+        for log in pending:
+            log.session_id = session_pk
+        
+        AgentExecutionLog.objects.bulk_create(pending, batch_size=self.BATCH_SIZE)
+        return len(pending)
+
+
+# Agent logs are diagnostic, so requests don't wait on writing them. One
+# worker thread writes them in arrival order; it outlives the per-request
+# event loops, and as a single writer it keeps log bursts from competing
+# with request queries for DB connections.
+_log_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='agent-log-writer')
+
+
+def _write_logs(buffer: AgentLogBuffer) -> int:
+    """Flush a log buffer on the writer thread's own DB connection"""
+    close_old_connections()
+    try:
+        return buffer.flush()
+    finally:
+        close_old_connections()
+
+
 class SessionService:
     """
     Service for managing LangGraph session lifecycle
     """
     
+    # Rows fetched per round trip when streaming session logs
+    LOG_CHUNK_SIZE = 200
+    
+    # Buffers of sessions that never finish (crashed workflows, lost
+    # status updates) are flushed once idle this long, checked at most
+    # every LOG_SWEEP_INTERVAL seconds
+    LOG_BUFFER_IDLE_SECONDS = 600
+    LOG_SWEEP_INTERVAL = 60
+    
     def __init__(self):
         self.logger = get_agent_logger("SessionService")
+        self._log_buffers: Dict[str, AgentLogBuffer] = {}
+        self._last_log_sweep = time.monotonic()
     
     def _parse_date(self, date_str: str) -> date:
         """Parse date string in YYYY-MM-DD format"""
         if isinstance(date_str, date):
             return date_str
         try:
-            return datetime.strptime(date_str, '%Y-%m-%d').date()
+            # C-level ISO parser; strptime re-parses its format on every call
+            return date.fromisoformat(date_str)
         except (ValueError, TypeError):
             # Fallback to today's date if parsing fails
             return timezone.now().date()
@@ -48,7 +151,7 @@ class SessionService:
             LangGraphAgentError: If session creation fails
         """
         try:
-            self.logger.info(f"🔄 Creating session for user: {user_email}")
+            self.logger.info("🔄 Creating session for user: %s", user_email)
             
             # Validate parameters
             validated_params = validate_trip_params(trip_params)
@@ -68,11 +171,11 @@ class SessionService:
                 status='pending'
             )
             
-            self.logger.info(f"✅ Session created: {session_id}")
+            self.logger.info("✅ Session created: %s", session_id)
             return session_id
             
         except Exception as e:
-            self.logger.error(f"❌ Session creation failed: {str(e)}")
+            self.logger.error("❌ Session creation failed: %s", e)
             raise LangGraphAgentError(f"Failed to create session: {str(e)}")
     
     async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -101,10 +204,10 @@ class SessionService:
             }
             
         except TravelPlanningSession.DoesNotExist:
-            self.logger.warning(f"Session not found: {session_id}")
+            self.logger.warning("Session not found: %s", session_id)
             return None
         except Exception as e:
-            self.logger.error(f"❌ Error getting session {session_id}: {str(e)}")
+            self.logger.error("❌ Error getting session %s: %s", session_id, e)
             return None
     
     async def update_session_status(self, session_id: str, status: str, results: Dict[str, Any] = None):
@@ -114,26 +217,31 @@ class SessionService:
         Args:
             session_id: Session identifier
             status: New status ('active', 'completed', 'failed')
-            results: Optional results data
+            results: Optional results data (not stored - the session
+                model has no results column)
         """
         try:
-            session = await sync_to_async(
-                TravelPlanningSession.objects.get
-            )(session_id=session_id)
+            fields = {'status': status}
+            if status in ('completed', 'failed'):
+                fields['completed_at'] = timezone.now()
             
-            session.status = status
-            if results:
-                session.results = results
-            session.updated_at = timezone.now()
+            # Single UPDATE, no SELECT of the row first
+            updated = await sync_to_async(
+                TravelPlanningSession.objects.filter(session_id=session_id).update
+            )(**fields)
+            if not updated:
+                self.logger.error("❌ Session not found for update: %s", session_id)
+                self._log_buffers.pop(session_id, None)
+                return
             
-            await sync_to_async(session.save)()
+            self.logger.info("✅ Session %s updated to status: %s", session_id, status)
             
-            self.logger.info(f"✅ Session {session_id} updated to status: {status}")
+            # Session finished - write its buffered agent logs
+            if status in ('completed', 'failed'):
+                await self.flush_agent_logs(session_id)
             
-        except TravelPlanningSession.DoesNotExist:
-            self.logger.error(f"❌ Session not found for update: {session_id}")
         except Exception as e:
-            self.logger.error(f"❌ Error updating session {session_id}: {str(e)}")
+            self.logger.error("❌ Error updating session %s: %s", session_id, e)
     
     async def log_agent_execution(
         self, 
@@ -148,6 +256,12 @@ class SessionService:
         """
         Log agent execution details
         
+        Rows are buffered per session and written in the background by
+        flush_agent_logs, so agents never wait on log I/O. A buffer is
+        flushed when its session completes or fails, when it reaches
+        AgentLogBuffer.BATCH_SIZE rows, or after LOG_BUFFER_IDLE_SECONDS
+        without new rows.
+        
         Args:
             session_id: Session identifier
             agent_type: Type of agent (e.g., 'FlightAgent', 'HotelAgent')
@@ -158,21 +272,119 @@ class SessionService:
             execution_time_ms: Execution time in milliseconds
         """
         try:
-            await sync_to_async(AgentExecutionLog.objects.create)(
-                session_id=session_id,
-                agent_type=agent_type,
-                status=status,
-                input_data=input_data or {},
-                output_data=output_data or {},
+            buffer = self._log_buffers.get(session_id)
+            if buffer is None:
+                buffer = self._log_buffers[session_id] = AgentLogBuffer(session_id)
+            
+            buffer.add(
+                agent_type,
+                status,
+                input_data=input_data,
+                output_data=output_data,
                 error_message=error_message,
-                execution_time_ms=execution_time_ms,
-                executed_at=timezone.now()
+                execution_time_ms=execution_time_ms
             )
             
-            self.logger.debug(f"📝 Agent execution logged: {agent_type} - {status}")
+            self.logger.debug("📝 Agent execution logged: %s - %s", agent_type, status)
+            
+            if len(buffer) >= AgentLogBuffer.BATCH_SIZE:
+                await self.flush_agent_logs(session_id)
+            await self.flush_idle_agent_logs()
             
         except Exception as e:
-            self.logger.error(f"❌ Error logging agent execution: {str(e)}")
+            self.logger.error("❌ Error logging agent execution: %s", e)
+    
+    async def flush_agent_logs(self, session_id: str) -> Optional[Future]:
+        """
+        Hand a session's buffered agent logs to the background writer
+        
+        Returns immediately; the rows are written with one bulk insert on
+        the log writer thread.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Future resolving to the number of rows written, or None if
+            nothing was buffered
+        """
+        buffer = self._log_buffers.pop(session_id, None)
+        if not buffer:
+            return None
+        
+        def done(future: Future):
+            try:
+                written = future.result()
+                self.logger.debug("📝 Flushed %s agent logs for session %s", written, session_id)
+            except Exception as e:
+                self.logger.error("❌ Error flushing agent logs for %s: %s", session_id, e)
+        
+        future = _log_writer.submit(_write_logs, buffer)
+        future.add_done_callback(done)
+        return future
+    
+    async def flush_idle_agent_logs(self, force: bool = False) -> List[Future]:
+        """
+        Flush the buffers of sessions idle for LOG_BUFFER_IDLE_SECONDS
+        
+        Args:
+            force: Sweep now, even if the last sweep was under
+                LOG_SWEEP_INTERVAL seconds ago
+            
+        Returns:
+            Futures of the flushes started
+        """
+        now = time.monotonic()
+        if not force and now - self._last_log_sweep < self.LOG_SWEEP_INTERVAL:
+            return []
+        self._last_log_sweep = now
+        
+        idle = [
+            session_id for session_id, buffer in self._log_buffers.items()
+            if now - buffer.updated >= self.LOG_BUFFER_IDLE_SECONDS
+        ]
+        futures = []
+        for session_id in idle:
+            self.logger.warning("⚠️ Flushing agent logs of idle session %s", session_id)
+            future = await self.flush_agent_logs(session_id)
+            if future is not None:
+                futures.append(future)
+        return futures
+    
+    async def iter_session_logs(self, session_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield a session's agent execution logs in execution order
+        
+        Rows are fetched LOG_CHUNK_SIZE at a time and converted one by one,
+        so long sessions never hold the whole result set in memory.
+        
+        Args:
+            session_id: Session identifier
+            
+        Yields:
+            Execution log dicts
+        """
+        # Served by idx_session_started; skips the unused id/completed_at columns
+        logs = (
+            AgentExecutionLog.objects
+            .filter(session__session_id=session_id)
+            .order_by('started_at')
+            .only(
+                'agent_type', 'status', 'input_data', 'output_data',
+                'error_message', 'execution_time_ms', 'started_at'
+            )
+        )
+        
+        async for log in logs.aiterator(chunk_size=self.LOG_CHUNK_SIZE):
+            yield {
+                'agent_type': log.agent_type,
+                'status': log.status,
+                'input_data': log.input_data,
+                'output_data': log.output_data,
+                'error_message': log.error_message,
+                'execution_time_ms': log.execution_time_ms,
+                'executed_at': log.started_at.isoformat()
+            }
     
     async def get_session_logs(self, session_id: str) -> List[Dict[str, Any]]:
         """
@@ -185,25 +397,10 @@ class SessionService:
             List of execution logs
         """
         try:
-            logs = await sync_to_async(list)(
-                AgentExecutionLog.objects.filter(session_id=session_id).order_by('executed_at')
-            )
-            
-            return [
-                {
-                    'agent_type': log.agent_type,
-                    'status': log.status,
-                    'input_data': log.input_data,
-                    'output_data': log.output_data,
-                    'error_message': log.error_message,
-                    'execution_time_ms': log.execution_time_ms,
-                    'executed_at': log.executed_at.isoformat()
-                }
-                for log in logs
-            ]
+            return [log async for log in self.iter_session_logs(session_id)]
             
         except Exception as e:
-            self.logger.error(f"❌ Error getting session logs: {str(e)}")
+            self.logger.error("❌ Error getting session logs: %s", e)
             return []
     
     async def cleanup_old_sessions(self, days_old: int = 7):
@@ -214,25 +411,26 @@ class SessionService:
             days_old: Remove sessions older than this many days
         """
         try:
-            cutoff_date = timezone.now() - timezone.timedelta(days=days_old)
+            # Write abandoned sessions' logs first, so they're cleaned up
+            # with their sessions instead of racing the deletes below
+            flushes = await self.flush_idle_agent_logs(force=True)
+            if flushes:
+                await asyncio.wait([asyncio.wrap_future(future) for future in flushes])
             
-            # Get old sessions
-            old_sessions = await sync_to_async(list)(
-                TravelPlanningSession.objects.filter(created_at__lt=cutoff_date)
-            )
+            cutoff_date = timezone.now() - timezone.timedelta(days=days_old)
             
-            # Delete logs first (due to foreign key)
-            for session in old_sessions:
-                await sync_to_async(
-                    AgentExecutionLog.objects.filter(session_id=session.session_id).delete
-                )()
+            # Delete logs first, all old sessions' rows in one statement,
+            # so the session delete below has no log rows left to cascade
+            await sync_to_async(
+                AgentExecutionLog.objects.filter(session__created_at__lt=cutoff_date).delete
+            )()
             
             # Delete sessions
             deleted_count = await sync_to_async(
                 TravelPlanningSession.objects.filter(created_at__lt=cutoff_date).delete
             )()
             
-            self.logger.info(f"🧹 Cleaned up {deleted_count[0]} old sessions")
+            self.logger.info("🧹 Cleaned up %s old sessions", deleted_count[0])
             
         except Exception as e:
-            self.logger.error(f"❌ Error cleaning up old sessions: {str(e)}")
\ No newline at end of file
+            self.logger.error("❌ Error cleaning up old sessions: %s", e)
\ No newline at end of file
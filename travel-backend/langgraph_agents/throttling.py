@@ -3,59 +3,230 @@
 Custom throttling classes for LangGraph API endpoints
 Prevents abuse and ensures fair usage
 """
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
+from rest_framework.throttling import SimpleRateThrottle, UserRateThrottle, AnonRateThrottle
 from django.core.cache import cache
 import time
 
+try:
+    from django_redis import get_redis_connection
+    DJANGO_REDIS_AVAILABLE = True
+except ImportError:
+    DJANGO_REDIS_AVAILABLE = False
 
-class TripGenerationThrottle(UserRateThrottle):
+
+# Sliding-window check-and-increment in one round trip
+# KEYS: current window bucket, previous window bucket
+# ARGV: limit, window seconds, elapsed fraction of the current window
+# Returns {allowed, weighted count}
+SLIDING_WINDOW_LUA = """
+local curr = tonumber(redis.call('GET', KEYS[1]) or '0')
+local prev = tonumber(redis.call('GET', KEYS[2]) or '0')
+local weighted = prev * (1 - tonumber(ARGV[3])) + curr
+if weighted + 1 > tonumber(ARGV[1]) then
+    return {0, math.ceil(weighted)}
+end
+if redis.call('INCR', KEYS[1]) == 1 then
+    redis.call('EXPIRE', KEYS[1], 2 * tonumber(ARGV[2]))
+end
+return {1, math.ceil(weighted + 1)}
+"""
+
+_sliding_window_script = None
+
+
+def _redis_connection():
+    """Raw Redis connection when the cache runs on django-redis, else None"""
+    if not DJANGO_REDIS_AVAILABLE:
+        return None
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        # Configured cache backend is not django-redis
+        return None
+
+
+def _get_sliding_window_script(conn):
+    """Sliding-window script registered on conn (EVALSHA after the first call)"""
+    global _sliding_window_script
+    if _sliding_window_script is None or _sliding_window_script.registered_client is not conn:
+        _sliding_window_script = conn.register_script(SLIDING_WINDOW_LUA)
+    return _sliding_window_script
+
+
+class SlidingWindowThrottleMixin:
     """
-    Rate limiting for trip generation endpoint
-    Authenticated users: 20 requests per hour (increased for development)
-    Anonymous users: 10 requests per hour
+    Sliding-window counter in place of DRF's timestamp history
+    
+    SimpleRateThrottle keeps a list of every request time in the cache and
+    reads, trims and rewrites it on each call. Here each window is a single
+    counter; the count in the last `duration` seconds is estimated as the
+    current window's count plus the previous window's, weighted by how
+    much of it still overlaps. O(1) per request, one EVAL on Redis.
     """
-    scope = 'trip_generation'
     
-    # Override default rates
-    rate = '20/hour'  # Increased for development/testing
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        
+        self.now = self.timer()
+        window = self.duration
+        bucket = int(self.now // window)
+        elapsed = (self.now % window) / window
+        self.window_end = (bucket + 1) * window
+        
+        current_key = f"{self.key}:{bucket}"
+        previous_key = f"{self.key}:{bucket - 1}"
+        
+        conn = _redis_connection()
+        if conn is not None:
+            # Versioned, prefixed keys, as the cache API itself would write
+            allowed, _ = _get_sliding_window_script(conn)(
+                keys=[self.cache.make_key(current_key), self.cache.make_key(previous_key)],
+                args=[self.num_requests, window, elapsed]
+            )
+            return bool(allowed)
+        
+        return self._allow_with_cache(current_key, previous_key, elapsed)
     
-    def get_cache_key(self, request, view):
-        """
-        Custom cache key based on user email or IP
-        """
-        # Try to get user email from request data
-        user_email = request.data.get('userEmail') or request.data.get('user_email')
+    def _allow_with_cache(self, current_key, previous_key, elapsed):
+        """Same check on the Django cache: count, then back out if over the limit"""
+        previous = self.cache.get(previous_key, 0)
+        self.cache.add(current_key, 0, 2 * self.duration)
+        try:
+            current = self.cache.incr(current_key)
+        except ValueError:
+            # Expired between add and incr
+            self.cache.set(current_key, 1, 2 * self.duration)
+            current = 1
         
-        if user_email:
-            # Use email as cache key for authenticated requests
-            ident = user_email
-        else:
-            # Fall back to IP for anonymous requests
-            ident = self.get_ident(request)
-            
-        return self.cache_format % {
-            'scope': self.scope,
-            'ident': ident
-        }
+        if previous * (1 - elapsed) + current > self.num_requests:
+            self.cache.decr(current_key)
+            return False
+        return True
+    
+    def wait(self):
+        """Seconds until the current window rolls over"""
+        return max(self.window_end - self.now, 0)
+
+
+class FixedWindowThrottleMixin:
+    """
+    Plain counter per fixed window, for short burst limits
+    
+    One cache.incr per request in the steady state; the key is created
+    on the window's first request and expires on its own.
+    """
     
     def allow_request(self, request, view):
-        """
-        Check if request is allowed under current rate limit
-        """
-        # Get user email to check if authenticated
-        user_email = request.data.get('userEmail') or request.data.get('user_email')
+        if self.rate is None:
+            return True
         
-        if not user_email:
-            # Anonymous users get stricter limit
-            self.rate = '10/hour'  # Increased for development
-        else:
-            # Authenticated users get standard limit
-            self.rate = '20/hour'  # Increased for development
-            
-        return super().allow_request(request, view)
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        
+        self.now = self.timer()
+        bucket = int(self.now // self.duration)
+        self.window_end = (bucket + 1) * self.duration
+        key = f"{self.key}:{bucket}"
+        
+        try:
+            count = self.cache.incr(key)
+        except ValueError:
+            # First request of the window, unless another worker just created it
+            if self.cache.add(key, 1, 2 * self.duration):
+                count = 1
+            else:
+                count = self.cache.incr(key)
+        
+        return count <= self.num_requests
+    
+    def wait(self):
+        """Seconds until the current window rolls over"""
+        return max(self.window_end - self.now, 0)
 
 
-class HealthCheckThrottle(AnonRateThrottle):
+class ParsedRateMixin:
+    """
+    Parse `rate` once, when the throttle class is defined
+    
+    DRF parses the rate string in __init__, and throttles are instantiated
+    on every request.
+    """
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, 'rate', None):
+            cls.num_requests, cls.duration = SimpleRateThrottle.parse_rate(cls, cls.rate)
+    
+    def __init__(self):
+        if getattr(self, 'num_requests', None) is None:
+            # No class-level rate: fall back to DEFAULT_THROTTLE_RATES
+            super().__init__()
+
+
+class TripIdentMixin:
+    """
+    Identify trip requests by the submitted email, falling back to client IP
+    
+    The email is looked up in request.data once per request and memoized
+    on the request, so every trip throttle shares the same lookup.
+    """
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._key_prefix = f"throttle_{cls.scope}_"
+    
+    def _resolve_email(self, request):
+        """Email from the request body, or None"""
+        try:
+            return request._trip_throttle_email
+        except AttributeError:
+            email = request.data.get('userEmail') or request.data.get('user_email')
+            request._trip_throttle_email = email
+            return email
+    
+    def _resolve_ident(self, request):
+        """Cache identity: email for authenticated requests, else client IP"""
+        return self._resolve_email(request) or self.get_ident(request)
+    
+    def get_cache_key(self, request, view):
+        return self._key_prefix + self._resolve_ident(request)
+
+
+class AuthenticatedTripThrottle(TripIdentMixin, SlidingWindowThrottleMixin, ParsedRateMixin, UserRateThrottle):
+    """
+    Rate limiting for trip generation requests that carry a user email
+    20 requests per hour (increased for development/testing)
+    """
+    scope = 'trip_generation_user'
+    rate = '20/hour'
+    
+    def get_cache_key(self, request, view):
+        if not self._resolve_email(request):
+            return None  # AnonTripThrottle's request
+        return super().get_cache_key(request, view)
+
+
+class AnonTripThrottle(TripIdentMixin, SlidingWindowThrottleMixin, ParsedRateMixin, UserRateThrottle):
+    """
+    Rate limiting for trip generation requests without a user email, by IP
+    Stricter: 10 requests per hour (increased for development/testing)
+    """
+    scope = 'trip_generation_anon'
+    rate = '10/hour'
+    
+    def get_cache_key(self, request, view):
+        if self._resolve_email(request):
+            return None  # AuthenticatedTripThrottle's request
+        return super().get_cache_key(request, view)
+
+
+class HealthCheckThrottle(ParsedRateMixin, AnonRateThrottle):
     """
     Rate limiting for health check endpoint
     Much more permissive since it's read-only
@@ -64,7 +235,7 @@ class HealthCheckThrottle(AnonRateThrottle):
     rate = '60/minute'
 
 
-class SessionStatusThrottle(UserRateThrottle):
+class SessionStatusThrottle(ParsedRateMixin, UserRateThrottle):
     """
     Rate limiting for session status endpoint
     """
@@ -72,24 +243,10 @@ class SessionStatusThrottle(UserRateThrottle):
     rate = '30/minute'
 
 
-class BurstTripGenerationThrottle(UserRateThrottle):
+class BurstTripGenerationThrottle(TripIdentMixin, FixedWindowThrottleMixin, ParsedRateMixin, UserRateThrottle):
     """
     Additional burst protection for trip generation
     Prevents rapid-fire requests within short timeframe
     """
     scope = 'trip_generation_burst'
     rate = '10/minute'  # Max 10 requests per minute (increased for development/testing)
-    
-    def get_cache_key(self, request, view):
-        """Use same cache key format as TripGenerationThrottle"""
-        user_email = request.data.get('userEmail') or request.data.get('user_email')
-        
-        if user_email:
-            ident = user_email
-        else:
-            ident = self.get_ident(request)
-            
-        return self.cache_format % {
-            'scope': self.scope,
-            'ident': ident
-        }
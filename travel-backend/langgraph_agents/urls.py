@@ -9,9 +9,12 @@ from .views_longcat import longcat_chat, longcat_health
 
 app_name = 'langgraph_agents'
 
+# Served at both execute/ and the legacy orchestrate/ route
+travel_planner_view = views.LangGraphTravelPlannerView.as_view()
+
 urlpatterns = [
     # Main execution endpoint
-    path('execute/', views.LangGraphTravelPlannerView.as_view(), name='execute'),
+    path('execute/', travel_planner_view, name='execute'),
     
     # Session management
     path('session/<str:session_id>/', views.LangGraphSessionStatusView.as_view(), name='session_status'),
@@ -42,5 +45,5 @@ urlpatterns = [
     path('health/ping/', QuickHealthView.as_view(), name='health_ping'),
     
     # Legacy endpoint for backwards compatibility
-    path('orchestrate/', views.LangGraphTravelPlannerView.as_view(), name='orchestrate'),
+    path('orchestrate/', travel_planner_view, name='orchestrate'),
 ]
\ No newline at end of file
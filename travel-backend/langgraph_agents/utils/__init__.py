@@ -5,6 +5,7 @@ Utilities for LangGraph agents
 from .logger import setup_logger, get_agent_logger, AgentLoggerMixin
 from .validators import validate_trip_params, validate_coordinates, sanitize_response_data, validate_email
 from .formatters import format_price_range, format_hotel_response, format_flight_response
+from .bulkhead import Bulkhead
 
 __all__ = [
     'setup_logger',
@@ -16,5 +17,6 @@ __all__ = [
     'validate_email',
     'format_price_range',
     'format_hotel_response',
-    'format_flight_response'
+    'format_flight_response',
+    'Bulkhead'
 ]
\ No newline at end of file
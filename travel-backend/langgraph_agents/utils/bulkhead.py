@@ -0,0 +1,133 @@
+"""
+Concurrency limits that isolate one dependency's load from the rest
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Optional, Union
+
+from ..exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+
+class Bulkhead:
+    """
+    Cap on concurrent calls, shared across threads and event loops
+
+    Views run each request on its own event loop, so an asyncio.Semaphore
+    would only bound a single request. Slots are counted under a threading
+    lock instead and handed to waiters in arrival order: sync callers block
+    on an event, async callers await a future that is resolved on their own
+    loop. A caller still waiting after timeout seconds gets
+    ServiceUnavailableError rather than queueing forever.
+
+    Usable as `with bulkhead:` in sync code and `async with bulkhead:`
+    in coroutines, or through acquire()/release() when a slot has to
+    outlive a block.
+    """
+
+    DEFAULT_TIMEOUT = 60.0
+
+    def __init__(self, name: str, limit: int, timeout: float = DEFAULT_TIMEOUT):
+        self.name = name
+        self.limit = limit
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._available = limit
+        self._waiters = deque()
+
+    def _take_or_enqueue(self, waiter: Union[threading.Event, asyncio.Future]) -> bool:
+        """Take a free slot, or queue waiter for the next one; True if taken"""
+        with self._lock:
+            if self._available and not self._waiters:
+                self._available -= 1
+                return True
+            self._waiters.append(waiter)
+        logger.debug("⏳ %s at %s concurrent calls, waiting for a slot", self.name, self.limit)
+        return False
+
+    def _dequeue(self, waiter: Union[threading.Event, asyncio.Future]) -> bool:
+        """Withdraw a waiter that gave up; False if it was already handed a slot"""
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+                return True
+            except ValueError:
+                return False
+
+    def _wake(self, future: asyncio.Future):
+        """Give a slot to an async waiter, on its own loop"""
+        if future.done():
+            # Cancelled or timed out after the slot was handed over
+            self.release()
+        else:
+            future.set_result(None)
+
+    def _timed_out(self) -> ServiceUnavailableError:
+        logger.warning("⛔ %s: no slot free after %ss", self.name, self.timeout)
+        return ServiceUnavailableError(self.name)
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Take a slot, blocking the calling thread
+
+        Raises:
+            ServiceUnavailableError: If no slot frees up within timeout
+                seconds (default: the bulkhead's timeout)
+        """
+        waiter = threading.Event()
+        if self._take_or_enqueue(waiter):
+            return
+
+        if not waiter.wait(self.timeout if timeout is None else timeout) and self._dequeue(waiter):
+            raise self._timed_out()
+
+    async def aacquire(self, timeout: Optional[float] = None):
+        """Take a slot without blocking the event loop; raises like acquire"""
+        future = asyncio.get_running_loop().create_future()
+        if self._take_or_enqueue(future):
+            return
+
+        try:
+            await asyncio.wait_for(future, self.timeout if timeout is None else timeout)
+        except BaseException as e:
+            future.cancel()
+            if not self._dequeue(future) and not future.cancelled():
+                # Handed a slot just as we gave up
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                raise self._timed_out() from None
+            raise
+
+    def release(self):
+        """Return a slot, handing it straight to the longest waiting caller"""
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if isinstance(waiter, threading.Event):
+                    waiter.set()
+                    return
+                try:
+                    waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+                    return
+                except RuntimeError:
+                    # Waiter's loop is closed; try the next one
+                    continue
+            self._available += 1
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    async def __aenter__(self):
+        await self.aacquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.release()
@@ -2,8 +2,40 @@
 Response formatting utilities for LangGraph agents
 """
 
-from typing import Dict, Any, List, Optional
-from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
+
+from django.utils import timezone
+
+# "2h 30m" -> "2  30 ": unit letters become separators in one pass
+_DURATION_TABLE = str.maketrans('hm', '  ')
+
+# Google Places price level (0-4) -> display text
+_PRICE_RANGE_TEXT = (
+    "Budget (₱1,000-2,500)",
+    "Budget (₱1,000-2,500)",
+    "Mid-range (₱2,500-5,000)",
+    "Upscale (₱5,000-10,000)",
+    "Luxury (₱10,000+)"
+)
+
+# Amenity -> Google Places types that imply it, in display order
+_AMENITY_TYPES = (
+    ('Spa', frozenset({'spa'})),
+    ('Gym', frozenset({'gym'})),
+    ('Restaurant', frozenset({'restaurant', 'food'})),
+    ('Bar', frozenset({'bar'}))
+)
+
+_STANDARD_AMENITIES = ('Free WiFi', 'Air Conditioning', '24h Reception')
+
+# Upper bounds (exclusive) of the average flight price for each level
+_PRICE_LEVELS = ((10000, "low"), (25000, "typical"), (50000, "high"))
+
+# Fields the analysis scans read; always present on formatted results
+_HOTEL_ANALYSIS_FIELDS = itemgetter('rating', 'price_level')
+_FLIGHT_ANALYSIS_FIELDS = itemgetter('price', 'value_score', 'duration')
 
 
 def format_price_range(min_price: float, max_price: float, currency: str = "₱") -> str:
@@ -18,10 +50,11 @@ def format_price_range(min_price: float, max_price: float, currency: str = "₱"
     Returns:
         Formatted price range string
     """
+    low = f"{currency}{min_price:,.0f}"
     if min_price == max_price:
-        return f"{currency}{min_price:,.0f}"
+        return low
     
-    return f"{currency}{min_price:,.0f} - {currency}{max_price:,.0f}"
+    return f"{low} - {currency}{max_price:,.0f}"
 
 
 def format_hotel_response(hotels: List[Dict[str, Any]], location: str) -> Dict[str, Any]:
@@ -35,29 +68,7 @@ def format_hotel_response(hotels: List[Dict[str, Any]], location: str) -> Dict[s
     Returns:
         Formatted hotel response
     """
-    formatted_hotels = []
-    
-    for hotel in hotels[:10]:  # Limit to top 10
-        formatted_hotel = {
-            'name': hotel.get('name', 'Unknown Hotel'),
-            'address': hotel.get('vicinity') or hotel.get('formatted_address', location),
-            'rating': round(hotel.get('rating', 0), 1),
-            'price_level': hotel.get('price_level', 0),
-            'price_range': _get_price_range_text(hotel.get('price_level', 0)),
-            'distance_from_center': hotel.get('distance_km', 0),
-            'amenities': _extract_amenities(hotel),
-            'photo_url': hotel.get('photo'),
-            'place_id': hotel.get('place_id'),
-            'coordinates': {
-                'latitude': hotel.get('geometry', {}).get('location', {}).get('lat', 0),
-                'longitude': hotel.get('geometry', {}).get('location', {}).get('lng', 0)
-            }
-        }
-        
-        # Add recommendation level
-        formatted_hotel['recommendation_level'] = _calculate_recommendation_level(hotel)
-        
-        formatted_hotels.append(formatted_hotel)
+    formatted_hotels = [_format_hotel(hotel, location) for hotel in hotels[:10]]  # Limit to top 10
     
     return {
         'success': True,
@@ -65,11 +76,7 @@ def format_hotel_response(hotels: List[Dict[str, Any]], location: str) -> Dict[s
         'hotels': formatted_hotels,
         'total_found': len(hotels),
         'search_timestamp': _get_current_timestamp(),
-        'langgraph_analysis': {
-            'top_rated': _find_top_rated(formatted_hotels),
-            'best_value': _find_best_value(formatted_hotels),
-            'luxury_options': _find_luxury_options(formatted_hotels)
-        }
+        'langgraph_analysis': _analyze_hotels(formatted_hotels)
     }
 
 
@@ -84,76 +91,84 @@ def format_flight_response(flights: List[Dict[str, Any]], search_params: Dict[st
     Returns:
         Formatted flight response
     """
-    formatted_flights = []
-    
-    for flight in flights[:20]:  # Limit to top 20
-        formatted_flight = {
-            'airline': flight.get('airline', 'Unknown Airline'),
-            'flight_number': flight.get('flight_number'),
-            'departure_time': flight.get('departure_time'),
-            'arrival_time': flight.get('arrival_time'),
-            'duration': flight.get('duration'),
-            'price': flight.get('price', 0),
-            'currency': flight.get('currency', 'PHP'),
-            'stops': flight.get('stops', 0),
-            'aircraft': flight.get('aircraft'),
-            'departure_airport': flight.get('departure_airport'),
-            'arrival_airport': flight.get('arrival_airport'),
-            'booking_link': flight.get('booking_link'),
-            'carbon_emissions': flight.get('carbon_emissions')
-        }
-        
-        # Calculate value score
-        formatted_flight['value_score'] = _calculate_flight_value_score(flight)
-        
-        formatted_flights.append(formatted_flight)
+    formatted_flights = [_format_flight(flight) for flight in flights[:20]]  # Limit to top 20
+    analysis, avg_price = _analyze_flights(formatted_flights)
     
     return {
         'success': True,
         'flights': formatted_flights,
         'search_params': search_params,
-        'current_price': _determine_price_level(formatted_flights),
+        'current_price': _determine_price_level(avg_price),
         'total_found': len(flights),
         'search_timestamp': _get_current_timestamp(),
-        'langgraph_analysis': {
-            'cheapest_flight': _find_cheapest_flight(formatted_flights),
-            'best_value': _find_best_value_flight(formatted_flights),
-            'fastest_flight': _find_fastest_flight(formatted_flights),
-            'recommended': _get_recommended_flight(formatted_flights)
-        }
+        'langgraph_analysis': analysis
+    }
+
+
+def _format_hotel(hotel: Dict[str, Any], location: str) -> Dict[str, Any]:
+    """Format one hotel result"""
+    get = hotel.get
+    price_level = get('price_level', 0)
+    coordinates = (get('geometry') or {}).get('location') or {}
+    
+    return {
+        'name': get('name', 'Unknown Hotel'),
+        'address': get('vicinity') or get('formatted_address', location),
+        'rating': round(get('rating', 0), 1),
+        'price_level': price_level,
+        'price_range': _get_price_range_text(price_level),
+        'distance_from_center': get('distance_km', 0),
+        'amenities': _extract_amenities(hotel),
+        'photo_url': get('photo'),
+        'place_id': get('place_id'),
+        'coordinates': {
+            'latitude': coordinates.get('lat', 0),
+            'longitude': coordinates.get('lng', 0)
+        },
+        'recommendation_level': _calculate_recommendation_level(hotel)
+    }
+
+
+def _format_flight(flight: Dict[str, Any]) -> Dict[str, Any]:
+    """Format one flight result"""
+    get = flight.get
+    
+    return {
+        'airline': get('airline', 'Unknown Airline'),
+        'flight_number': get('flight_number'),
+        'departure_time': get('departure_time'),
+        'arrival_time': get('arrival_time'),
+        'duration': get('duration'),
+        'price': get('price', 0),
+        'currency': get('currency', 'PHP'),
+        'stops': get('stops', 0),
+        'aircraft': get('aircraft'),
+        'departure_airport': get('departure_airport'),
+        'arrival_airport': get('arrival_airport'),
+        'booking_link': get('booking_link'),
+        'carbon_emissions': get('carbon_emissions'),
+        'value_score': _calculate_flight_value_score(flight)
     }
 
 
 def _get_price_range_text(price_level: int) -> str:
     """Convert Google Places price level to readable text"""
-    price_ranges = {
-        0: "Budget (₱1,000-2,500)",
-        1: "Budget (₱1,000-2,500)", 
-        2: "Mid-range (₱2,500-5,000)",
-        3: "Upscale (₱5,000-10,000)",
-        4: "Luxury (₱10,000+)"
-    }
-    return price_ranges.get(price_level, "Price not available")
+    # Levels can arrive as floats (e.g. 2.0) after a JSON round trip
+    if isinstance(price_level, float) and price_level.is_integer():
+        price_level = int(price_level)
+    if isinstance(price_level, int) and 0 <= price_level < len(_PRICE_RANGE_TEXT):
+        return _PRICE_RANGE_TEXT[price_level]
+    return "Price not available"
 
 
 def _extract_amenities(hotel: Dict[str, Any]) -> List[str]:
     """Extract amenities from hotel data"""
-    amenities = []
-    
     # Check for common amenities in types
-    types = hotel.get('types', [])
-    
-    if 'spa' in types:
-        amenities.append('Spa')
-    if 'gym' in types:
-        amenities.append('Gym')
-    if 'restaurant' in types or 'food' in types:
-        amenities.append('Restaurant')
-    if 'bar' in types:
-        amenities.append('Bar')
+    types = set(hotel.get('types', []))
+    amenities = [name for name, keys in _AMENITY_TYPES if not keys.isdisjoint(types)]
     
     # Add standard amenities
-    amenities.extend(['Free WiFi', 'Air Conditioning', '24h Reception'])
+    amenities.extend(_STANDARD_AMENITIES)
     
     return amenities
 
@@ -173,30 +188,34 @@ def _calculate_recommendation_level(hotel: Dict[str, Any]) -> str:
         return "Basic Option"
 
 
-def _find_top_rated(hotels: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    """Find the highest rated hotel"""
-    if not hotels:
-        return None
+def _analyze_hotels(hotels: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Top rated, best value and luxury picks in a single pass
     
-    return max(hotels, key=lambda h: h.get('rating', 0))
-
-
-def _find_best_value(hotels: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    """Find the best value hotel (rating vs price)"""
-    if not hotels:
-        return None
+    Expects hotels from _format_hotel. Ties keep the earliest hotel, as
+    max() would.
+    """
+    top_rated = best_value = None
+    top_rating = best_score = None
+    luxury_options = []
     
-    def value_score(hotel):
-        rating = hotel.get('rating', 0)
-        price_level = hotel.get('price_level', 4)
-        return rating / max(price_level, 1)  # Higher rating, lower price = better value
+    for hotel in hotels:
+        rating, price_level = _HOTEL_ANALYSIS_FIELDS(hotel)
+        # Higher rating, lower price = better value
+        score = rating / max(price_level, 1)
+        
+        if top_rated is None or rating > top_rating:
+            top_rated, top_rating = hotel, rating
+        if best_value is None or score > best_score:
+            best_value, best_score = hotel, score
+        if price_level >= 3 and rating >= 4.0:
+            luxury_options.append(hotel)
     
-    return max(hotels, key=value_score)
-
-
-def _find_luxury_options(hotels: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Find luxury hotel options"""
-    return [h for h in hotels if h.get('price_level', 0) >= 3 and h.get('rating', 0) >= 4.0]
+    return {
+        'top_rated': top_rated,
+        'best_value': best_value,
+        'luxury_options': luxury_options
+    }
 
 
 def _calculate_flight_value_score(flight: Dict[str, Any]) -> float:
@@ -206,11 +225,7 @@ def _calculate_flight_value_score(flight: Dict[str, Any]) -> float:
     stops = flight.get('stops', 0)
     
     # Parse duration (assuming format like "2h 30m")
-    try:
-        duration_parts = duration_str.replace('h', '').replace('m', '').split()
-        duration_minutes = int(duration_parts[0]) * 60 + (int(duration_parts[1]) if len(duration_parts) > 1 else 0)
-    except:
-        duration_minutes = 999  # Default high value for parsing errors
+    duration_minutes = _duration_minutes(duration_str, 999)  # Default high value for parsing errors
     
     # Calculate score (lower is better for price and duration, stops add penalty)
     if price == 0:
@@ -220,69 +235,76 @@ def _calculate_flight_value_score(flight: Dict[str, Any]) -> float:
     return round(score, 3)
 
 
-def _find_cheapest_flight(flights: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    """Find the cheapest flight"""
-    if not flights:
-        return None
-    
-    valid_flights = [f for f in flights if f.get('price', 0) > 0]
-    if not valid_flights:
+@lru_cache(maxsize=512)
+def _parse_duration(duration_str: str) -> Optional[int]:
+    """Minutes in a "2h 30m" style duration, or None if unparseable"""
+    try:
+        parts = duration_str.translate(_DURATION_TABLE).split()
+        return int(parts[0]) * 60 + (int(parts[1]) if len(parts) > 1 else 0)
+    except (IndexError, ValueError):
         return None
-        
-    return min(valid_flights, key=lambda f: f.get('price', float('inf')))
 
 
-def _find_best_value_flight(flights: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    """Find the best value flight"""
-    if not flights:
-        return None
+def _duration_minutes(duration: Any, default: int) -> int:
+    """
+    Parsed duration in minutes, or default
     
-    return max(flights, key=lambda f: f.get('value_score', 0))
+    Memoized per distinct string: a batch repeats the same few durations,
+    and the fastest-flight scan reads them again after value scoring.
+    """
+    minutes = _parse_duration(duration) if isinstance(duration, str) else None
+    return default if minutes is None else minutes
 
 
-def _find_fastest_flight(flights: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    """Find the fastest flight"""
-    if not flights:
-        return None
+def _analyze_flights(flights: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Optional[float]]:
+    """
+    Cheapest, best value and fastest flights in a single pass
     
-    def get_duration_minutes(flight):
-        duration_str = flight.get('duration', '999h 59m')
-        try:
-            duration_parts = duration_str.replace('h', '').replace('m', '').split()
-            return int(duration_parts[0]) * 60 + (int(duration_parts[1]) if len(duration_parts) > 1 else 0)
-        except:
-            return 99999
+    Expects flights from _format_flight. Also returns the average of the
+    positive prices (None if there are none) for the price level. Ties
+    keep the earliest flight, as min() and max() would. The recommended
+    flight is the best value one.
+    """
+    cheapest = fastest = best_value = None
+    cheapest_price = fastest_minutes = best_score = None
+    price_sum = 0
+    price_count = 0
     
-    return min(flights, key=get_duration_minutes)
-
-
-def _get_recommended_flight(flights: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    """Get the overall recommended flight (best balance of factors)"""
-    return _find_best_value_flight(flights)
+    for flight in flights:
+        price, score, duration = _FLIGHT_ANALYSIS_FIELDS(flight)
+        if price > 0:
+            price_sum += price
+            price_count += 1
+            if cheapest is None or price < cheapest_price:
+                cheapest, cheapest_price = flight, price
+        
+        if best_value is None or score > best_score:
+            best_value, best_score = flight, score
+        
+        minutes = _duration_minutes(duration, 99999)
+        if fastest is None or minutes < fastest_minutes:
+            fastest, fastest_minutes = flight, minutes
+    
+    analysis = {
+        'cheapest_flight': cheapest,
+        'best_value': best_value,
+        'fastest_flight': fastest,
+        'recommended': best_value
+    }
+    return analysis, (price_sum / price_count if price_count else None)
 
 
-def _determine_price_level(flights: List[Dict[str, Any]]) -> str:
-    """Determine overall price level of flights"""
-    if not flights:
+def _determine_price_level(avg_price: Optional[float]) -> str:
+    """Overall price level for an average flight price"""
+    if avg_price is None:
         return "unknown"
     
-    prices = [f.get('price', 0) for f in flights if f.get('price', 0) > 0]
-    if not prices:
-        return "unknown"
-    
-    avg_price = sum(prices) / len(prices)
-    
-    if avg_price < 10000:
-        return "low"
-    elif avg_price < 25000:
-        return "typical"
-    elif avg_price < 50000:
-        return "high"
-    else:
-        return "very_high"
+    for bound, level in _PRICE_LEVELS:
+        if avg_price < bound:
+            return level
+    return "very_high"
 
 
 def _get_current_timestamp() -> str:
     """Get current timestamp in ISO format"""
-    from django.utils import timezone
     return timezone.now().isoformat()
\ No newline at end of file
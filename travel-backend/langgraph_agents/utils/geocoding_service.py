@@ -4,14 +4,77 @@ Provides coordinates and distance calculations for Philippine cities
 Supports both hardcoded major cities and dynamic Google Geocoding API lookups
 """
 
+import hashlib
+import os
+import re
 import requests
 import logging
-from typing import Dict, Tuple, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional, Sequence
 from math import radians, cos, sin, asin, sqrt
 from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Earth's radius in kilometers
+EARTH_RADIUS_KM = 6371
+
+GEOCODING_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
+# Geocoded coordinates are cached for 30 days (they don't change)
+GEOCODE_CACHE_TTL = 60 * 60 * 24 * 30
+
+# Keep-alive pool for geocoding misses, so lookups reuse the TLS connection
+# to Google instead of handshaking per call. Rebuilt after a fork since
+# sockets must not be shared between processes.
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Get or create the pooled geocoding session for this process"""
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                session = requests.Session()
+                retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+                session.mount(
+                    "https://",
+                    HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retries)
+                )
+                _session, _session_pid = session, pid
+    return _session
+
+
+# Shared by every bulk lookup in the process. The pool only caps how many
+# calls are open at once; their rate is capped by _geocode_rate_limiter.
+_geocode_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix="geocode")
+
+# Process-wide Geocoding API request rate, kept below Google's per-project
+# QPS limit; created on first use from settings.GOOGLE_GEOCODING_QPS
+_geocode_rate_limiter = None
+_geocode_rate_limiter_lock = threading.Lock()
+
+
+def _get_geocode_rate_limiter():
+    """Get or create the process-wide Geocoding API rate limiter (a TokenBucket)"""
+    global _geocode_rate_limiter
+    if _geocode_rate_limiter is None:
+        with _geocode_rate_limiter_lock:
+            if _geocode_rate_limiter is None:
+                # Imported here: the services package imports the agents, which import this module
+                from django.conf import settings
+                from ..services.api_client_service import TokenBucket
+                qps = getattr(settings, 'GOOGLE_GEOCODING_QPS', 25)
+                _geocode_rate_limiter = TokenBucket(qps)
+    return _geocode_rate_limiter
+
 # Hardcoded coordinates for major Philippine cities (fast lookup)
 # Format: 'city_name': (latitude, longitude)
 MAJOR_CITY_COORDINATES = {
@@ -164,6 +227,52 @@ MAJOR_CITY_COORDINATES = {
     'malapascua': (11.3267, 124.1150),
 }
 
+def _normalize_city_name(city_name: str) -> str:
+    """Lowercase, trim and drop 'city'/'municipality' suffixes for lookups"""
+    normalized = city_name.lower().strip()
+    return normalized.replace(' city', '').replace(' municipality', '').strip()
+
+
+# The table above keyed by normalized name, plus parallel arrays of radians,
+# so distances between hardcoded cities skip the tuple unpack and degree
+# conversion per call
+_CITY_COORDS = tuple(MAJOR_CITY_COORDINATES.values())
+_CITY_INDEX = {_normalize_city_name(name): i for i, name in enumerate(MAJOR_CITY_COORDINATES)}
+_LATS_RAD = tuple(radians(lat) for lat, _ in _CITY_COORDS)
+_LONS_RAD = tuple(radians(lon) for _, lon in _CITY_COORDS)
+
+
+def _round_tenth(value: float) -> float:
+    """
+    Round a non-negative distance or duration to 1 decimal (halves round up)
+    
+    Plain arithmetic instead of round(), which is a full call with
+    correctly-rounded decimal semantics these display values don't need.
+    """
+    return int(value * 10 + 0.5) / 10
+
+
+def get_city_index(city_name: str) -> Optional[int]:
+    """
+    Index of a hardcoded city in the precomputed coordinate arrays
+    
+    Returns:
+        Index for haversine_by_index, or None if the city is not hardcoded
+    """
+    if not city_name:
+        return None
+    return _CITY_INDEX.get(_normalize_city_name(city_name))
+
+
+def haversine_by_index(i: int, j: int) -> float:
+    """
+    Distance between two hardcoded cities by get_city_index indices
+    
+    Returns:
+        Distance in kilometers (rounded to 1 decimal)
+    """
+    return _round_tenth(_haversine_rad(_LATS_RAD[i], _LONS_RAD[i], _LATS_RAD[j], _LONS_RAD[j]))
+
 
 def get_city_coordinates(city_name: str, use_api: bool = True) -> Optional[Tuple[float, float]]:
     """
@@ -179,64 +288,135 @@ def get_city_coordinates(city_name: str, use_api: bool = True) -> Optional[Tuple
     if not city_name or not city_name.strip():
         return None
     
-    normalized = city_name.lower().strip()
-    
     # Remove common suffixes for better matching
-    normalized = normalized.replace(' city', '').replace(' municipality', '').strip()
+    normalized = _normalize_city_name(city_name)
     
     # Check hardcoded list first (instant, free)
-    if normalized in MAJOR_CITY_COORDINATES:
-        logger.info(f"✅ Found {city_name} in hardcoded coordinates")
-        return MAJOR_CITY_COORDINATES[normalized]
+    index = _CITY_INDEX.get(normalized)
+    if index is not None:
+        logger.info("✅ Found %s in hardcoded coordinates", city_name)
+        return _CITY_COORDS[index]
     
     # Check cache (avoid repeated API calls)
-    cache_key = f"geocode_ph_{normalized.replace(' ', '_')}"
+    cache_key = _geocode_cache_key(normalized)
     cached = cache.get(cache_key)
     if cached:
-        logger.info(f"✅ Found {city_name} in cache")
+        logger.info("✅ Found %s in cache", city_name)
         return cached
     
     # Call Google Geocoding API if enabled
     if use_api:
-        try:
-            from django.conf import settings
-            
-            # Check if API key is configured
-            api_key = getattr(settings, 'GOOGLE_MAPS_API_KEY', None)
-            if not api_key:
-                logger.warning("⚠️ Google Maps API key not configured")
-                return None
-            
-            url = "https://maps.googleapis.com/maps/api/geocode/json"
-            params = {
-                'address': f"{city_name}, Philippines",
-                'key': api_key,
-                'components': 'country:PH'
-            }
-            
-            response = requests.get(url, params=params, timeout=5)
-            data = response.json()
-            
-            if data['status'] == 'OK' and data['results']:
-                location = data['results'][0]['geometry']['location']
-                coords = (location['lat'], location['lng'])
-                
-                # Cache for 30 days (coordinates don't change)
-                cache.set(cache_key, coords, 60 * 60 * 24 * 30)
-                logger.info(f"✅ Geocoded {city_name} via API: {coords}")
-                return coords
-            else:
-                logger.warning(f"⚠️ Geocoding API returned: {data['status']} for {city_name}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"❌ Geocoding API error for {city_name}: {str(e)}")
-            return None
+        coords = _geocode_via_api(city_name)
+        if coords:
+            cache.set(cache_key, coords, GEOCODE_CACHE_TTL)
+        return coords
     
-    logger.warning(f"⚠️ Could not find coordinates for {city_name}")
+    logger.warning("⚠️ Could not find coordinates for %s", city_name)
     return None
 
 
+def get_city_coordinates_bulk(
+    city_names: Sequence[str],
+    use_api: bool = True
+) -> Dict[str, Optional[Tuple[float, float]]]:
+    """
+    Get coordinates for several Philippine cities at once
+    
+    Hardcoded cities are answered inline. The rest are read from the
+    cache in one get_many call, and the remaining misses are geocoded
+    concurrently and written back with one set_many, instead of a cache
+    and API round trip per city.
+    
+    Args:
+        city_names: Names of the cities
+        use_api: Whether to use Google Geocoding API if not in hardcoded list
+    
+    Returns:
+        Dict of each given name to (latitude, longitude), or None if not found
+    """
+    results = {}
+    pending = {}  # cache key -> names that normalize to it
+    
+    for name in city_names:
+        if not name or not name.strip():
+            results[name] = None
+            continue
+        normalized = _normalize_city_name(name)
+        index = _CITY_INDEX.get(normalized)
+        if index is not None:
+            results[name] = _CITY_COORDS[index]
+        else:
+            pending.setdefault(_geocode_cache_key(normalized), []).append(name)
+    
+    if not pending:
+        return results
+    
+    found = cache.get_many(list(pending))
+    
+    misses = [key for key in pending if not found.get(key)]
+    if misses and use_api:
+        futures = {key: _geocode_pool.submit(_geocode_via_api, pending[key][0]) for key in misses}
+        geocoded = {key: future.result() for key, future in futures.items()}
+        geocoded = {key: coords for key, coords in geocoded.items() if coords}
+        if geocoded:
+            cache.set_many(geocoded, GEOCODE_CACHE_TTL)
+            found.update(geocoded)
+    
+    for key, names in pending.items():
+        coords = found.get(key) or None
+        if not coords:
+            logger.warning("⚠️ Could not find coordinates for %s", names[0])
+        for name in names:
+            results[name] = coords
+    
+    return results
+
+
+def _geocode_cache_key(normalized: str) -> str:
+    """Cache key for a normalized city name"""
+    return f"geocode_ph_{normalized.replace(' ', '_')}"
+
+
+def _geocode_via_api(city_name: str) -> Optional[Tuple[float, float]]:
+    """
+    Look up a city with the Google Geocoding API (uncached)
+    
+    Returns:
+        (latitude, longitude) or None if not found or the call failed
+    """
+    try:
+        from django.conf import settings
+        
+        # Check if API key is configured
+        api_key = getattr(settings, 'GOOGLE_MAPS_API_KEY', None)
+        if not api_key:
+            logger.warning("⚠️ Google Maps API key not configured")
+            return None
+        
+        params = {
+            'address': f"{city_name}, Philippines",
+            'key': api_key,
+            'components': 'country:PH'
+        }
+        
+        _get_geocode_rate_limiter().acquire_blocking()
+        response = _get_session().get(GEOCODING_URL, params=params, timeout=5)
+        data = response.json()
+        
+        if data['status'] == 'OK' and data['results']:
+            location = data['results'][0]['geometry']['location']
+            coords = (location['lat'], location['lng'])
+            logger.info("✅ Geocoded %s via API: %s", city_name, coords)
+            return coords
+        else:
+            logger.warning("⚠️ Geocoding API returned: %s for %s", data['status'], city_name)
+            return None
+            
+    except Exception as e:
+        logger.error("❌ Geocoding API error for %s: %s", city_name, e)
+        return None
+
+
 def calculate_haversine_distance(
     lat1: float, lon1: float, 
     lat2: float, lon2: float
@@ -255,16 +435,76 @@ def calculate_haversine_distance(
     # Convert to radians
     lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
     
-    # Haversine formula
+    return _round_tenth(_haversine_rad(lat1, lon1, lat2, lon2))
+
+
+def _haversine_rad(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in km between two points given in radians"""
     dlon = lon2 - lon1
     dlat = lat2 - lat1
     a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
+    return EARTH_RADIUS_KM * 2 * asin(sqrt(a))
+
+
+def pairwise_distances_km(
+    cities: Sequence[str],
+    use_api: bool = True
+) -> Optional[List[List[float]]]:
+    """
+    All-pairs straight-line distances between cities
+    
+    For route optimization over several stops. Coordinates are resolved
+    once per city with get_city_coordinates_bulk, each city's radians and
+    cos(lat) are computed once rather than per pair, and only the upper
+    triangle is evaluated since the matrix is symmetric. Matrices are
+    cached by the ordered list of normalized city names.
+    
+    Args:
+        cities: City names; row/column order follows this sequence
+        use_api: Whether to use Google Geocoding API
+    
+    Returns:
+        N x N distance matrix in kilometers (unrounded), or None if any
+        city can't be located
+    """
+    names = '|'.join(_normalize_city_name(city) for city in cities)
+    cache_key = f"pairwise_km_{hashlib.md5(names.encode('utf-8')).hexdigest()}"
+    matrix = cache.get(cache_key)
+    if matrix is not None:
+        return matrix
+    
+    found = get_city_coordinates_bulk(cities, use_api=use_api)
+    coords = [found[city] for city in cities]
+    if not all(coords):
+        missing = [city for city, c in zip(cities, coords) if not c]
+        logger.warning("⚠️ Could not get coordinates for %s", ", ".join(missing))
+        return None
+    
+    lats = [radians(lat) for lat, _ in coords]
+    lons = [radians(lon) for _, lon in coords]
+    cos_lats = [cos(lat) for lat in lats]
     
-    # Earth's radius in kilometers
-    km = 6371 * c
+    size = len(coords)
+    matrix = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        lat1, lon1, cos1, row = lats[i], lons[i], cos_lats[i], matrix[i]
+        for j in range(i + 1, size):
+            a = sin((lats[j] - lat1) / 2)**2 + cos1 * cos_lats[j] * sin((lons[j] - lon1) / 2)**2
+            row[j] = matrix[j][i] = EARTH_RADIUS_KM * 2 * asin(sqrt(a))
     
-    return round(km, 1)
+    cache.set(cache_key, matrix, GEOCODE_CACHE_TTL)
+    return matrix
+
+
+# Circuity factors based on Philippine road conditions
+_CIRCUITY_FACTORS = {
+    'island': 1.5,       # Ferry routes + island roads (indirect)
+    'mountainous': 1.6,  # Winding mountain roads (Cordillera, Sierra Madre)
+    'urban': 1.3,        # City grid with detours (Metro Manila, Cebu)
+    'highway': 1.2,      # Expressways (NLEX, SLEX, TPLEX, SCTEX)
+    'normal': 1.4,       # Standard provincial roads
+    'coastal': 1.35,     # Coastal roads (follows coastline)
+}
 
 
 def estimate_road_distance(
@@ -282,20 +522,50 @@ def estimate_road_distance(
     Returns:
         Estimated road distance in kilometers
     """
-    # Circuity factors based on Philippine road conditions
-    CIRCUITY_FACTORS = {
-        'island': 1.5,       # Ferry routes + island roads (indirect)
-        'mountainous': 1.6,  # Winding mountain roads (Cordillera, Sierra Madre)
-        'urban': 1.3,        # City grid with detours (Metro Manila, Cebu)
-        'highway': 1.2,      # Expressways (NLEX, SLEX, TPLEX, SCTEX)
-        'normal': 1.4,       # Standard provincial roads
-        'coastal': 1.35,     # Coastal roads (follows coastline)
-    }
-    
-    factor = CIRCUITY_FACTORS.get(terrain_type, 1.4)
+    factor = _CIRCUITY_FACTORS.get(terrain_type, 1.4)
     road_distance = straight_distance_km * factor
     
-    return round(road_distance, 1)
+    return _round_tenth(road_distance)
+
+
+# Average speeds (km/h) for different terrain types in the Philippines
+_SPEEDS = {
+    'highway': {
+        'bus': 60,
+        'van': 65,
+        'private': 70,
+        'car': 70,
+    },
+    'normal': {
+        'bus': 50,
+        'van': 55,
+        'private': 60,
+        'car': 60,
+    },
+    'mountainous': {
+        'bus': 35,
+        'van': 40,
+        'private': 45,
+        'car': 45,
+    },
+    'urban': {
+        'bus': 25,
+        'van': 30,
+        'private': 35,
+        'car': 35,
+    },
+    'coastal': {
+        'bus': 45,
+        'van': 50,
+        'private': 55,
+        'car': 55,
+    },
+    'island': {
+        'ferry': 30,
+        'boat': 25,
+        'fastcraft': 40,
+    },
+}
 
 
 def estimate_travel_time(
@@ -315,58 +585,44 @@ def estimate_travel_time(
     Returns:
         Estimated travel time in hours (rounded to 1 decimal)
     """
-    # Average speeds (km/h) for different terrain types in the Philippines
-    SPEEDS = {
-        'highway': {
-            'bus': 60,
-            'van': 65,
-            'private': 70,
-            'car': 70,
-        },
-        'normal': {
-            'bus': 50,
-            'van': 55,
-            'private': 60,
-            'car': 60,
-        },
-        'mountainous': {
-            'bus': 35,
-            'van': 40,
-            'private': 45,
-            'car': 45,
-        },
-        'urban': {
-            'bus': 25,
-            'van': 30,
-            'private': 35,
-            'car': 35,
-        },
-        'coastal': {
-            'bus': 45,
-            'van': 50,
-            'private': 55,
-            'car': 55,
-        },
-        'island': {
-            'ferry': 30,
-            'boat': 25,
-            'fastcraft': 40,
-        },
-    }
-    
-    terrain_speeds = SPEEDS.get(terrain_type, SPEEDS['normal'])
+    terrain_speeds = _SPEEDS.get(terrain_type, _SPEEDS['normal'])
     speed = terrain_speeds.get(transport_mode, 50)
     
     # Calculate base travel time
     travel_time = distance_km / speed
     
     # Add buffer for stops, traffic, loading/unloading
-    if transport_mode in ['bus', 'van']:
+    if transport_mode in ('bus', 'van'):
         travel_time *= 1.2  # 20% buffer for passenger stops
-    elif transport_mode in ['ferry', 'boat']:
+    elif transport_mode in ('ferry', 'boat'):
         travel_time *= 1.15  # 15% buffer for boarding/docking
     
-    return round(travel_time, 1)
+    return _round_tenth(travel_time)
+
+
+# Cost per kilometer in Philippine pesos
+_COST_PER_KM = {
+    'bus': {
+        'standard': 1.5,      # Regular aircon bus
+        'deluxe': 2.0,        # Deluxe bus (Victory Liner, Genesis)
+        'premium': 2.5,       # Premium sleeper bus
+    },
+    'van': {
+        'standard': 2.0,      # Regular van
+        'deluxe': 2.5,        # Express van
+        'premium': 3.0,       # Private van hire
+    },
+    'ferry': {
+        'standard': 3.0,      # Economy class
+        'deluxe': 5.0,        # Tourist class
+        'premium': 8.0,       # Business/stateroom
+    },
+    'private': {
+        'standard': 8.0,      # Car rental with driver
+        'deluxe': 12.0,       # SUV rental
+        'premium': 20.0,      # Premium vehicle
+    },
+}
 
 
 def estimate_travel_cost(
@@ -386,31 +642,7 @@ def estimate_travel_cost(
     Returns:
         Cost estimate string (e.g., "₱500-700")
     """
-    # Cost per kilometer in Philippine pesos
-    COST_PER_KM = {
-        'bus': {
-            'standard': 1.5,      # Regular aircon bus
-            'deluxe': 2.0,        # Deluxe bus (Victory Liner, Genesis)
-            'premium': 2.5,       # Premium sleeper bus
-        },
-        'van': {
-            'standard': 2.0,      # Regular van
-            'deluxe': 2.5,        # Express van
-            'premium': 3.0,       # Private van hire
-        },
-        'ferry': {
-            'standard': 3.0,      # Economy class
-            'deluxe': 5.0,        # Tourist class
-            'premium': 8.0,       # Business/stateroom
-        },
-        'private': {
-            'standard': 8.0,      # Car rental with driver
-            'deluxe': 12.0,       # SUV rental
-            'premium': 20.0,      # Premium vehicle
-        },
-    }
-    
-    mode_costs = COST_PER_KM.get(transport_mode, COST_PER_KM['bus'])
+    mode_costs = _COST_PER_KM.get(transport_mode, _COST_PER_KM['bus'])
     cost_per_km = mode_costs.get(comfort_level, mode_costs['standard'])
     
     # Calculate cost range (±15% variation)
@@ -419,12 +651,53 @@ def estimate_travel_cost(
     max_cost = int(base_cost * 1.15)
     
     # Round to nearest 50 for readability
-    min_cost = round(min_cost / 50) * 50
-    max_cost = round(max_cost / 50) * 50
+    min_cost = (min_cost + 25) // 50 * 50
+    max_cost = (max_cost + 25) // 50 * 50
     
     return f"₱{min_cost:,}-{max_cost:,}"
 
 
+# Island provinces (require ferry or are island-bound)
+_ISLAND_CITIES = (
+    'siargao', 'camiguin', 'siquijor', 'guimaras', 'boracay',
+    'palawan', 'coron', 'el nido', 'puerto princesa', 'puerto galera',
+    'bohol', 'panglao', 'malapascua', 'bantayan', 'jolo', 'basilan',
+    'marinduque', 'romblon', 'catanduanes', 'biliran'
+)
+
+# Mountainous areas (Cordillera, upland regions)
+_MOUNTAIN_CITIES = (
+    'baguio', 'sagada', 'banaue', 'ifugao', 'benguet', 'la trinidad',
+    'mountain province', 'kalinga', 'apayao', 'bontoc', 'tabuk',
+    'malaybalay', 'valencia', 'bukidnon', 'davao', 'kidapawan'
+)
+
+# Major highway routes (expressways)
+_HIGHWAY_ROUTES = frozenset(tuple(sorted(route)) for route in (
+    ('manila', 'baguio'),  # TPLEX
+    ('manila', 'batangas'),  # SLEX/STAR
+    ('manila', 'clark'),  # NLEX
+    ('manila', 'angeles'),  # NLEX
+    ('manila', 'subic'),  # SCTEX
+    ('manila', 'tarlac'),  # TPLEX
+    ('manila', 'dagupan'),  # TPLEX
+    ('quezon city', 'baguio'),  # TPLEX
+))
+
+# Metro Manila cities
+_METRO_MANILA = (
+    'manila', 'quezon city', 'makati', 'taguig', 'pasig', 'mandaluyong',
+    'caloocan', 'las piñas', 'parañaque', 'muntinlupa', 'pasay',
+    'malabon', 'navotas', 'valenzuela', 'marikina', 'san juan'
+)
+
+# Each keyword list as one compiled alternation: a single search per name
+# finds any keyword occurring in it, same as testing `kw in name` for each
+_ISLAND_RE = re.compile('|'.join(map(re.escape, _ISLAND_CITIES)))
+_MOUNTAIN_RE = re.compile('|'.join(map(re.escape, _MOUNTAIN_CITIES)))
+_METRO_MANILA_RE = re.compile('|'.join(map(re.escape, _METRO_MANILA)))
+
+
 def determine_terrain_type(city1: str, city2: str) -> str:
     """
     Determine terrain type based on city names and geographic knowledge
@@ -438,59 +711,21 @@ def determine_terrain_type(city1: str, city2: str) -> str:
     c1_lower = city1.lower()
     c2_lower = city2.lower()
     
-    # Island provinces (require ferry or are island-bound)
-    ISLAND_CITIES = [
-        'siargao', 'camiguin', 'siquijor', 'guimaras', 'boracay',
-        'palawan', 'coron', 'el nido', 'puerto princesa', 'puerto galera',
-        'bohol', 'panglao', 'malapascua', 'bantayan', 'jolo', 'basilan',
-        'marinduque', 'romblon', 'catanduanes', 'biliran'
-    ]
-    
-    # Mountainous areas (Cordillera, upland regions)
-    MOUNTAIN_CITIES = [
-        'baguio', 'sagada', 'banaue', 'ifugao', 'benguet', 'la trinidad',
-        'mountain province', 'kalinga', 'apayao', 'bontoc', 'tabuk',
-        'malaybalay', 'valencia', 'bukidnon', 'davao', 'kidapawan'
-    ]
-    
-    # Major highway routes (expressways)
-    HIGHWAY_ROUTES = [
-        ('manila', 'baguio'),  # TPLEX
-        ('manila', 'batangas'),  # SLEX/STAR
-        ('manila', 'clark'),  # NLEX
-        ('manila', 'angeles'),  # NLEX
-        ('manila', 'subic'),  # SCTEX
-        ('manila', 'tarlac'),  # TPLEX
-        ('manila', 'dagupan'),  # TPLEX
-        ('quezon city', 'baguio'),  # TPLEX
-    ]
-    
-    # Metro Manila cities
-    METRO_MANILA = [
-        'manila', 'quezon city', 'makati', 'taguig', 'pasig', 'mandaluyong',
-        'caloocan', 'las piñas', 'parañaque', 'muntinlupa', 'pasay',
-        'malabon', 'navotas', 'valenzuela', 'marikina', 'san juan'
-    ]
-    
     # Check if any city is on an island (requires ferry)
-    for island in ISLAND_CITIES:
-        if island in c1_lower or island in c2_lower:
-            return 'island'
+    if _ISLAND_RE.search(c1_lower) or _ISLAND_RE.search(c2_lower):
+        return 'island'
     
     # Check if mountainous
-    for mountain in MOUNTAIN_CITIES:
-        if mountain in c1_lower or mountain in c2_lower:
-            return 'mountainous'
+    if _MOUNTAIN_RE.search(c1_lower) or _MOUNTAIN_RE.search(c2_lower):
+        return 'mountainous'
     
     # Check if on major highway
     route_tuple = tuple(sorted([c1_lower.replace(' city', ''), c2_lower.replace(' city', '')]))
-    for hw_route in HIGHWAY_ROUTES:
-        hw_sorted = tuple(sorted(hw_route))
-        if route_tuple == hw_sorted:
-            return 'highway'
+    if route_tuple in _HIGHWAY_ROUTES:
+        return 'highway'
     
     # Check if within Metro Manila
-    if any(metro in c1_lower for metro in METRO_MANILA) and any(metro in c2_lower for metro in METRO_MANILA):
+    if _METRO_MANILA_RE.search(c1_lower) and _METRO_MANILA_RE.search(c2_lower):
         return 'urban'
     
     # Default to normal provincial roads
@@ -513,19 +748,29 @@ def calculate_route_estimates(
     Returns:
         Dict with distance, time, cost estimates or None if calculation fails
     """
-    # Get coordinates
-    origin_coords = get_city_coordinates(origin, use_api=use_api)
-    dest_coords = get_city_coordinates(destination, use_api=use_api)
-    
-    if not origin_coords or not dest_coords:
-        logger.warning(f"⚠️ Could not get coordinates for {origin} → {destination}")
-        return None
-    
-    # Calculate straight-line distance
-    straight_distance = calculate_haversine_distance(
-        origin_coords[0], origin_coords[1],
-        dest_coords[0], dest_coords[1]
-    )
+    origin_index = get_city_index(origin)
+    dest_index = get_city_index(destination)
+    
+    if origin_index is not None and dest_index is not None:
+        # Both hardcoded (the common case): no cache or API round trip
+        origin_coords = _CITY_COORDS[origin_index]
+        dest_coords = _CITY_COORDS[dest_index]
+        straight_distance = haversine_by_index(origin_index, dest_index)
+    else:
+        # Get coordinates (one cache round trip for both ends)
+        coords = get_city_coordinates_bulk([origin, destination], use_api=use_api)
+        origin_coords = coords[origin]
+        dest_coords = coords[destination]
+        
+        if not origin_coords or not dest_coords:
+            logger.warning("⚠️ Could not get coordinates for %s → %s", origin, destination)
+            return None
+        
+        # Calculate straight-line distance
+        straight_distance = calculate_haversine_distance(
+            origin_coords[0], origin_coords[1],
+            dest_coords[0], dest_coords[1]
+        )
     
     # Determine terrain type
     terrain = determine_terrain_type(origin, destination)
@@ -66,28 +66,36 @@ class AgentLoggerMixin:
     
     def log_execution_start(self, method_name: str, params: dict = None):
         """Log the start of agent execution"""
-        params_str = f" with params: {params}" if params else ""
-        self.logger.info(f"🤖 {method_name} started{params_str}")
+        if params:
+            self.logger.info("🤖 %s started with params: %s", method_name, params)
+        else:
+            self.logger.info("🤖 %s started", method_name)
     
     def log_execution_success(self, method_name: str, result_summary: str = None):
         """Log successful agent execution"""
-        summary_str = f": {result_summary}" if result_summary else ""
-        self.logger.info(f"✅ {method_name} completed successfully{summary_str}")
+        if result_summary:
+            self.logger.info("✅ %s completed successfully: %s", method_name, result_summary)
+        else:
+            self.logger.info("✅ %s completed successfully", method_name)
     
     def log_execution_error(self, method_name: str, error: Exception):
         """Log agent execution error"""
-        self.logger.error(f"❌ {method_name} failed: {str(error)}")
+        self.logger.error("❌ %s failed: %s", method_name, error)
     
     def log_api_call(self, service: str, endpoint: str, status: str = "started"):
         """Log API calls"""
         if status == "started":
-            self.logger.debug(f"🔗 API call to {service} ({endpoint})")
+            self.logger.debug("🔗 API call to %s (%s)", service, endpoint)
         elif status == "success":
-            self.logger.debug(f"✅ API call to {service} successful")
+            self.logger.debug("✅ API call to %s successful", service)
         elif status == "failed":
-            self.logger.warning(f"❌ API call to {service} failed")
+            self.logger.warning("❌ API call to %s failed", service)
     
     def log_data_processing(self, action: str, item_count: int = None):
         """Log data processing actions"""
-        count_str = f" ({item_count} items)" if item_count is not None else ""
-        self.logger.debug(f"📊 {action}{count_str}")
\ No newline at end of file
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if item_count is not None:
+            self.logger.debug("📊 %s (%s items)", action, item_count)
+        else:
+            self.logger.debug("📊 %s", action)
@@ -2,12 +2,17 @@
 Philippine Time (PHT) utilities for Django backend
 Ensures all datetime operations use Asia/Manila timezone (UTC+8)
 """
+import time
 from datetime import datetime, date, timedelta
 from zoneinfo import ZoneInfo
 from typing import Optional, Union
 
 # Philippine Time Zone
 PHT_TIMEZONE = ZoneInfo('Asia/Manila')
+_UTC = ZoneInfo('UTC')
+
+# Today's PHT date and the epoch time it ends at (next PHT midnight)
+_pht_today = (None, 0.0)
 
 
 def get_pht_now() -> datetime:
@@ -20,6 +25,26 @@ def get_pht_now() -> datetime:
     return datetime.now(PHT_TIMEZONE)
 
 
+def get_pht_today() -> date:
+    """
+    Get today's date in Philippine Time (PHT)
+    
+    Cached until the next PHT midnight, so repeated past-date checks
+    don't build and convert a new datetime each time.
+    
+    Returns:
+        date: Current date in PHT
+    """
+    global _pht_today
+    today, expires_at = _pht_today
+    now = time.time()
+    if now >= expires_at:
+        today = datetime.fromtimestamp(now, PHT_TIMEZONE).date()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time(), PHT_TIMEZONE)
+        _pht_today = (today, midnight.timestamp())
+    return today
+
+
 def to_pht(dt: Union[datetime, date, str]) -> datetime:
     """
     Convert datetime to Philippine Time
@@ -47,7 +72,7 @@ def to_pht(dt: Union[datetime, date, str]) -> datetime:
     
     # If naive (no timezone), assume UTC
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo('UTC'))
+        dt = dt.replace(tzinfo=_UTC)
     
     # Convert to PHT
     return dt.astimezone(PHT_TIMEZONE)
@@ -67,6 +92,11 @@ def parse_date_pht(date_str: str) -> Optional[date]:
         return None
         
     try:
+        parsed = _parse_iso_date(date_str)
+        if parsed is not None:
+            return parsed
+        
+        # Other shapes strptime accepts (e.g. unpadded 2025-1-5)
         dt = datetime.strptime(date_str, '%Y-%m-%d')
         # Convert to PHT and return date part
         pht_dt = dt.replace(tzinfo=PHT_TIMEZONE)
@@ -75,6 +105,22 @@ def parse_date_pht(date_str: str) -> Optional[date]:
         return None
 
 
+def _parse_iso_date(date_str: str) -> Optional[date]:
+    """
+    Parse an exact YYYY-MM-DD string by slicing
+    
+    Much cheaper than strptime for the shape every client sends. Returns
+    None if the string isn't in that shape; raises ValueError if it is
+    but the date doesn't exist.
+    """
+    if (
+        len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+        and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()
+    ):
+        return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    return None
+
+
 def format_pht_date(dt: Union[datetime, date, str]) -> str:
     """
     Format datetime as YYYY-MM-DD in PHT
@@ -139,8 +185,7 @@ def is_past_date_pht(date_to_check: Union[str, date, datetime]) -> bool:
     if isinstance(check_date, datetime):
         check_date = check_date.date()
     
-    today = get_pht_now().date()
-    return check_date < today
+    return check_date < get_pht_today()
 
 
 def add_days_pht(base_date: Union[str, date], days: int) -> date:
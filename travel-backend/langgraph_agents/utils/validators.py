@@ -198,24 +198,40 @@ def validate_email(email: str) -> str:
     return email
 
 
-def sanitize_response_data(data: Dict[str, Any]) -> Dict[str, Any]:
+_UNSAFE_KEY_CHARS = re.compile(r'[^\w\-_.]')
+
+
+def _sanitize_str(value: str) -> str:
+    """Strip angle brackets and surrounding whitespace"""
+    if '<' in value or '>' in value:
+        value = value.replace('<', '').replace('>', '')
+    return value.strip()
+
+
+def sanitize_response_data(data: Dict[str, Any], inplace: bool = False) -> Dict[str, Any]:
     """
     Sanitize response data to ensure it's safe for storage and transmission
     
     Args:
         data: Data to sanitize
+        inplace: Clean `data` itself instead of building a copy; for large
+            agent results the caller owns and won't read unsanitized again
         
     Returns:
-        Sanitized data
+        Sanitized data (`data` itself when inplace)
     """
     if not isinstance(data, dict):
         return data
     
+    if inplace:
+        _sanitize_inplace(data)
+        return data
+    
     sanitized = {}
     
     for key, value in data.items():
         # Sanitize key
-        safe_key = re.sub(r'[^\w\-_.]', '_', str(key))
+        safe_key = _UNSAFE_KEY_CHARS.sub('_', str(key))
         
         # Sanitize value
         if isinstance(value, dict):
@@ -227,13 +243,42 @@ def sanitize_response_data(data: Dict[str, Any]) -> Dict[str, Any]:
             ]
         elif isinstance(value, str):
             # Remove potentially dangerous characters but preserve useful ones
-            sanitized[safe_key] = re.sub(r'[<>]', '', value).strip()
+            sanitized[safe_key] = _sanitize_str(value)
         else:
             sanitized[safe_key] = value
     
     return sanitized
 
 
+def _sanitize_inplace(data: Dict[str, Any]):
+    """Single-pass, in-place counterpart of sanitize_response_data"""
+    renamed = False
+    
+    for key, value in data.items():
+        if not isinstance(key, str) or _UNSAFE_KEY_CHARS.search(key):
+            renamed = True
+        
+        if isinstance(value, dict):
+            _sanitize_inplace(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    _sanitize_inplace(item)
+        elif isinstance(value, str):
+            cleaned = _sanitize_str(value)
+            if cleaned is not value:
+                # Replacing a value doesn't change the dict's size, so this
+                # is safe while iterating
+                data[key] = cleaned
+    
+    # Rare: rebuild only when some key needs renaming, keeping key order
+    if renamed:
+        items = list(data.items())
+        data.clear()
+        for key, value in items:
+            data[_UNSAFE_KEY_CHARS.sub('_', str(key))] = value
+
+
 def validate_hotel_preferences(prefs: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate hotel preference data
@@ -3,13 +3,14 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from django.views.decorators.csrf import csrf_exempt
 
 from .services import OrchestrationService, SessionService
 from .utils import get_agent_logger, validate_email
 from .exceptions import LangGraphAgentError, DataValidationError
 from .models import TravelPlanningSession, AgentExecutionLog
-from .throttling import TripGenerationThrottle, BurstTripGenerationThrottle, SessionStatusThrottle, HealthCheckThrottle
+from .throttling import AuthenticatedTripThrottle, AnonTripThrottle, BurstTripGenerationThrottle, SessionStatusThrottle, HealthCheckThrottle
 
 logger = get_agent_logger("LangGraphViews")
 
@@ -19,7 +20,7 @@ class LangGraphTravelPlannerView(APIView):
     Main LangGraph Travel Planner API endpoint using modular services
     Rate Limited: 5 requests/hour per user, 2 requests/minute burst protection
     """
-    throttle_classes = [TripGenerationThrottle, BurstTripGenerationThrottle]
+    throttle_classes = [AuthenticatedTripThrottle, AnonTripThrottle, BurstTripGenerationThrottle]
     
     def post(self, request):
         """Execute LangGraph travel planning workflow"""
@@ -276,6 +277,7 @@ class LangGraphHealthCheckView(APIView):
     """
     throttle_classes = [HealthCheckThrottle]
     
+    @method_decorator(cache_page(1))  # Shared across clients; throttling still runs per request
     def get(self, request):
         """Check LangGraph system health"""
         
@@ -9,6 +9,8 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.conf import settings
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from langgraph_agents.utils import get_agent_logger
 
 logger = get_agent_logger("HealthCheck")
@@ -194,6 +196,7 @@ class QuickHealthView(APIView):
     Lightweight health check for monitoring and load balancers
     """
     
+    @method_decorator(cache_page(1))  # Shared across clients for a second
     def get(self, request):
         """Quick health ping"""
         try:
@@ -11,6 +11,7 @@ from django.http import StreamingHttpResponse
 import json
 
 from .services.longcat_service import LongCatService
+from .exceptions import ServiceUnavailableError
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +90,14 @@ def longcat_chat(request):
             }
         })
         
+    except ServiceUnavailableError as e:
+        # Circuit open: LongCat is failing, don't tie up the worker retrying
+        logger.warning(f"LongCat unavailable: {str(e)}")
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        
     except Exception as e:
         logger.error(f"LongCat chat error: {str(e)}")
         return Response({
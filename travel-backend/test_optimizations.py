@@ -40,7 +40,8 @@ def test_throttling():
     
     try:
         from langgraph_agents.throttling import (
-            TripGenerationThrottle,
+            AuthenticatedTripThrottle,
+            AnonTripThrottle,
             BurstTripGenerationThrottle,
             SessionStatusThrottle,
             HealthCheckThrottle
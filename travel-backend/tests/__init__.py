@@ -5,11 +5,24 @@ TravelRover Backend Tests Package
 This package contains all test files for the TravelRover backend.
 
 Test Organization:
+- test_activity_cache.py - Activity cache lookup, TTL tier and destination index tests
+- test_admin.py - Admin change page payload display tests
+- test_activity_fetcher.py - Activity pool fetch coalescing and caching tests
 - test_api.py - General API endpoint tests
+- test_bulkhead.py - Bulkhead slot queueing, timeout and release tests
+- test_circuit_breaker.py - LongCat circuit breaker state and probe tests
 - test_complete_flow.py - End-to-end workflow tests
 - test_flight_agent.py - Flight agent functionality tests
+- test_formatters.py - Hotel and flight response formatter tests
+- test_geocoding_rate_limit.py - Geocoding API request rate limit tests
 - test_hotel_agent.py - Hotel agent functionality tests
 - test_enhanced_hotel_agent.py - Enhanced hotel agent tests
+- test_longcat_cache.py - LongCat response cache tests
+- test_longcat_stream.py - LongCat server-sent event stream parsing tests
+- test_pairwise_distances.py - All-pairs city distance matrix tests
+- test_regional_transport_context.py - Regional transport lookup view and copy tests
+- test_session_log_buffers.py - Agent log buffer flush and eviction tests
+- test_throttling.py - Trip throttle limits and window tests (cache and Redis)
 - test_travelers_validation.py - Traveler input validation tests
 
 Usage:
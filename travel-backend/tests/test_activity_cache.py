@@ -0,0 +1,89 @@
+"""
+Tests for the activity cache lookups and destination index
+"""
+
+import os
+import sys
+import threading
+
+import django
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from django.core.cache import cache
+
+from langgraph_agents.services import activity_cache
+from langgraph_agents.services.activity_cache import ActivityCache
+
+DESTINATION = "testcity-index"
+
+
+def test_concurrent_writers_keep_every_key():
+    ActivityCache.clear_destination_cache(DESTINATION)
+    writers = 16
+    barrier = threading.Barrier(writers)
+
+    def write(max_activities):
+        barrier.wait()
+        ActivityCache.cache_activities(
+            DESTINATION, [{'name': 'Park'}], max_activities=max_activities
+        )
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(1, writers + 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(cache.get(ActivityCache._index_key(DESTINATION))) == writers
+    assert ActivityCache.clear_destination_cache(DESTINATION) == writers
+    assert ActivityCache.get_cached_activities(DESTINATION, max_activities=1) is None
+
+
+class RecordingCache:
+    """Passes calls through to the real cache, recording each method used"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        self.calls.append(name)
+        return getattr(cache, name)
+
+
+def test_shared_hit_is_one_read(monkeypatch):
+    destination = "testcity-hit"
+    ActivityCache.clear_destination_cache(destination)
+    ActivityCache.cache_activities(destination, [{'name': 'Park'}])
+    activity_cache._L1.clear()
+
+    recorder = RecordingCache()
+    monkeypatch.setattr(activity_cache, 'cache', recorder)
+
+    assert ActivityCache.get_cached_activities(destination) == [{'name': 'Park'}]
+    assert recorder.calls == ['get_many']
+    ActivityCache.clear_destination_cache(destination)
+
+
+def test_refetched_pools_get_longer_timeouts(monkeypatch):
+    destination = "testcity-tiers"
+    ActivityCache.clear_destination_cache(destination)
+    cache_key = ActivityCache._generate_cache_key(destination, 15000, 50)
+    cache.delete(f"{ActivityCache.CACHE_PREFIX}_freq_{cache_key}")
+
+    timeouts = []
+    real_set = cache.set
+
+    def record_set(key, value, timeout=None):
+        if key == cache_key:
+            timeouts.append(timeout)
+        return real_set(key, value, timeout)
+
+    monkeypatch.setattr(cache, 'set', record_set)
+    for _ in range(3):
+        ActivityCache.cache_activities(destination, [{'name': 'Park'}])
+
+    assert timeouts == [ActivityCache.DEFAULT_TIMEOUT * n for n in (1, 2, 3)]
+    ActivityCache.clear_destination_cache(destination)
@@ -0,0 +1,143 @@
+"""
+Tests for activity pool fetching: in-flight coalescing and negative caching
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from django.test import override_settings
+
+from langgraph_agents.services.activity_cache import ActivityCache
+from langgraph_agents.services.activity_fetcher import ActivityPoolFetcher
+
+PREFERENCES = {'activityTypes': ['Nature']}
+
+
+class FakePlacesClient:
+    """Stands in for APIClientService; counts upstream calls"""
+
+    def __init__(self, release=None, geocode_status='OK', search_response=None):
+        self.release = release
+        self.geocode_status = geocode_status
+        self.search_response = search_response
+        self.geocode_calls = 0
+        self.search_calls = 0
+        self.started = threading.Event()
+
+    async def google_places_request(self, endpoint, api_key, params):
+        self.geocode_calls += 1
+        self.started.set()
+        while self.release is not None and not self.release.is_set():
+            await asyncio.sleep(0.01)
+        if self.geocode_status != 'OK':
+            return {'status': self.geocode_status, 'candidates': []}
+        return {'status': 'OK', 'candidates': [{'geometry': {'location': {'lat': 14.6, 'lng': 121.0}}}]}
+
+    def google_places_config(self, endpoint, api_key, params):
+        return params
+
+    async def batch_requests(self, requests, max_concurrent=10):
+        for index, params in enumerate(requests):
+            self.search_calls += 1
+            if self.search_response is not None:
+                yield index, self.search_response
+                continue
+            yield index, {'status': 'OK', 'results': [{
+                'place_id': f"{params['type']}-1",
+                'name': f"{params['type'].title()} One",
+                'types': [params['type']],
+                'rating': 4.5,
+                'geometry': {'location': {'lat': 14.6, 'lng': 121.0}}
+            }]}
+
+    async def close_session(self):
+        pass
+
+
+@pytest.fixture
+def destination(request):
+    name = f"testcity-{request.node.name}"
+    ActivityCache.clear_destination_cache(name)
+    yield name
+    ActivityCache.clear_destination_cache(name)
+
+
+def make_fetcher(client):
+    with override_settings(GOOGLE_PLACES_API_KEY='test-key'):
+        return ActivityPoolFetcher(api_client=client)
+
+
+def test_concurrent_loops_share_one_fetch(destination, caplog):
+    release = threading.Event()
+    client = FakePlacesClient(release)
+    fetcher = make_fetcher(client)
+    results = [None, None]
+
+    def run(slot):
+        results[slot] = asyncio.run(fetcher.fetch_activity_pool(destination, PREFERENCES))
+
+    caplog.set_level(logging.INFO, logger='langgraph_agents.services.activity_fetcher')
+    owner = threading.Thread(target=run, args=(0,))
+    owner.start()
+    assert client.started.wait(5)
+
+    joiner = threading.Thread(target=run, args=(1,))
+    joiner.start()
+    deadline = time.monotonic() + 5
+    while 'Joining in-flight' not in caplog.text:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    release.set()
+    owner.join(5)
+    joiner.join(5)
+
+    assert client.geocode_calls == 1
+    assert client.search_calls == len(fetcher._get_activity_types(PREFERENCES))
+    assert results[0] and results[1] == results[0]
+    assert not ActivityPoolFetcher._inflight
+
+
+def fetch_twice(client, destination):
+    fetcher = make_fetcher(client)
+    first = asyncio.run(fetcher.fetch_activity_pool(destination, PREFERENCES))
+    second = asyncio.run(fetcher.fetch_activity_pool(destination, PREFERENCES))
+    return first, second
+
+
+def test_unknown_destination_is_negative_cached(destination):
+    client = FakePlacesClient(geocode_status='ZERO_RESULTS')
+
+    assert fetch_twice(client, destination) == ([], [])
+    assert client.geocode_calls == 1
+
+
+def test_searches_without_hits_are_negative_cached(destination):
+    client = FakePlacesClient(search_response={'status': 'ZERO_RESULTS', 'results': []})
+
+    assert fetch_twice(client, destination) == ([], [])
+    assert client.geocode_calls == 1
+
+
+@pytest.mark.parametrize("client_kwargs", [
+    {'geocode_status': 'OVER_QUERY_LIMIT'},
+    {'geocode_status': 'REQUEST_DENIED'},
+    {'search_response': {'error': 'timed out', 'success': False}},
+    {'search_response': {'status': 'UNKNOWN_ERROR', 'results': []}},
+])
+def test_failed_lookups_are_not_cached(destination, client_kwargs):
+    client = FakePlacesClient(**client_kwargs)
+
+    assert fetch_twice(client, destination) == ([], [])
+    assert client.geocode_calls == 2
@@ -0,0 +1,60 @@
+"""
+Tests for the langgraph_agents admin pages
+"""
+
+import os
+import sys
+from datetime import date
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+from langgraph_agents.models import AgentExecutionLog, TravelPlanningSession
+
+
+@pytest.fixture(scope='module')
+def test_db():
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    yield
+    connection.creation.destroy_test_db(old_name, verbosity=0)
+    teardown_test_environment()
+
+
+@pytest.fixture
+def admin_client(test_db):
+    user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+    client = Client()
+    client.force_login(user)
+    yield client
+    user.delete()
+
+
+def test_execution_log_change_page_shows_payloads(admin_client):
+    session = TravelPlanningSession.objects.create(
+        user_email='traveler@example.com', destination='Cebu City',
+        start_date=date(2026, 1, 1), end_date=date(2026, 1, 3),
+        travelers='2', budget='Moderate',
+    )
+    log = AgentExecutionLog.objects.create(
+        session=session, agent_type='flight', status='completed',
+        input_data={'origin': 'Manila'}, output_data={'flights': ['PR 1845']},
+    )
+
+    url = reverse('admin:langgraph_agents_agentexecutionlog_change', args=[log.pk])
+    response = admin_client.get(url, secure=True)
+
+    assert response.status_code == 200
+    assert '&quot;origin&quot;: &quot;Manila&quot;' in response.content.decode()
+    assert '&quot;PR 1845&quot;' in response.content.decode()
+    session.delete()
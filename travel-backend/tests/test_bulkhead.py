@@ -0,0 +1,147 @@
+"""
+Tests for the cross-thread Bulkhead and the LongCat slot handling
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from langgraph_agents.exceptions import ServiceUnavailableError
+from langgraph_agents.services import longcat_service
+from langgraph_agents.services.longcat_service import LongCatService
+from langgraph_agents.utils import Bulkhead
+
+
+def free_slots(bulkhead):
+    return bulkhead._available
+
+
+def test_sync_acquire_times_out():
+    bulkhead = Bulkhead("Test", 1, timeout=0.05)
+    bulkhead.acquire()
+
+    with pytest.raises(ServiceUnavailableError):
+        bulkhead.acquire()
+
+    bulkhead.release()
+    assert free_slots(bulkhead) == 1
+    assert not bulkhead._waiters
+
+
+def test_async_acquire_times_out_without_leaking():
+    bulkhead = Bulkhead("Test", 1, timeout=0.05)
+    bulkhead.acquire()
+
+    with pytest.raises(ServiceUnavailableError):
+        asyncio.run(bulkhead.aacquire())
+
+    bulkhead.release()
+    assert free_slots(bulkhead) == 1
+
+
+def test_cancelled_async_waiter_does_not_leak():
+    bulkhead = Bulkhead("Test", 1)
+
+    async def main():
+        await bulkhead.aacquire()
+        waiter = asyncio.ensure_future(bulkhead.aacquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        bulkhead.release()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert free_slots(bulkhead) == 1
+
+
+def test_async_waiters_are_served_in_order():
+    bulkhead = Bulkhead("Test", 1)
+    order = []
+
+    async def worker(n):
+        async with bulkhead:
+            order.append(n)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await bulkhead.aacquire()
+        tasks = []
+        for n in range(5):
+            tasks.append(asyncio.ensure_future(worker(n)))
+            await asyncio.sleep(0)
+        bulkhead.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_slot_is_handed_across_threads_and_loops():
+    bulkhead = Bulkhead("Test", 1)
+    bulkhead.acquire()
+    acquired = threading.Event()
+
+    async def wait_for_slot():
+        async with bulkhead:
+            acquired.set()
+
+    thread = threading.Thread(target=lambda: asyncio.run(wait_for_slot()))
+    thread.start()
+    time.sleep(0.05)
+    assert not acquired.is_set()
+
+    bulkhead.release()
+    thread.join(5)
+    assert acquired.is_set()
+    assert free_slots(bulkhead) == 1
+
+
+class StreamingResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        yield from self.chunks
+
+    def close(self):
+        self.closed = True
+
+
+def test_sync_stream_holds_slot_until_closed(monkeypatch):
+    bulkhead = Bulkhead("LongCat API", 2)
+    response = StreamingResponse([b'data: {"a": 1}\n\n', b'data: {"b": 2}\n\n'])
+
+    class Session:
+        def post(self, url, **kwargs):
+            return response
+
+    monkeypatch.setattr(longcat_service, '_llm_bulkhead', bulkhead)
+    monkeypatch.setattr(longcat_service, '_get_session', lambda: Session())
+    stream = LongCatService(api_key="test-key").chat_completion_stream(
+        [{"role": "user", "content": "hi"}]
+    )
+
+    assert next(stream) == '{"a": 1}'
+    assert free_slots(bulkhead) == 1
+
+    stream.close()
+    assert response.closed
+    assert free_slots(bulkhead) == 2
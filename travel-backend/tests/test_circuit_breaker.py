@@ -0,0 +1,163 @@
+"""
+Tests for the LongCat circuit breaker state machine and probe handling
+"""
+
+import asyncio
+import os
+import sys
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from langgraph_agents.exceptions import ServiceUnavailableError
+from langgraph_agents.services import longcat_service
+from langgraph_agents.services.longcat_service import CircuitBreaker, LongCatService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(longcat_service.time, 'monotonic', fake)
+    return fake
+
+
+@pytest.fixture
+def breaker(clock, monkeypatch):
+    fresh = CircuitBreaker("Test API", fail_max=3, window=30.0, reset_timeout=10.0)
+    monkeypatch.setattr(longcat_service, '_breaker', fresh)
+    return fresh
+
+
+def trip(breaker):
+    for _ in range(breaker.fail_max):
+        breaker.record_failure()
+
+
+def test_opens_after_fail_max_failures(breaker):
+    assert breaker.before_call() is False
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(ServiceUnavailableError):
+        breaker.before_call()
+
+
+def test_failures_outside_window_do_not_count(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 31
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_a_single_probe(breaker, clock):
+    trip(breaker)
+    clock.now += 10
+    assert breaker.state == "half-open"
+
+    assert breaker.before_call() is True
+    with pytest.raises(ServiceUnavailableError):
+        breaker.before_call()
+
+
+def test_probe_success_closes(breaker, clock):
+    trip(breaker)
+    clock.now += 10
+    breaker.before_call()
+    breaker.record_success()
+
+    assert breaker.state == "closed"
+    assert breaker.before_call() is False
+
+
+def test_probe_failure_reopens(breaker, clock):
+    trip(breaker)
+    clock.now += 10
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    with pytest.raises(ServiceUnavailableError):
+        breaker.before_call()
+    clock.now += 10
+    assert breaker.before_call() is True
+
+
+def test_released_probe_lets_next_call_probe(breaker, clock):
+    trip(breaker)
+    clock.now += 10
+    breaker.before_call()
+    breaker.release_probe()
+
+    assert breaker.before_call() is True
+
+
+class FailingClient:
+    def __init__(self, error):
+        self.error = error
+
+    async def make_request(self, **kwargs):
+        raise self.error
+
+
+@pytest.mark.parametrize("error", [
+    ValueError("bad payload"),
+    ServiceUnavailableError("LongCat API", status_code=400),
+    asyncio.CancelledError(),
+])
+def test_async_probe_without_verdict_is_released(breaker, clock, monkeypatch, error):
+    monkeypatch.setattr(longcat_service, '_get_async_client', lambda: FailingClient(error))
+    service = LongCatService(api_key="test-key")
+    trip(breaker)
+    clock.now += 10
+
+    with pytest.raises(type(error)):
+        asyncio.run(service.achat_completion([{"role": "user", "content": "hi"}], cache=False))
+
+    assert breaker.before_call() is True
+
+
+@pytest.mark.parametrize("error", [
+    ServiceUnavailableError("LongCat API"),
+    asyncio.TimeoutError(),
+])
+def test_async_probe_outage_reopens(breaker, clock, monkeypatch, error):
+    monkeypatch.setattr(longcat_service, '_get_async_client', lambda: FailingClient(error))
+    service = LongCatService(api_key="test-key")
+    trip(breaker)
+    clock.now += 10
+
+    with pytest.raises(type(error)):
+        asyncio.run(service.achat_completion([{"role": "user", "content": "hi"}], cache=False))
+
+    assert breaker.state == "open"
+
+
+def test_sync_probe_with_unexpected_error_is_released(breaker, clock, monkeypatch):
+    class BrokenSession:
+        def post(self, url, **kwargs):
+            raise ValueError("unexpected")
+
+    monkeypatch.setattr(longcat_service, '_get_session', lambda: BrokenSession())
+    trip(breaker)
+    clock.now += 10
+
+    with pytest.raises(ValueError):
+        longcat_service._post_with_retry("https://example.invalid", max_retries=0)
+
+    assert breaker.before_call() is True
@@ -0,0 +1,28 @@
+"""
+Tests for the hotel and flight response formatters
+"""
+
+import os
+import sys
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from langgraph_agents.utils.formatters import _get_price_range_text
+
+
+@pytest.mark.parametrize("price_level, expected", [
+    (2, "Mid-range (₱2,500-5,000)"),
+    (2.0, "Mid-range (₱2,500-5,000)"),
+    (4.0, "Luxury (₱10,000+)"),
+    (2.5, "Price not available"),
+    (5.0, "Price not available"),
+    ("2", "Price not available"),
+    (None, "Price not available"),
+])
+def test_price_range_text(price_level, expected):
+    assert _get_price_range_text(price_level) == expected
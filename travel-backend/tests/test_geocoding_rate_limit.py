@@ -0,0 +1,50 @@
+"""
+Tests for the Geocoding API request rate limit
+"""
+
+import os
+import sys
+import time
+
+import django
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from langgraph_agents.services.api_client_service import TokenBucket
+from langgraph_agents.utils import geocoding_service
+
+
+class RecordingSession:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params, timeout):
+        self.calls.append(time.monotonic())
+        return self
+
+    def json(self):
+        return {'status': 'OK', 'results': [{'geometry': {'location': {'lat': 10.0, 'lng': 123.0}}}]}
+
+
+def test_bulk_lookups_respect_the_rate_limit(monkeypatch):
+    session = RecordingSession()
+    monkeypatch.setattr(geocoding_service, '_get_session', lambda: session)
+    monkeypatch.setattr(geocoding_service, '_geocode_rate_limiter', TokenBucket(rate=20, capacity=1))
+    cities = [f"Rate Test Town {n}" for n in range(6)]
+    cache.delete_many([
+        geocoding_service._geocode_cache_key(geocoding_service._normalize_city_name(city))
+        for city in cities
+    ])
+
+    with override_settings(GOOGLE_MAPS_API_KEY='test-key'):
+        results = geocoding_service.get_city_coordinates_bulk(cities)
+
+    assert all(results.values())
+    assert len(session.calls) == 6
+    # One token up front, then one every 50ms, despite 10 pool workers
+    assert max(session.calls) - min(session.calls) >= 0.2
@@ -0,0 +1,90 @@
+"""
+Tests for the LongCat response cache
+"""
+
+import asyncio
+import os
+import sys
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from langgraph_agents.services import longcat_service
+from langgraph_agents.services.longcat_service import LongCatService
+
+MESSAGES = [{"role": "user", "content": "Plan a day in Cebu"}]
+
+
+class CountingClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def make_request(self, **kwargs):
+        self.calls += 1
+        return {"choices": [{"message": {"content": f"reply {self.calls}"}}], "usage": {}}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = CountingClient()
+    monkeypatch.setattr(longcat_service, '_get_async_client', lambda: fake)
+    longcat_service._response_cache.clear()
+    yield fake
+    longcat_service._response_cache.clear()
+
+
+def complete(service, **kwargs):
+    return asyncio.run(service.achat_completion(MESSAGES, **kwargs))
+
+
+def test_sampled_completions_are_not_cached_by_default(client):
+    service = LongCatService(api_key="key-a")
+
+    complete(service)
+    complete(service)
+
+    assert client.calls == 2
+
+
+def test_deterministic_completions_are_cached(client):
+    service = LongCatService(api_key="key-a")
+
+    first = complete(service, temperature=0)
+    second = complete(service, temperature=0)
+
+    assert client.calls == 1
+    assert second == first
+
+
+def test_cache_can_be_forced_either_way(client):
+    service = LongCatService(api_key="key-a")
+
+    complete(service, cache=True)
+    complete(service, cache=True)
+    assert client.calls == 1
+
+    complete(service, temperature=0, cache=False)
+    assert client.calls == 2
+
+
+def test_cache_is_per_api_key(client):
+    complete(LongCatService(api_key="key-a"), temperature=0)
+    complete(LongCatService(api_key="key-b"), temperature=0)
+
+    assert client.calls == 2
+
+
+def test_cached_responses_are_copies(client):
+    service = LongCatService(api_key="key-a")
+
+    first = complete(service, temperature=0)
+    first["choices"].clear()
+    second = complete(service, temperature=0)
+    second["usage"]["tampered"] = True
+
+    assert second["choices"]
+    assert "tampered" not in complete(service, temperature=0)["usage"]
@@ -0,0 +1,79 @@
+"""
+Tests for parsing LongCat server-sent event streams
+"""
+
+import asyncio
+import os
+import sys
+
+import django
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from langgraph_agents.services import longcat_service
+from langgraph_agents.services.longcat_service import LongCatService, _SSEParser
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+# Last event split across chunks and never newline-terminated
+CHUNKS = [b'data: {"a": 1}\n\nda', b'ta: {"b": ', b'2}']
+
+
+def test_parser_handles_fragmented_lines():
+    parser = _SSEParser()
+    events = []
+    for chunk in [b'data: {"a"', b': 1}\n: ping\n\ndata: [DONE]\n']:
+        events += parser.feed(chunk)
+    assert events == ['{"a": 1}']
+    assert parser.close() == []
+
+
+def test_parser_flushes_unterminated_last_line():
+    parser = _SSEParser()
+    events = []
+    for chunk in CHUNKS:
+        events += parser.feed(chunk)
+    assert events == ['{"a": 1}']
+    assert parser.close() == ['{"b": 2}']
+    assert parser.close() == []
+
+
+class StreamingResponse:
+    status_code = 200
+    headers = {}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        yield from CHUNKS
+
+    def close(self):
+        pass
+
+
+def test_sync_stream_yields_unterminated_last_event(monkeypatch):
+    class Session:
+        def post(self, url, **kwargs):
+            return StreamingResponse()
+
+    monkeypatch.setattr(longcat_service, '_get_session', lambda: Session())
+    stream = LongCatService(api_key="test-key").chat_completion_stream(MESSAGES)
+
+    assert list(stream) == ['{"a": 1}', '{"b": 2}']
+
+
+def test_async_stream_yields_unterminated_last_event(monkeypatch):
+    class AsyncClient:
+        async def stream_request(self, **kwargs):
+            for chunk in CHUNKS:
+                yield chunk
+
+    monkeypatch.setattr(longcat_service, '_get_async_client', lambda: AsyncClient())
+
+    async def collect():
+        stream = LongCatService(api_key="test-key").achat_completion_stream(MESSAGES)
+        return [data async for data in stream]
+
+    assert asyncio.run(collect()) == ['{"a": 1}', '{"b": 2}']
@@ -0,0 +1,59 @@
+"""
+Tests for the all-pairs city distance matrix
+"""
+
+import os
+import sys
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from django.core.cache import cache
+
+from langgraph_agents.utils import geocoding_service
+from langgraph_agents.utils.geocoding_service import (
+    calculate_haversine_distance,
+    get_city_coordinates,
+    pairwise_distances_km,
+)
+
+CITIES = ['Manila', 'Cebu City', 'Davao', 'Baguio']
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_matrix_matches_scalar_distances():
+    matrix = pairwise_distances_km(CITIES, use_api=False)
+
+    assert len(matrix) == len(CITIES)
+    for i, city1 in enumerate(CITIES):
+        assert matrix[i][i] == 0.0
+        for j, city2 in enumerate(CITIES):
+            assert matrix[i][j] == matrix[j][i]
+            expected = calculate_haversine_distance(*get_city_coordinates(city1), *get_city_coordinates(city2))
+            assert round(matrix[i][j], 1) == pytest.approx(expected, abs=0.1)
+
+
+def test_unknown_city_returns_none():
+    assert pairwise_distances_km(['Manila', 'Atlantis'], use_api=False) is None
+
+
+def test_matrix_is_cached_per_city_order(monkeypatch):
+    first = pairwise_distances_km(CITIES, use_api=False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("coordinates resolved again")
+
+    monkeypatch.setattr(geocoding_service, 'get_city_coordinates_bulk', fail)
+    assert pairwise_distances_km(CITIES, use_api=False) == first
+    with pytest.raises(AssertionError):
+        pairwise_distances_km(list(reversed(CITIES)), use_api=False)
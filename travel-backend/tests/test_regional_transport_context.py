@@ -0,0 +1,57 @@
+"""
+Tests for the regional transport context lookups
+"""
+
+import json
+import os
+import sys
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from langgraph_agents.data.regional_transport_context import (
+    REGIONAL_TRANSPORT_CONTEXT,
+    check_geographic_boundaries,
+    find_regional_context,
+    is_regional_transport_practical,
+    plain_copy,
+)
+
+
+def test_lookups_return_shared_read_only_views():
+    context = find_regional_context("Makati")
+    assert context is find_regional_context("Makati")
+    assert context["region_key"] == "METRO_MANILA"
+
+    with pytest.raises(TypeError):
+        context["hub"] = "Atlantis"
+    with pytest.raises(TypeError):
+        is_regional_transport_practical("Manila", "Makati")["characteristics"]["primary_mode"] = "teleport"
+    with pytest.raises(TypeError):
+        check_geographic_boundaries("Manila", "Cebu City")["crosses_boundary"] = False
+
+
+def test_copies_are_json_serializable():
+    json.dumps(REGIONAL_TRANSPORT_CONTEXT)
+    json.dumps(find_regional_context("Cebu City", copy=True))
+    json.dumps(is_regional_transport_practical("Manila", "Makati", copy=True))
+    json.dumps(check_geographic_boundaries("Manila", "Cebu City", copy=True))
+    json.dumps(plain_copy(find_regional_context("Cebu City")))
+
+
+def test_copies_are_independent():
+    context = find_regional_context("Makati", copy=True)
+    context["cities"].append("Atlantis")
+    context["characteristics"]["primary_mode"] = "teleport"
+
+    practical = is_regional_transport_practical("Manila", "Makati", copy=True)
+    practical["characteristics"]["primary_mode"] = "teleport"
+
+    fresh = find_regional_context("Makati")
+    assert "Atlantis" not in fresh["cities"]
+    assert fresh["characteristics"]["primary_mode"] != "teleport"
+    assert is_regional_transport_practical("Manila", "Makati")["characteristics"]["primary_mode"] != "teleport"
@@ -0,0 +1,86 @@
+"""
+Tests for flushing and evicting buffered agent execution logs
+"""
+
+import asyncio
+import os
+import sys
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from langgraph_agents.services import session_service
+from langgraph_agents.services.session_service import AgentLogBuffer, SessionService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(session_service.time, 'monotonic', fake)
+    return fake
+
+
+@pytest.fixture
+def written(monkeypatch):
+    flushed = []
+
+    def write(buffer):
+        flushed.append((buffer.session_id, len(buffer)))
+        return len(buffer)
+
+    monkeypatch.setattr(session_service, '_write_logs', write)
+    return flushed
+
+
+def log(service, session_id):
+    asyncio.run(service.log_agent_execution(session_id, 'FlightAgent', 'success'))
+
+
+def test_full_buffer_is_flushed(clock, written, monkeypatch):
+    monkeypatch.setattr(AgentLogBuffer, 'BATCH_SIZE', 3)
+    service = SessionService()
+
+    for _ in range(4):
+        log(service, 'busy')
+    session_service._log_writer.submit(lambda: None).result()
+
+    assert written == [('busy', 3)]
+    assert len(service._log_buffers['busy']) == 1
+
+
+def test_idle_buffers_are_flushed_and_evicted(clock, written):
+    service = SessionService()
+    log(service, 'abandoned')
+
+    clock.now += SessionService.LOG_BUFFER_IDLE_SECONDS
+    log(service, 'active')
+    session_service._log_writer.submit(lambda: None).result()
+
+    assert written == [('abandoned', 1)]
+    assert list(service._log_buffers) == ['active']
+
+
+def test_sweeps_are_rate_limited(clock, written):
+    service = SessionService()
+    log(service, 'abandoned')
+    clock.now += SessionService.LOG_BUFFER_IDLE_SECONDS
+    service._last_log_sweep = clock.now
+
+    log(service, 'active')
+    assert 'abandoned' in service._log_buffers
+
+    futures = asyncio.run(service.flush_idle_agent_logs(force=True))
+    assert futures and futures[0].result() == 1
+    assert 'abandoned' not in service._log_buffers
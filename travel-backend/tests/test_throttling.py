@@ -0,0 +1,127 @@
+"""
+Tests for the sliding-window trip throttles, on the Django cache and on Redis
+"""
+
+import os
+import sys
+
+import django
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'travelapi.settings')
+django.setup()
+
+from django.core.cache import cache
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from langgraph_agents import throttling
+from langgraph_agents.throttling import AnonTripThrottle, AuthenticatedTripThrottle
+
+HOUR = 3600
+# Start of an hour window, so elapsed fractions are easy to reason about
+START = 1_000 * HOUR
+
+
+class FakeRedis:
+    """Runs the sliding-window script against a dict, like EVALSHA would"""
+
+    def __init__(self):
+        self.store = {}
+
+    def register_script(self, source):
+        assert source == throttling.SLIDING_WINDOW_LUA
+        fake = self
+
+        class Script:
+            registered_client = fake
+
+            def __call__(self, keys, args):
+                limit, _, elapsed = args
+                curr = fake.store.get(keys[0], 0)
+                prev = fake.store.get(keys[1], 0)
+                weighted = prev * (1 - elapsed) + curr
+                if weighted + 1 > limit:
+                    return [0, weighted]
+                fake.store[keys[0]] = curr + 1
+                return [1, weighted + 1]
+
+        return Script()
+
+
+def use_backend(monkeypatch, redis):
+    cache.clear()
+    monkeypatch.setattr(throttling, '_redis_connection', lambda: redis)
+    monkeypatch.setattr(throttling, '_sliding_window_script', None)
+    return redis
+
+
+@pytest.fixture(params=['cache', 'redis'])
+def backend(request, monkeypatch):
+    yield use_backend(monkeypatch, FakeRedis() if request.param == 'redis' else None)
+    cache.clear()
+
+
+def trip_request(email=None):
+    body = {'userEmail': email} if email else {}
+    django_request = APIRequestFactory().post('/api/trips/', body, format='json')
+    return Request(django_request, parsers=[JSONParser()])
+
+
+def check(throttle_class, now, email=None):
+    throttle = throttle_class()
+    throttle.timer = lambda: now
+    allowed = throttle.allow_request(trip_request(email), None)
+    return allowed, throttle
+
+
+@pytest.mark.parametrize("throttle_class, email, limit", [
+    (AnonTripThrottle, None, 10),
+    (AuthenticatedTripThrottle, 'traveler@example.com', 20),
+])
+def test_allows_up_to_the_limit(backend, throttle_class, email, limit):
+    now = START + 60
+    for _ in range(limit):
+        assert check(throttle_class, now, email)[0]
+
+    allowed, throttle = check(throttle_class, now, email)
+    assert not allowed
+    assert throttle.wait() == HOUR - 60
+
+
+def test_previous_window_is_weighted_by_overlap(backend):
+    for _ in range(10):
+        assert check(AnonTripThrottle, START)[0]
+
+    # Just after rollover the previous window still counts in full
+    assert not check(AnonTripThrottle, START + HOUR + 1)[0]
+
+    # Halfway through, half of it has slid out
+    halfway = START + HOUR + HOUR // 2
+    for _ in range(5):
+        assert check(AnonTripThrottle, halfway)[0]
+    assert not check(AnonTripThrottle, halfway)[0]
+
+    # Two windows on, nothing carries over
+    later = START + 3 * HOUR
+    for _ in range(10):
+        assert check(AnonTripThrottle, later)[0]
+
+
+def test_anon_and_user_limits_are_separate(backend):
+    for _ in range(10):
+        assert check(AnonTripThrottle, START)[0]
+    assert not check(AnonTripThrottle, START)[0]
+
+    assert check(AuthenticatedTripThrottle, START, 'traveler@example.com')[0]
+
+
+def test_redis_keys_use_cache_prefix_and_version(monkeypatch):
+    redis = use_backend(monkeypatch, FakeRedis())
+
+    _, throttle = check(AnonTripThrottle, START)
+    bucket_key = f"{throttle.key}:{START // HOUR}"
+
+    assert list(redis.store) == [cache.make_key(bucket_key)]
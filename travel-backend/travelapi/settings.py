@@ -192,7 +192,9 @@ if not DEBUG:
 # API Keys from environment variables
 SERPAPI_KEY = config('SERPAPI_KEY', default='')
 GOOGLE_PLACES_API_KEY = config('GOOGLE_PLACES_API_KEY', default='')
+GOOGLE_PLACES_QPS = config('GOOGLE_PLACES_QPS', default=10, cast=int)  # Client-side request rate cap
 GOOGLE_MAPS_API_KEY = config('GOOGLE_MAPS_API_KEY', default='')  # ✅ Added for geocoding
+GOOGLE_GEOCODING_QPS = config('GOOGLE_GEOCODING_QPS', default=25, cast=int)  # Client-side geocoding rate cap
 
 # Gemini AI API Key (used by proxy endpoint)
 GOOGLE_GEMINI_AI_API_KEY = config('GOOGLE_GEMINI_AI_API_KEY', default='')
@@ -211,6 +213,9 @@ FIREBASE_APP_ID = config('FIREBASE_APP_ID', default='')
 FIREBASE_MEASUREMENT_ID = config('FIREBASE_MEASUREMENT_ID', default='')
 
 # Logging Configuration
+# The log directory is gitignored, so create it on a fresh checkout
+os.makedirs(BASE_DIR / 'logs', exist_ok=True)
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,